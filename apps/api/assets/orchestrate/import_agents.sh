@@ -30,6 +30,8 @@ import_tool() {
 import_tool "$ORCH_DIR/tools/python/health.py"
 import_tool "$ORCH_DIR/tools/python/demo_scenarios.py"
 import_tool "$ORCH_DIR/tools/python/supplier_risk_checker.py"
+import_tool "$ORCH_DIR/tools/python/supplier_risk_batch.py"
+import_tool "$ORCH_DIR/tools/python/procurement_decision_batch.py"
 import_tool "$ORCH_DIR/tools/python/policy_check.py"
 import_tool "$ORCH_DIR/tools/python/procurement_decision.py"
 import_tool "$ORCH_DIR/tools/python/list_referrals.py"
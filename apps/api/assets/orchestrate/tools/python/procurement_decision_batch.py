@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any
+
+import requests
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+
+def parse_money(value: Any) -> float:
+    """Parse a money-like value into a float.
+
+    Accepts inputs like:
+    - 15000
+    - 15000.50
+    - "15000"
+    - "$15,000"
+    - "USD 15,000.00"
+    - "15k" / "15K"
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+
+    if value is None:
+        raise ValueError("money value is required")
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value).strip()
+    if not text:
+        raise ValueError("money value is empty")
+
+    text = text.upper()
+    for code in ("USD", "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "CNY", "INR"):
+        text = text.replace(code, " ")
+    for sym in ("$", "€", "£", "¥"):
+        text = text.replace(sym, " ")
+
+    text = re.sub(r"\s+", "", text)
+
+    magnitude = 1.0
+    if text.endswith("K"):
+        magnitude = 1_000.0
+        text = text[:-1]
+    elif text.endswith("M"):
+        magnitude = 1_000_000.0
+        text = text[:-1]
+
+    text = text.replace(",", "")
+    if not re.fullmatch(r"-?\d+(\.\d+)?", text):
+        raise ValueError(f"unable to parse money value: {value!r}")
+
+    return float(text) * magnitude
+
+
+_MONEY_FIELDS = ("amount", "budget_remaining", "requester_approval_limit")
+_REQUIRED_FIELDS = ("supplier_id", "amount")
+
+
+def _base_url() -> str:
+    return os.environ.get("PROCUATOR_API_BASE_URL", "https://alease-overcapable-teachably.ngrok-free.dev").rstrip("/")
+
+
+@tool()
+def procurement_decision_batch(items: list[dict[str, Any]], concurrency: int | None = None) -> dict[str, Any]:
+    """Compute procurement decisions for many requests in one Procuator API call.
+
+    Args:
+        items (list[dict[str, Any]]): Decision requests with the same fields as procurement_decision.
+            Money fields accept values like 15000 or "$15,000".
+        concurrency (int | None): Optional cap on decisions evaluated at once.
+
+    Returns:
+        dict[str, Any]: Decision payloads in input order plus total and error counts. Items missing
+            supplier_id or amount, whose amounts can't be parsed, or whose result line can't be read,
+            carry an "error" instead.
+    """
+
+    results: dict[int, dict[str, Any]] = {}
+    payload_items: list[dict[str, Any]] = []
+    positions: list[int] = []  # input index of each item sent to the API
+    for index, item in enumerate(items):
+        # One bad item would otherwise make the API reject the whole batch with a 422.
+        if not isinstance(item, dict):
+            results[index] = {"index": index, "request_id": None, "error": "item must be an object"}
+            continue
+        try:
+            missing = [name for name in _REQUIRED_FIELDS if item.get(name) in (None, "")]
+            if missing:
+                raise ValueError(f"missing required field(s): {', '.join(missing)}")
+            money = {name: parse_money(item[name]) for name in _MONEY_FIELDS if name in item}
+        except ValueError as exc:
+            results[index] = {"index": index, "request_id": item.get("request_id"), "error": str(exc)}
+            continue
+        payload_items.append({**item, **money})
+        positions.append(index)
+
+    if payload_items:
+        resp = requests.post(
+            f"{_base_url()}/decision/batch",
+            json={"items": payload_items, "concurrency": concurrency},
+            timeout=600,
+        )
+        resp.raise_for_status()
+        # The API streams NDJSON in completion order, indexed by position in the request.
+        for line in resp.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                result = json.loads(line)
+                index = positions[result["index"]]
+            except (ValueError, KeyError, IndexError, TypeError):
+                continue  # reported below as a missing result
+            results[index] = {**result, "index": index}
+
+    for index in positions:
+        if index not in results:
+            item = items[index]
+            results[index] = {
+                "index": index,
+                "request_id": item.get("request_id"),
+                "error": "no readable result in the API response",
+            }
+
+    ordered = [results[index] for index in sorted(results)]
+    return {"results": ordered, "total": len(ordered), "errors": sum(1 for r in ordered if "error" in r)}
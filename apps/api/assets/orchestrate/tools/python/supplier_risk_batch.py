@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import requests
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+
+def _base_url() -> str:
+    return os.environ.get("PROCUATOR_API_BASE_URL", "https://alease-overcapable-teachably.ngrok-free.dev").rstrip("/")
+
+
+@tool()
+def supplier_risk_batch(items: list[dict[str, Any]], concurrency: int | None = None) -> dict[str, Any]:
+    """Compute supplier risk for many suppliers in one Procuator API call.
+
+    Args:
+        items (list[dict[str, Any]]): Items with supplier_id, optional industry and refresh_cache.
+        concurrency (int | None): Optional cap on concurrent risk lookups for cache misses.
+
+    Returns:
+        dict[str, Any]: Risk results in input order plus total and unique counts.
+    """
+
+    resp = requests.post(
+        f"{_base_url()}/risk-check/batch",
+        json={"items": items, "concurrency": concurrency},
+        timeout=120,
+    )
+    resp.raise_for_status()
+    return resp.json()
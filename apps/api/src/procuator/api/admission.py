@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from procuator.skills.concurrency_limiter import wait_for_slot
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a request can't start within its route class's wait limit."""
+
+    def __init__(self, route_class: str, retry_after: int) -> None:
+        super().__init__(f"server is at capacity for {route_class} requests")
+        self.route_class = route_class
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class RouteClass:
+    limit: int
+    max_wait: timedelta
+    priority: int  # lower is served first when slots free up
+
+
+@dataclass
+class _ClassState:
+    config: RouteClass
+    in_flight: int = 0
+    admitted: int = 0
+    shed: int = 0
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+
+class AdmissionController:
+    """Per-route-class concurrency and queue-time limits under one shared capacity.
+
+    A request runs when both its class (``limit``) and the server as a whole
+    (``total_limit``) have a free slot. Otherwise it waits up to the class's
+    ``max_wait`` and is rejected with ``AdmissionRejected`` after that, so
+    overload turns into fast 503s instead of ever-growing latency. Freed slots
+    go to waiting classes in ``priority`` order, FIFO within a class.
+
+    ``routes`` maps path prefixes to class names (first match wins); other paths
+    use ``default_class`` and ``exempt`` paths bypass admission entirely.
+    """
+
+    def __init__(
+        self,
+        classes: Mapping[str, RouteClass],
+        *,
+        total_limit: int,
+        routes: Sequence[tuple[str, str]] = (),
+        default_class: str = "default",
+        exempt: Iterable[str] = ("/health", "/ready"),
+    ) -> None:
+        if total_limit <= 0 or any(c.limit <= 0 for c in classes.values()):
+            raise ValueError("limits must be positive")
+        if default_class not in classes or any(name not in classes for _, name in routes):
+            raise ValueError("routes must refer to configured classes")
+
+        self.total_limit = total_limit
+        self.routes = tuple(routes)
+        self.default_class = default_class
+        self.exempt = frozenset(exempt)
+        self._classes = {name: _ClassState(config) for name, config in classes.items()}
+        self._by_priority = sorted(self._classes.values(), key=lambda state: state.config.priority)
+        self._in_flight = 0
+
+    def classify(self, path: str) -> str | None:
+        if path in self.exempt:
+            return None
+        for prefix, name in self.routes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return name
+        return self.default_class
+
+    async def acquire(self, route_class: str) -> None:
+        state = self._classes[route_class]
+        waiters = state.waiters
+        if not waiters and self._has_room(state) and not self._higher_priority_waiting(state):
+            self._grant(state)
+            return
+
+        if not await wait_for_slot(waiters, state.config.max_wait, lambda: self.release(route_class)):
+            state.shed += 1
+            raise AdmissionRejected(route_class, self._retry_after(state))
+
+    def release(self, route_class: str) -> None:
+        self._classes[route_class].in_flight -= 1
+        self._in_flight -= 1
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "total_limit": self.total_limit,
+            "in_flight": self._in_flight,
+            "shed": sum(state.shed for state in self._classes.values()),
+            "classes": {
+                name: {
+                    "limit": state.config.limit,
+                    "max_wait_ms": round(state.config.max_wait.total_seconds() * 1000),
+                    "priority": state.config.priority,
+                    "in_flight": state.in_flight,
+                    "queued": len(state.waiters),
+                    "admitted": state.admitted,
+                    "shed": state.shed,
+                }
+                for name, state in self._classes.items()
+            },
+        }
+
+    def _has_room(self, state: _ClassState) -> bool:
+        return state.in_flight < state.config.limit and self._in_flight < self.total_limit
+
+    def _higher_priority_waiting(self, state: _ClassState) -> bool:
+        # Don't let new low-priority arrivals take a shared slot ahead of queued high-priority work.
+        return any(
+            other.waiters and other.config.priority < state.config.priority and other.in_flight < other.config.limit
+            for other in self._by_priority
+        )
+
+    def _grant(self, state: _ClassState) -> None:
+        state.in_flight += 1
+        state.admitted += 1
+        self._in_flight += 1
+
+    def _wake(self) -> None:
+        for state in self._by_priority:
+            waiters = state.waiters
+            while waiters and self._has_room(state):
+                fut = waiters.popleft()
+                if not fut.done():
+                    self._grant(state)
+                    fut.set_result(None)
+            if self._in_flight >= self.total_limit:
+                return
+
+    def _retry_after(self, state: _ClassState) -> int:
+        return max(1, math.ceil(state.config.max_wait.total_seconds()))
+
+
+class AdmissionMiddleware:
+    """ASGI middleware that runs each HTTP request under an ``AdmissionController`` slot.
+
+    The slot is held until the response has been sent, so streaming responses
+    count against their class for as long as they stream.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController) -> None:
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route_class = self.controller.classify(scope["path"]) if scope["type"] == "http" else None
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(route_class)
+        except AdmissionRejected as exc:
+            response = JSONResponse(
+                {"detail": str(exc), "route_class": exc.route_class},
+                status_code=503,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(route_class)
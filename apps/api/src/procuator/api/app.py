@@ -1,58 +1,224 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from datetime import UTC, datetime
-from typing import Any
-from uuid import uuid4
+from datetime import timedelta
+from typing import Any, Literal
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
 from procuator import __version__
+from procuator.api.admission import AdmissionController, AdmissionMiddleware, RouteClass
+from procuator.config import HttpPoolSettings
 from procuator.data.demo_scenarios import demo_scenarios
+from procuator.data.generator import ProcurementTestDataGenerator
+from procuator.data.supplier_store import InMemorySupplierDataStore, SQLiteSupplierDataStore, SupplierDataStore
+from procuator.decision_jobs import DecisionJobQueue, JobQueueFull
+from procuator.idempotency import IdempotencyConflict, IdempotencyStore
+from procuator.pipeline import DecisionPipeline
+from procuator.skills.audit_writer import AuditLogWriter
+from procuator.skills.cache_warmer import CacheWarmer, read_recent_audit_lines, warmup_targets
+from procuator.skills.circuit_breaker import CircuitBreaker
+from procuator.skills.concurrency_limiter import AdaptiveConcurrencyLimiter
 from procuator.skills.decision_auditor import DecisionAuditor
 from procuator.skills.policy_engine import PolicyEngine
-from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+from procuator.skills.risk_cache import encode_json
+from procuator.skills.risk_snapshot import RiskSnapshot
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker, is_upstream_overload
 
 logger = logging.getLogger(__name__)
 
-_skill = SupplierRiskChecker()
+_supplier_store: SupplierDataStore = (
+    SQLiteSupplierDataStore(os.environ["SUPPLIER_DATA_PATH"])
+    if os.getenv("SUPPLIER_DATA_PATH")
+    else InMemorySupplierDataStore()
+)
+_risk_snapshot: RiskSnapshot | None = (
+    RiskSnapshot(
+        os.environ["RISK_SNAPSHOT_PATH"],
+        max_age=timedelta(hours=float(os.getenv("RISK_SNAPSHOT_MAX_AGE_HOURS", "36"))),
+    )
+    if os.getenv("RISK_SNAPSHOT_PATH")
+    else None
+)
+_risk_budget_ms = float(os.getenv("RISK_BUDGET_MS", "5000"))
+_skill = SupplierRiskChecker(
+    cache_ttl=timedelta(seconds=float(os.getenv("RISK_CACHE_TTL_SECONDS", "3600"))),
+    cache_hard_ttl=timedelta(seconds=float(os.getenv("RISK_CACHE_HARD_TTL_SECONDS", "7200"))),
+    cache_max_entries=int(os.getenv("RISK_CACHE_MAX_ENTRIES", "10000")),
+    cache_max_bytes=int(os.getenv("RISK_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    cache_path=os.getenv("RISK_CACHE_PATH") or None,
+    financial_breaker=CircuitBreaker(
+        failure_threshold=int(os.getenv("FINANCIAL_BREAKER_FAILURES", "5")),
+        reset_timeout=timedelta(seconds=float(os.getenv("FINANCIAL_BREAKER_RESET_SECONDS", "30"))),
+    ),
+    financial_limiter=AdaptiveConcurrencyLimiter(
+        initial_limit=int(os.getenv("FINANCIAL_LIMIT_INITIAL", "16")),
+        max_limit=int(os.getenv("FINANCIAL_LIMIT_MAX", "100")),
+        latency_target=timedelta(milliseconds=float(os.getenv("FINANCIAL_LIMIT_LATENCY_MS", "1000"))),
+        max_queue=int(os.getenv("FINANCIAL_LIMIT_QUEUE", "200")),
+        queue_timeout=timedelta(milliseconds=float(os.getenv("FINANCIAL_LIMIT_QUEUE_TIMEOUT_MS", "2000"))),
+        is_overload=is_upstream_overload,
+    ),
+    negative_cache_ttl=timedelta(seconds=float(os.getenv("FINANCIAL_NEGATIVE_CACHE_SECONDS", "60"))),
+    data_store=_supplier_store,
+    http_pool=HttpPoolSettings.from_env(),
+    financial_bulk_window=(
+        timedelta(milliseconds=float(os.environ["FINANCIAL_BULK_WINDOW_MS"]))
+        if os.getenv("FINANCIAL_BULK_WINDOW_MS")
+        else None
+    ),
+    financial_bulk_max=int(os.getenv("FINANCIAL_BULK_MAX", "50")),
+    # Server-side latency budget for callers that don't pass budget_ms; 0 disables it.
+    default_budget=timedelta(milliseconds=_risk_budget_ms) if _risk_budget_ms > 0 else None,
+    snapshot=_risk_snapshot,
+)
+_risk_batch_concurrency = int(os.getenv("RISK_BATCH_CONCURRENCY", "16"))
+_decision_batch_concurrency = int(os.getenv("DECISION_BATCH_CONCURRENCY", "16"))
+MAX_DECISION_BATCH = int(os.getenv("DECISION_BATCH_MAX_ITEMS", "10000"))
 _policy = PolicyEngine()
-_auditor = DecisionAuditor()
-
-
-@dataclass
-class Referral:
-    referral_id: str
-    created_at: str
-    status: str  # PENDING | APPROVED | DENIED
-    request: dict[str, Any]
-    proposed_decision: str
-    explanation: list[str]
+_audit_writer = AuditLogWriter(
+    os.getenv("AUDIT_LOG_PATH", "audit.jsonl"),
+    max_queue=int(os.getenv("AUDIT_QUEUE_MAX", "10000")),
+    batch_size=int(os.getenv("AUDIT_BATCH_SIZE", "256")),
+    flush_interval=timedelta(milliseconds=float(os.getenv("AUDIT_FLUSH_MS", "200"))),
+    fsync=os.getenv("AUDIT_FSYNC", "interval"),  # type: ignore[arg-type]
+    fsync_interval=timedelta(milliseconds=float(os.getenv("AUDIT_FSYNC_INTERVAL_MS", "1000"))),
+)
+_auditor = DecisionAuditor(
+    max_events=int(os.getenv("AUDIT_MAX_EVENTS", "1000")),
+    writer=_audit_writer,
+    columnar=os.getenv("AUDIT_COLUMNAR", "false").lower() in {"1", "true", "yes"},
+)
+_event_stream_buffer = int(os.getenv("EVENT_STREAM_BUFFER", "256"))
+_event_stream_max_subscribers = int(os.getenv("EVENT_STREAM_MAX_SUBSCRIBERS", "100"))
+
+
+_idempotency_retention = float(os.getenv("IDEMPOTENCY_RETENTION_SECONDS", "86400"))
+_pipeline = DecisionPipeline(
+    _skill,
+    _policy,
+    _auditor,
+    # Retried calls with the same request_id replay the first response; 0 disables this.
+    idempotency=(
+        IdempotencyStore(
+            max_entries=int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "10000")),
+            retention=timedelta(seconds=_idempotency_retention),
+        )
+        if _idempotency_retention > 0
+        else None
+    ),
+)
+_referrals = _pipeline.referrals
+_decision_jobs = DecisionJobQueue(
+    _pipeline,
+    workers=int(os.getenv("DECISION_WORKERS", "8")),
+    max_queue=int(os.getenv("DECISION_QUEUE_MAX", "1000")),
+    max_jobs=int(os.getenv("DECISION_JOBS_RETAINED", "10000")),
+    callback_hosts=[
+        h.strip() for h in os.getenv("DECISION_CALLBACK_HOSTS", "localhost,127.0.0.1").split(",") if h.strip()
+    ],
+)
+
+
+def _route_class(name: str, *, limit: int, max_wait_ms: int, priority: int) -> RouteClass:
+    prefix = f"ADMISSION_{name.upper()}"
+    return RouteClass(
+        limit=int(os.getenv(f"{prefix}_LIMIT", str(limit))),
+        max_wait=timedelta(milliseconds=float(os.getenv(f"{prefix}_MAX_WAIT_MS", str(max_wait_ms)))),
+        priority=priority,
+    )
 
 
-_referrals: dict[str, Referral] = {}
+# Human approvals outrank reads, which outrank decisions, which outrank batch work.
+_admission = AdmissionController(
+    {
+        "approvals": _route_class("approvals", limit=32, max_wait_ms=2000, priority=0),
+        "default": _route_class("default", limit=64, max_wait_ms=1000, priority=1),
+        "decisions": _route_class("decisions", limit=128, max_wait_ms=500, priority=2),
+        "batch": _route_class("batch", limit=8, max_wait_ms=250, priority=3),
+    },
+    total_limit=int(os.getenv("ADMISSION_TOTAL_LIMIT", "256")),
+    routes=[
+        ("/decision/batch", "batch"),
+        ("/risk-check/batch", "batch"),
+        ("/decision/jobs", "default"),
+        ("/decision", "decisions"),
+        ("/risk-check", "decisions"),
+        ("/policy-check", "decisions"),
+        ("/referrals", "approvals"),
+    ],
+    # The event stream is long-lived and cheap per event; it would otherwise pin a slot per open dashboard.
+    exempt=("/health", "/ready", "/admission/stats", "/events/stream"),
+)
+
+_warmer: CacheWarmer | None = None
+
+
+async def _warm_cache(warmer: CacheWarmer) -> None:
+    audit_lines = await asyncio.to_thread(read_recent_audit_lines, os.getenv("AUDIT_LOG_PATH", "audit.jsonl"))
+    catalog = ProcurementTestDataGenerator(seed=None).suppliers
+    targets = warmup_targets(audit_lines, catalog, limit=int(os.getenv("CACHE_WARMUP_LIMIT", "500")))
+    await warmer.run(targets)
 
 
 @asynccontextmanager
 async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    global _warmer
+
+    # The queue stays shut after a shutdown; open it for this run of the app.
+    _decision_jobs.reopen()
+    warmup_task: asyncio.Task[None] | None = None
+    if os.getenv("CACHE_WARMUP_ENABLED", "true").lower() in {"1", "true", "yes"}:
+        _warmer = CacheWarmer(
+            _skill,
+            concurrency=int(os.getenv("CACHE_WARMUP_CONCURRENCY", "8")),
+            ready_fraction=float(os.getenv("CACHE_WARMUP_READY_FRACTION", "0.9")),
+        )
+        warmup_task = asyncio.create_task(_warm_cache(_warmer))
+
     try:
         yield
     finally:
-        await _skill.aclose()
+        if warmup_task is not None:
+            warmup_task.cancel()
+            await asyncio.gather(warmup_task, return_exceptions=True)
+        # Drain queued async decisions before the risk skill they depend on is closed.
+        await _decision_jobs.aclose()
+        # Closes the risk skill's HTTP session and its cache (the shared SQLite connection, if any).
+        await _pipeline.aclose()
+        # Last, so audit records from drained jobs are on disk before the process exits.
+        await asyncio.to_thread(_audit_writer.close)
+        _supplier_store.close()
+        if _risk_snapshot is not None:
+            _risk_snapshot.close()
 
 
 app = FastAPI(title="Procuator", version=__version__, lifespan=_lifespan)
+if os.getenv("ADMISSION_ENABLED", "true").lower() in {"1", "true", "yes"}:
+    app.add_middleware(AdmissionMiddleware, controller=_admission)
+
+
+RiskComponent = Literal["financial", "compliance", "market"]
 
 
 class RiskCheckRequest(BaseModel):
     supplier_id: str = Field(..., examples=["SUP-001"])
     industry: str = Field(default="general", examples=["technology"])
-    refresh_cache: bool = False
+    # True refreshes every data source; a component name or list refreshes only those.
+    refresh_cache: bool | RiskComponent | list[RiskComponent] = False
+    # Latency budget; when it runs out the response is a PARTIAL result. Defaults to RISK_BUDGET_MS.
+    budget_ms: int | None = Field(default=None, ge=1, le=60_000)
+
+
+class RiskCheckBatchRequest(BaseModel):
+    items: list[RiskCheckRequest] = Field(..., min_length=1, max_length=1000)
+    concurrency: int | None = Field(default=None, ge=1, le=128)
 
 
 class ProcurementDecisionRequest(BaseModel):
@@ -65,7 +231,15 @@ class ProcurementDecisionRequest(BaseModel):
     requester_approval_limit: float = Field(default=0.0)
     urgency: str = Field(default="standard", examples=["standard", "critical"])
     supplier_history: dict[str, Any] | None = None
-    refresh_cache: bool = False
+    refresh_cache: bool | RiskComponent | list[RiskComponent] = False
+    budget_ms: int | None = Field(default=None, ge=1, le=60_000)
+    # Still run the risk check on a policy hard deny (it cannot change the decision).
+    include_risk: bool = False
+
+
+class DecisionBatchRequest(BaseModel):
+    items: list[ProcurementDecisionRequest] = Field(..., min_length=1)
+    concurrency: int | None = Field(default=None, ge=1, le=128)
 
 
 class PolicyCheckRequest(BaseModel):
@@ -81,9 +255,65 @@ async def health() -> dict[str, str]:
     return {"status": "ok", "version": __version__}
 
 
+@app.get("/ready")
+async def ready() -> JSONResponse:
+    """Readiness probe: 503 until the startup cache warm-up reaches its warm fraction."""
+
+    if _warmer is None:
+        return JSONResponse({"status": "ready", "warmup": None})
+    status = _warmer.status()
+    return JSONResponse(
+        {"status": "ready" if _warmer.ready else "warming", "warmup": status}, status_code=200 if _warmer.ready else 503
+    )
+
+
 @app.post("/risk-check")
-async def risk_check(payload: RiskCheckRequest) -> dict[str, Any]:
-    return await _skill.execute(payload.model_dump())
+async def risk_check(payload: RiskCheckRequest) -> Response:
+    # Cache hits carry pre-encoded JSON; send it as-is rather than re-validating and re-serializing.
+    return Response(content=await _skill.execute_json(payload.model_dump()), media_type="application/json")
+
+
+@app.post("/risk-check/batch")
+async def risk_check_batch(payload: RiskCheckBatchRequest) -> Response:
+    items = [item.model_dump() for item in payload.items]
+    results = await _skill.execute_batch_json(items, concurrency=payload.concurrency or _risk_batch_concurrency)
+    unique = {(item["supplier_id"], item["industry"]) for item in items}
+    body = b'{"results":' + results + f',"total":{len(items)},"unique":{len(unique)}}}'.encode()
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/cache/stats")
+async def cache_stats() -> dict[str, Any]:
+    idempotency = _pipeline.idempotency
+    return {**_skill.cache_stats(), "idempotency": idempotency.stats() if idempotency is not None else None}
+
+
+@app.get("/admission/stats")
+async def admission_stats() -> dict[str, Any]:
+    return _admission.stats()
+
+
+@app.get("/suppliers/{supplier_id}/risk-history")
+async def risk_history(
+    supplier_id: str, industry: str = "general", limit: int = Query(100, ge=1, le=1000)
+) -> dict[str, Any]:
+    """Risk score changes for one supplier; unchanged re-assessments only extend ``last_seen``."""
+
+    points = _skill.risk_history(supplier_id, industry, limit=limit)
+    return {"supplier_id": supplier_id, "industry": industry, "points": points, "count": len(points)}
+
+
+@app.post("/supplier-data/refresh")
+async def refresh_supplier_data() -> dict[str, Any]:
+    _supplier_store.refresh()
+    _skill.invalidate_reference_data()
+    if _risk_snapshot is not None:
+        _risk_snapshot.refresh()
+    return {
+        "refreshed": True,
+        "store": type(_supplier_store).__name__,
+        "snapshot": _risk_snapshot.stats() if _risk_snapshot is not None else None,
+    }
 
 
 @app.post("/policy-check")
@@ -96,96 +326,98 @@ async def demo() -> dict[str, Any]:
     return {"scenarios": demo_scenarios()}
 
 
-@app.post("/decision")
-async def decision(payload: ProcurementDecisionRequest) -> dict[str, Any]:
-    request_dict = payload.model_dump()
-    request_id = request_dict.get("request_id") or f"REQ-{datetime.now(tz=UTC).strftime('%Y%m%d')}-{uuid4().hex[:6]}"
-    request_dict["request_id"] = request_id
-
-    risk = await _skill.execute(
-        {
-            "supplier_id": request_dict["supplier_id"],
-            "industry": request_dict.get("industry", "general"),
-            "refresh_cache": request_dict.get("refresh_cache", False),
-        }
-    )
-    policy = await _policy.execute(request_dict)
-
-    explanation: list[str] = []
-
-    risk_level = str(risk.get("risk_level", "UNKNOWN"))
-    risk_score = float(risk.get("risk_score", 0.0))
-    policy_decision = str(policy.get("policy_decision", "REFER"))
-    policy_flags = list(policy.get("policy_flags") or [])
-    risk_flags_raw = list(risk.get("risk_flags") or [])
-    risk_flags = [
-        (str(f.get("code") or f.get("message") or f) if isinstance(f, dict) else str(f)) for f in risk_flags_raw
-    ]
-
-    if policy_decision == "DENY":
-        final_decision = "DENY"
-    elif policy_decision == "REFER":
-        final_decision = "REFER"
-    elif risk_level == "HIGH":
-        final_decision = "REFER"
-    elif risk_level == "MEDIUM" and risk_score >= 5.5:
-        final_decision = "REFER"
-    else:
-        final_decision = "APPROVE"
-
-    if policy_flags:
-        explanation.append(f"Policy flags: {', '.join(policy_flags)}")
-    if risk_flags:
-        explanation.append(f"Risk flags: {', '.join(risk_flags)}")
-    explanation.extend(list(policy.get("reasons") or []))
-    explanation.append(f"Composite decision derived from risk={risk_level} and policy={policy_decision}.")
-
-    hitl: dict[str, Any] | None = None
-    if final_decision == "REFER":
-        referral_id = uuid4().hex
-        referral = Referral(
-            referral_id=referral_id,
-            created_at=datetime.now(tz=UTC).isoformat(),
-            status="PENDING",
-            request=request_dict,
-            proposed_decision=final_decision,
-            explanation=explanation,
+@app.post("/decision", response_model=None)
+async def decision(
+    payload: ProcurementDecisionRequest,
+    mode: Literal["sync", "async"] = "sync",
+    callback_url: str | None = None,
+) -> dict[str, Any] | JSONResponse:
+    """Decide a request; with ``mode=async`` queue it and return 202 with a job to poll."""
+
+    if mode == "async":
+        try:
+            job = _decision_jobs.submit(payload.model_dump(), callback_url=callback_url)
+        except JobQueueFull as exc:
+            return JSONResponse({"detail": str(exc)}, status_code=429, headers={"Retry-After": str(exc.retry_after)})
+        except IdempotencyConflict as exc:
+            return JSONResponse({"detail": str(exc)}, status_code=409)
+        except RuntimeError as exc:  # shutting down
+            return JSONResponse({"detail": str(exc)}, status_code=503, headers={"Retry-After": "5"})
+        except ValueError as exc:
+            return JSONResponse({"detail": str(exc)}, status_code=422)
+        status_url = f"/decision/jobs/{job.job_id}"
+        return JSONResponse(
+            {"job_id": job.job_id, "status": job.status, "status_url": status_url},
+            status_code=202,
+            headers={"Location": status_url},
         )
-        _referrals[referral_id] = referral
-        hitl = {
-            "required": True,
-            "referral_id": referral_id,
-            "status": referral.status,
-            "approve_url": f"/referrals/{referral_id}/approve",
-            "deny_url": f"/referrals/{referral_id}/deny",
-        }
+
+    try:
+        return await _pipeline.decide(payload.model_dump())
+    except IdempotencyConflict as exc:
+        return JSONResponse({"detail": str(exc)}, status_code=409)
+
+
+@app.get("/decision/jobs")
+async def decision_jobs() -> dict[str, Any]:
+    return _decision_jobs.stats()
+
+
+@app.get("/decision/jobs/{job_id}", response_model=None)
+async def decision_job(job_id: str) -> dict[str, Any] | JSONResponse:
+    job = _decision_jobs.get(job_id)
+    if job is None:
+        return JSONResponse({"error": "not_found", "job_id": job_id}, status_code=404)
+    return job.to_dict()
+
+
+@app.post("/decision/batch")
+async def decision_batch(request: Request) -> Response:
+    """Run many decisions, streaming one NDJSON line per result in completion order.
+
+    Accepts ``{"items": [...], "concurrency": N}`` or an ``application/x-ndjson`` body with one
+    decision request per line. Each output line carries the item's ``index``; invalid NDJSON
+    lines (including ones that aren't UTF-8) produce an ``error`` line instead of failing the batch.
+    """
+
+    body = await request.body()
+    concurrency = _decision_batch_concurrency
+    items: list[ProcurementDecisionRequest | str] = []
+    if "ndjson" in request.headers.get("content-type", ""):
+        # Lines stay bytes so a line that isn't valid UTF-8 fails validation on its own.
+        for line in body.splitlines():
+            if line.strip():
+                try:
+                    items.append(ProcurementDecisionRequest.model_validate_json(line))
+                except ValidationError as exc:
+                    items.append(str(exc))
     else:
-        hitl = {"required": False}
+        try:
+            batch = DecisionBatchRequest.model_validate_json(body)
+        except ValidationError as exc:
+            return JSONResponse({"detail": exc.errors(include_url=False)}, status_code=422)
+        items.extend(batch.items)
+        concurrency = batch.concurrency or concurrency
 
-    await _auditor.execute(
-        {
-            "event_type": "decision",
-            "request_id": request_id,
-            "supplier_id": request_dict["supplier_id"],
-            "decision": final_decision,
-            "explanation": explanation,
-            "risk_score": risk_score,
-            "risk_level": risk_level,
-            "policy_decision": policy_decision,
-            "policy_flags": policy_flags,
-            "risk_flags": risk_flags,
-        }
-    )
+    if not items or len(items) > MAX_DECISION_BATCH:
+        return JSONResponse({"detail": f"batch must contain between 1 and {MAX_DECISION_BATCH} items"}, status_code=422)
 
-    return {
-        "request_id": request_id,
-        "supplier_id": request_dict["supplier_id"],
-        "decision": final_decision,
-        "explanation": explanation,
-        "risk": risk,
-        "policy": policy,
-        "human_in_the_loop": hitl,
-    }
+    return StreamingResponse(_stream_decisions(items, concurrency), media_type="application/x-ndjson")
+
+
+async def _stream_decisions(items: list[ProcurementDecisionRequest | str], concurrency: int) -> AsyncIterator[bytes]:
+    for index, item in enumerate(items):
+        if isinstance(item, str):
+            yield encode_json({"index": index, "error": item}) + b"\n"
+
+    valid = ((i, item.model_dump()) for i, item in enumerate(items) if not isinstance(item, str))
+    results = _pipeline.decide_many(valid, concurrency=concurrency)
+    try:
+        async for result in results:
+            yield encode_json(result) + b"\n"
+    finally:
+        # Client went away mid-stream: don't keep deciding (and auditing) for nobody.
+        await results.aclose()
 
 
 @app.get("/referrals")
@@ -234,7 +466,98 @@ async def deny_referral(referral_id: str) -> dict[str, Any]:
 
 @app.get("/analytics")
 async def analytics() -> dict[str, Any]:
-    return _auditor.analytics()
+    return {**_auditor.analytics(), "stage_timings_ms": _pipeline.stats(), "audit_writer": _audit_writer.stats()}
+
+
+@app.get("/events/stream")
+async def events_stream() -> Response:
+    """Server-Sent Events: one ``snapshot`` of the audit counters, then an ``audit`` event per decision.
+
+    Each ``audit`` event carries the audit record and the ``delta`` it makes to the snapshot
+    counters, so dashboards stay current without polling ``/analytics``. ``dropped`` counts
+    events this subscriber missed by falling behind; a client can reconnect to resync.
+    """
+
+    if _auditor.subscriber_count >= _event_stream_max_subscribers:
+        return JSONResponse(
+            {"detail": "too many event stream subscribers"}, status_code=503, headers={"Retry-After": "5"}
+        )
+    return StreamingResponse(
+        _audit_event_stream(_auditor, max_buffer=_event_stream_buffer),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict[str, Any]) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+
+async def _audit_event_stream(
+    auditor: DecisionAuditor, *, max_buffer: int, keepalive: float = 15.0
+) -> AsyncIterator[bytes]:
+    # Subscribe only once the response is being streamed, so a client that is gone before then
+    # never leaves a subscriber behind; and snapshot in the same step so no event is both
+    # counted and replayed.
+    subscription = auditor.subscribe(max_buffer=max_buffer)
+    snapshot = auditor.counters()
+    try:
+        yield _sse("snapshot", snapshot)
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout=keepalive)
+            except TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream.
+                yield b": keepalive\n\n"
+                continue
+            yield _sse("audit", {**message, "dropped": subscription.dropped})
+    finally:
+        subscription.close()
+
+
+# Keeps the dashboard current from /events/stream: the snapshot seeds the counters and each delta updates them.
+_DASHBOARD_LIVE_SCRIPT = """
+  const state = {};
+  const rows = (pairs, empty) =>
+    pairs.map(([k, v]) => `<tr><td>${k}</td><td style='text-align:right'>${v}</td></tr>`).join("") ||
+    `<tr><td colspan='2'>${empty}</td></tr>`;
+  const add = (target, delta) => {
+    for (const [k, v] of Object.entries(delta)) {
+      target[k] = (target[k] || 0) + v;
+      if (!target[k]) delete target[k];
+    }
+  };
+  const render = () => {
+    document.getElementById("total").textContent = state.total;
+    document.getElementById("avg-risk").textContent = state.risk_score_count
+      ? state.risk_score_sum / state.risk_score_count
+      : "None";
+    const counts = Object.entries(state.counts_by_decision).sort(([a], [b]) => a.localeCompare(b));
+    const flags = Object.entries(state.flag_counts).sort(([, a], [, b]) => b - a).slice(0, 10);
+    document.getElementById("counts").innerHTML = rows(counts, "No data yet");
+    document.getElementById("flags").innerHTML = rows(flags, "No flags yet");
+  };
+  const events = new EventSource("/events/stream");
+  events.addEventListener("snapshot", (e) => {
+    Object.assign(state, JSON.parse(e.data));
+    render();
+  });
+  events.addEventListener("audit", (e) => {
+    const { delta, dropped } = JSON.parse(e.data);
+    if (dropped) {
+      // Missed events mean the counters are off; reload for a fresh snapshot.
+      events.close();
+      location.reload();
+      return;
+    }
+    state.total += delta.total;
+    state.risk_score_sum += delta.risk_score_sum;
+    state.risk_score_count += delta.risk_score_count;
+    add(state.counts_by_decision, delta.counts_by_decision);
+    add(state.flag_counts, delta.flag_counts);
+    render();
+  });
+"""
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
@@ -265,15 +588,15 @@ async def dashboard() -> str:
 </head>
 <body>
   <h1>Procuator Decision Analytics</h1>
-  <p>Total audited decisions: <b>{stats.get("total", 0)}</b></p>
-  <p>Average risk score: <b>{stats.get("avg_risk_score")}</b></p>
+  <p>Total audited decisions: <b id='total'>{stats.get("total", 0)}</b></p>
+  <p>Average risk score: <b id='avg-risk'>{stats.get("avg_risk_score")}</b></p>
 
   <div class='grid'>
     <div class='card'>
       <h2>Counts by Decision</h2>
       <table>
         <thead><tr><th>Decision</th><th style='text-align:right'>Count</th></tr></thead>
-        <tbody>
+        <tbody id='counts'>
           {counts_rows or "<tr><td colspan='2'>No data yet</td></tr>"}
         </tbody>
       </table>
@@ -282,7 +605,7 @@ async def dashboard() -> str:
       <h2>Top Flags</h2>
       <table>
         <thead><tr><th>Flag</th><th style='text-align:right'>Count</th></tr></thead>
-        <tbody>
+        <tbody id='flags'>
           {rows or "<tr><td colspan='2'>No flags yet</td></tr>"}
         </tbody>
       </table>
@@ -290,5 +613,6 @@ async def dashboard() -> str:
   </div>
 
   <p style='margin-top: 16px'>Tip: call <code>POST /decision</code> to generate events.</p>
+  <script>{_DASHBOARD_LIVE_SCRIPT}</script>
 </body>
 </html>"""
@@ -2,15 +2,36 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
 from procuator.data.demo_scenarios import demo_scenarios
-from procuator.data.generator import generate_dataset_json
+from procuator.data.generator import ProcurementTestDataGenerator, generate_dataset_json
+from procuator.data.supplier_store import (
+    InMemorySupplierDataStore,
+    SQLiteSupplierDataStore,
+    SupplierDataStore,
+    write_sqlite_store,
+)
+from procuator.idempotency import IdempotencyStore
+from procuator.pipeline import DecisionPipeline
+from procuator.skills.cache_warmer import warmup_targets
 from procuator.skills.decision_auditor import DecisionAuditor
 from procuator.skills.policy_engine import PolicyEngine
+from procuator.skills.risk_snapshot import write_risk_snapshot
 from procuator.skills.supplier_risk_checker import SupplierRiskChecker
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def _cmd_risk_check(args: argparse.Namespace) -> int:
     skill = SupplierRiskChecker()
     payload = {"supplier_id": args.supplier_id, "industry": args.industry, "refresh_cache": args.refresh}
@@ -29,87 +50,121 @@ def _cmd_generate_data(args: argparse.Namespace) -> int:
     return 0
 
 
+def _cmd_build_supplier_store(args: argparse.Namespace) -> int:
+    if args.input:
+        source = json.loads(Path(args.input).read_text(encoding="utf-8"))
+        compliance, operational, market = source["compliance"], source["operational"], source["market"]
+    else:
+        compliance, operational, market = InMemorySupplierDataStore().tables()
+
+    output = write_sqlite_store(args.output, compliance=compliance, operational=operational, market=market)
+    print(str(output))
+    return 0
+
+
+def _cmd_snapshot(args: argparse.Namespace) -> int:
+    store: SupplierDataStore = (
+        SQLiteSupplierDataStore(args.supplier_data) if args.supplier_data else InMemorySupplierDataStore()
+    )
+    if args.input:
+        targets = [
+            {"supplier_id": str(t["supplier_id"]), "industry": str(t.get("industry", "general"))}
+            for t in json.loads(Path(args.input).read_text(encoding="utf-8"))
+        ]
+    else:
+        catalog = ProcurementTestDataGenerator(seed=None).suppliers
+        targets = warmup_targets([], catalog, limit=len(catalog))
+
+    skill = SupplierRiskChecker(data_store=store)
+
+    async def _score() -> list[dict]:
+        try:
+            return await skill.execute_batch(targets, concurrency=args.concurrency)
+        finally:
+            await skill.aclose()
+
+    import asyncio
+
+    results = asyncio.run(_score())
+    store.close()
+
+    # Scores built on fallback data would be served for a whole day; leave those to live scoring.
+    complete, skipped = [], []
+    for target, result in zip(targets, results, strict=True):
+        metadata = result.get("metadata") or {}
+        if metadata.get("fallback_mode") or metadata.get("defaults_used") or metadata.get("status") == "PARTIAL":
+            skipped.append(target["supplier_id"])
+        else:
+            complete.append((target["supplier_id"], target["industry"], result))
+
+    if skipped:
+        print(f"skipped {len(skipped)} supplier(s) with incomplete data: {', '.join(skipped)}", file=sys.stderr)
+    if not complete:
+        print("no complete risk results; existing snapshot left unchanged", file=sys.stderr)
+        return 1
+
+    print(str(write_risk_snapshot(args.output, complete)))
+    return 0
+
+
 def _cmd_demo_scenarios(_: argparse.Namespace) -> int:
     print(json.dumps({"scenarios": demo_scenarios()}, indent=2))
     return 0
 
 
-def _cmd_decide(args: argparse.Namespace) -> int:
-    risk = SupplierRiskChecker()
-    policy = PolicyEngine()
-    auditor = DecisionAuditor()
-
-    request = {
-        "request_id": args.request_id,
-        "supplier_id": args.supplier_id,
-        "industry": args.industry,
-        "amount": args.amount,
-        "currency": args.currency,
-        "budget_remaining": args.budget_remaining,
-        "requester_approval_limit": args.requester_approval_limit,
-        "urgency": args.urgency,
-        "supplier_history": {"total_transactions": args.supplier_transactions},
-        "refresh_cache": args.refresh,
-    }
+def _read_decision_requests(path: str) -> tuple[list[tuple[int, dict]], list[dict]]:
+    requests, errors = [], []
+    with Path(path).open(encoding="utf-8") as f:
+        for index, line in enumerate(line for line in f if line.strip()):
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict) or "supplier_id" not in request or "amount" not in request:
+                    raise ValueError("each line must be a JSON object with supplier_id and amount")
+            except ValueError as exc:
+                errors.append({"index": index, "error": str(exc)})
+            else:
+                requests.append((index, request))
+    return requests, errors
 
-    import asyncio
 
-    risk_result = asyncio.run(risk.execute(request))
-    policy_result = asyncio.run(policy.execute(request))
-
-    risk_level = str(risk_result.get("risk_level", "UNKNOWN"))
-    policy_decision = str(policy_result.get("policy_decision", "REFER"))
-    risk_score = float(risk_result.get("risk_score", 0.0))
-
-    if policy_decision == "DENY":
-        final = "DENY"
-    elif policy_decision == "REFER":
-        final = "REFER"
-    elif risk_level == "HIGH":
-        final = "REFER"
-    elif risk_level == "MEDIUM" and risk_score >= 5.5:
-        final = "REFER"
-    else:
-        final = "APPROVE"
-
-    explanation = list(policy_result.get("reasons") or [])
-    if policy_result.get("policy_flags"):
-        explanation.append(f"Policy flags: {', '.join(policy_result['policy_flags'])}")
-    risk_flags_raw = list(risk_result.get("risk_flags") or [])
-    risk_flags = [
-        (str(f.get("code") or f.get("message") or f) if isinstance(f, dict) else str(f)) for f in risk_flags_raw
-    ]
-    if risk_flags:
-        explanation.append(f"Risk flags: {', '.join(risk_flags)}")
-
-    asyncio.run(
-        auditor.execute(
-            {
-                "event_type": "decision",
-                "request_id": str(request.get("request_id") or request.get("supplier_id")),
-                "supplier_id": str(request.get("supplier_id")),
-                "decision": final,
-                "explanation": explanation,
-                "risk_score": risk_score,
-                "risk_level": risk_level,
-                "policy_decision": policy_decision,
-                "policy_flags": list(policy_result.get("policy_flags") or []),
-                "risk_flags": risk_flags,
-            }
+def _cmd_decide(args: argparse.Namespace) -> int:
+    if args.input is None and (args.supplier_id is None or args.amount is None):
+        print("decide needs a supplier_id and --amount, or --input", file=sys.stderr)
+        return 2
+
+    async def _run() -> None:
+        # Repeated request_ids in an input file are decided (and audited) once.
+        pipeline = DecisionPipeline(
+            SupplierRiskChecker(), PolicyEngine(), DecisionAuditor(), idempotency=IdempotencyStore()
         )
-    )
+        async with pipeline:
+            if args.input is None:
+                result = await pipeline.decide(
+                    {
+                        "request_id": args.request_id,
+                        "supplier_id": args.supplier_id,
+                        "industry": args.industry,
+                        "amount": args.amount,
+                        "currency": args.currency,
+                        "budget_remaining": args.budget_remaining,
+                        "requester_approval_limit": args.requester_approval_limit,
+                        "urgency": args.urgency,
+                        "supplier_history": {"total_transactions": args.supplier_transactions},
+                        "refresh_cache": args.refresh,
+                    }
+                )
+                print(json.dumps(result, indent=2))
+                return
+
+            requests, errors = _read_decision_requests(args.input)
+            for error in errors:
+                print(json.dumps(error), flush=True)
+            async for result in pipeline.decide_many(requests, concurrency=args.concurrency):
+                print(json.dumps(result), flush=True)
 
-    print(
-        json.dumps(
-            {
-                "decision": final,
-                "risk": risk_result,
-                "policy": policy_result,
-                "explanation": explanation,
-            },
-            indent=2,
-        )
-    )
+    import asyncio
+
+    asyncio.run(_run())
     return 0
 
 
@@ -129,20 +184,42 @@ def main() -> int:
     gen.add_argument("--seed", type=int, default=1337)
     gen.set_defaults(func=_cmd_generate_data)
 
+    store = sub.add_parser("build-supplier-store", help="Build the SQLite supplier reference data store")
+    store.add_argument("--output", default="data/suppliers.db")
+    store.add_argument(
+        "--input", default=None, help="JSON with compliance/operational/market maps (default: demo data)"
+    )
+    store.set_defaults(func=_cmd_build_supplier_store)
+
+    snapshot = sub.add_parser("snapshot", help="Score every known supplier into a memory-mapped risk snapshot")
+    snapshot.add_argument("--output", default="data/risk_snapshot.bin")
+    snapshot.add_argument("--supplier-data", default=None, help="SQLite supplier store (default: demo data)")
+    snapshot.add_argument(
+        "--input", default=None, help="JSON list of {supplier_id, industry} to score (default: supplier catalog)"
+    )
+    snapshot.add_argument("--concurrency", type=_positive_int, default=16)
+    snapshot.set_defaults(func=_cmd_snapshot)
+
     demo = sub.add_parser("demo-scenarios", help="Print the 3 core demo scenarios")
     demo.set_defaults(func=_cmd_demo_scenarios)
 
     decide = sub.add_parser("decide", help="Run policy + risk and print a final decision")
-    decide.add_argument("supplier_id")
+    decide.add_argument("supplier_id", nargs="?")
     decide.add_argument("--request-id", default=None)
     decide.add_argument("--industry", default="general")
-    decide.add_argument("--amount", type=float, required=True)
+    decide.add_argument("--amount", type=float, default=None)
     decide.add_argument("--currency", default="USD")
     decide.add_argument("--budget-remaining", type=float, default=0.0)
     decide.add_argument("--requester-approval-limit", type=float, default=0.0)
     decide.add_argument("--supplier-transactions", type=int, default=0)
     decide.add_argument("--urgency", default="standard")
     decide.add_argument("--refresh", action="store_true")
+    decide.add_argument(
+        "--input",
+        default=None,
+        help="NDJSON file of decision requests (one JSON result per line, in completion order)",
+    )
+    decide.add_argument("--concurrency", type=_positive_int, default=16)
     decide.set_defaults(func=_cmd_decide)
 
     args = parser.parse_args()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 
 
@@ -14,4 +15,25 @@ class Settings:
     api_key_env: str = "API_KEY"
 
 
+@dataclass(frozen=True)
+class HttpPoolSettings:
+    """Connection pool tuning for outbound risk data requests."""
+
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    total_timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls) -> HttpPoolSettings:
+        return cls(
+            limit=int(os.getenv("FINANCIAL_HTTP_POOL_LIMIT", str(cls.limit))),
+            limit_per_host=int(os.getenv("FINANCIAL_HTTP_POOL_PER_HOST", str(cls.limit_per_host))),
+            keepalive_timeout=float(os.getenv("FINANCIAL_HTTP_KEEPALIVE_SECONDS", str(cls.keepalive_timeout))),
+            dns_cache_ttl=int(os.getenv("FINANCIAL_HTTP_DNS_TTL_SECONDS", str(cls.dns_cache_ttl))),
+            total_timeout=float(os.getenv("FINANCIAL_HTTP_TIMEOUT_SECONDS", str(cls.total_timeout))),
+        )
+
+
 DEFAULT_SETTINGS = Settings()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Any
+
+DEMO_COMPLIANCE: dict[str, dict[str, Any]] = {
+    "SUP-001": {
+        "violations": 0,
+        "certifications": ["ISO9001", "ISO14001"],
+        "last_inspection": "2024-01-15",
+    },
+    "SUP-002": {"violations": 2, "certifications": ["ISO9001"], "last_inspection": "2023-11-20"},
+    "SUP-003": {
+        "violations": 0,
+        "certifications": ["ISO9001", "ISO45001", "SOC2"],
+        "last_inspection": "2024-02-01",
+    },
+    "SUP-004": {"violations": 1, "certifications": [], "last_inspection": "2023-09-10"},
+    "SUP-005": {"violations": 0, "certifications": ["ISO9001"], "last_inspection": "2024-01-30"},
+}
+
+DEMO_OPERATIONAL: dict[str, dict[str, float]] = {
+    "SUP-001": {"delivery_reliability": 0.95, "quality_score": 0.92, "response_time": 0.88},
+    "SUP-002": {"delivery_reliability": 0.85, "quality_score": 0.78, "response_time": 0.72},
+    "SUP-003": {"delivery_reliability": 0.98, "quality_score": 0.96, "response_time": 0.94},
+    "SUP-004": {"delivery_reliability": 0.70, "quality_score": 0.65, "response_time": 0.60},
+    "SUP-005": {"delivery_reliability": 0.90, "quality_score": 0.85, "response_time": 0.82},
+}
+
+DEMO_MARKET: dict[str, dict[str, float]] = {
+    "technology": {"volatility": 0.7, "growth": 0.8, "competition": 0.6},
+    "manufacturing": {"volatility": 0.4, "growth": 0.5, "competition": 0.7},
+    "healthcare": {"volatility": 0.3, "growth": 0.9, "competition": 0.5},
+    "retail": {"volatility": 0.8, "growth": 0.4, "competition": 0.9},
+    "general": {"volatility": 0.5, "growth": 0.5, "competition": 0.5},
+}
+
+
+class SupplierDataStore:
+    """Read-only supplier reference data used by the risk fetchers.
+
+    Lookups return None when the key is unknown; callers apply their own defaults.
+    """
+
+    def compliance(self, supplier_id: str) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    def operational(self, supplier_id: str) -> dict[str, float] | None:
+        raise NotImplementedError
+
+    def market(self, industry: str) -> dict[str, float] | None:
+        raise NotImplementedError
+
+    def refresh(self) -> None:
+        """Reload the underlying data, if the store is backed by something that can change."""
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class InMemorySupplierDataStore(SupplierDataStore):
+    """Dict-backed store; the default uses the bundled demo data."""
+
+    def __init__(
+        self,
+        *,
+        compliance: dict[str, dict[str, Any]] | None = None,
+        operational: dict[str, dict[str, float]] | None = None,
+        market: dict[str, dict[str, float]] | None = None,
+    ) -> None:
+        self._compliance = DEMO_COMPLIANCE if compliance is None else compliance
+        self._operational = DEMO_OPERATIONAL if operational is None else operational
+        self._market = DEMO_MARKET if market is None else market
+
+    def compliance(self, supplier_id: str) -> dict[str, Any] | None:
+        return self._compliance.get(supplier_id)
+
+    def operational(self, supplier_id: str) -> dict[str, float] | None:
+        return self._operational.get(supplier_id)
+
+    def market(self, industry: str) -> dict[str, float] | None:
+        return self._market.get(industry)
+
+    def tables(self) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, float]], dict[str, dict[str, float]]]:
+        return self._compliance, self._operational, self._market
+
+
+class SQLiteSupplierDataStore(SupplierDataStore):
+    """File-backed store using SQLite primary-key lookups (O(log n) per supplier).
+
+    The database is opened read-only once. ``refresh`` opens the current file
+    before swapping connections, so lookups never see a partially loaded store;
+    pair it with ``write_sqlite_store``, which publishes new files atomically.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(f"file:{self._path}?mode=ro", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def compliance(self, supplier_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute(
+            "SELECT violations, certifications, last_inspection FROM compliance WHERE supplier_id = ?",
+            (supplier_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "violations": row["violations"],
+            "certifications": json.loads(row["certifications"]),
+            "last_inspection": row["last_inspection"],
+        }
+
+    def operational(self, supplier_id: str) -> dict[str, float] | None:
+        row = self._conn.execute(
+            "SELECT delivery_reliability, quality_score, response_time FROM operational WHERE supplier_id = ?",
+            (supplier_id,),
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def market(self, industry: str) -> dict[str, float] | None:
+        row = self._conn.execute(
+            "SELECT volatility, growth, competition FROM market WHERE industry = ?",
+            (industry,),
+        ).fetchone()
+        return dict(row) if row is not None else None
+
+    def refresh(self) -> None:
+        new_conn = self._connect()
+        old_conn, self._conn = self._conn, new_conn
+        old_conn.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def write_sqlite_store(
+    path: str | Path,
+    *,
+    compliance: dict[str, dict[str, Any]],
+    operational: dict[str, dict[str, float]],
+    market: dict[str, dict[str, float]],
+) -> Path:
+    """Write reference data to a SQLite file, replacing any existing file atomically."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(tmp_name)
+        with conn:
+            conn.executescript(
+                """
+                CREATE TABLE compliance (
+                    supplier_id TEXT PRIMARY KEY,
+                    violations INTEGER NOT NULL,
+                    certifications TEXT NOT NULL,
+                    last_inspection TEXT
+                ) WITHOUT ROWID;
+                CREATE TABLE operational (
+                    supplier_id TEXT PRIMARY KEY,
+                    delivery_reliability REAL NOT NULL,
+                    quality_score REAL NOT NULL,
+                    response_time REAL NOT NULL
+                ) WITHOUT ROWID;
+                CREATE TABLE market (
+                    industry TEXT PRIMARY KEY,
+                    volatility REAL NOT NULL,
+                    growth REAL NOT NULL,
+                    competition REAL NOT NULL
+                ) WITHOUT ROWID;
+                """
+            )
+            conn.executemany(
+                "INSERT INTO compliance VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        sid,
+                        int(d.get("violations", 0)),
+                        json.dumps(list(d.get("certifications") or [])),
+                        d.get("last_inspection"),
+                    )
+                    for sid, d in compliance.items()
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO operational VALUES (?, ?, ?, ?)",
+                (
+                    (sid, d["delivery_reliability"], d["quality_score"], d["response_time"])
+                    for sid, d in operational.items()
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO market VALUES (?, ?, ?, ?)",
+                ((industry, d["volatility"], d["growth"], d["competition"]) for industry, d in market.items()),
+            )
+        conn.close()
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import urlsplit
+from uuid import uuid4
+
+import aiohttp
+
+from procuator.idempotency import IdempotencyConflict
+from procuator.pipeline import DecisionPipeline, request_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by ``submit`` when the queue is at capacity; ``retry_after`` is a wait hint in seconds."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("decision queue is full")
+        self.retry_after = retry_after
+
+
+@dataclass
+class DecisionJob:
+    job_id: str
+    request: dict[str, Any]
+    submitted_at: str
+    status: str = "QUEUED"  # QUEUED | RUNNING | DONE | FAILED | CANCELLED
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    callback_url: str | None = None
+    callback_status: str | None = None  # SENT | FAILED
+    fingerprint: str = field(default="", repr=False)
+    _started: float = field(default=0.0, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"DONE", "FAILED", "CANCELLED"}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "request_id": self.request.get("request_id"),
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+            "callback_url": self.callback_url,
+            "callback_status": self.callback_status,
+        }
+
+
+def _now() -> str:
+    return datetime.now(tz=UTC).isoformat()
+
+
+class DecisionJobQueue:
+    """Bounded queue of decision requests drained by a pool of worker tasks.
+
+    ``submit`` enqueues a request and returns its job right away; a full queue
+    raises ``JobQueueFull`` with a Retry-After estimate from the queue depth and
+    recent job durations. A request whose ``request_id`` is already queued or
+    running returns that job instead of a new one, or raises
+    ``IdempotencyConflict`` if its content differs. Finished jobs are kept for
+    polling, up to ``max_jobs`` with the oldest dropped first.
+
+    A job may carry a ``callback_url``; the result is POSTed there when the job
+    finishes. Only hosts in ``callback_hosts`` are accepted, so the service can't
+    be pointed at arbitrary endpoints. Workers start on first use; ``aclose``
+    stops intake, drains the queue for up to ``drain_timeout`` and stops them,
+    marking jobs it had to abandon ``CANCELLED``. The queue then stays shut until
+    ``reopen``.
+    """
+
+    def __init__(
+        self,
+        pipeline: DecisionPipeline,
+        *,
+        workers: int = 8,
+        max_queue: int = 1000,
+        max_jobs: int = 10_000,
+        callback_hosts: Iterable[str] = ("localhost", "127.0.0.1"),
+        callback_timeout: timedelta = timedelta(seconds=5),
+        drain_timeout: timedelta = timedelta(seconds=10),
+    ) -> None:
+        if workers <= 0 or max_queue <= 0 or max_jobs <= 0:
+            raise ValueError("workers, max_queue and max_jobs must be positive")
+
+        self.pipeline = pipeline
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_jobs = max_jobs
+        self.callback_hosts = frozenset(callback_hosts)
+        self.callback_timeout = callback_timeout
+        self.drain_timeout = drain_timeout
+
+        self._queue: asyncio.Queue[DecisionJob] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._jobs: OrderedDict[str, DecisionJob] = OrderedDict()
+        self._active_by_request: dict[str, DecisionJob] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+        self._running = 0
+        self._avg_seconds = 1.0
+
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, request: dict[str, Any], *, callback_url: str | None = None) -> DecisionJob:
+        if self._closed:
+            raise RuntimeError("decision queue is shut down")
+        if callback_url is not None and urlsplit(callback_url).hostname not in self.callback_hosts:
+            raise ValueError(f"callback host must be one of: {', '.join(sorted(self.callback_hosts))}")
+
+        request_id = request.get("request_id")
+        fingerprint = request_fingerprint(request)
+        active = self._active_by_request.get(str(request_id)) if request_id else None
+        if active is not None:
+            if active.fingerprint != fingerprint:
+                raise IdempotencyConflict(f"request_id {request_id!r} was already used for a different request")
+            return active
+
+        queue = self._start()
+        if queue.full():
+            self.rejected += 1
+            raise JobQueueFull(self.retry_after())
+
+        job = DecisionJob(
+            job_id=uuid4().hex,
+            request=dict(request),
+            submitted_at=_now(),
+            callback_url=callback_url,
+            fingerprint=fingerprint,
+        )
+        queue.put_nowait(job)
+        self._jobs[job.job_id] = job
+        if request_id:
+            self._active_by_request[str(request_id)] = job
+        self.submitted += 1
+        self._trim()
+        return job
+
+    def get(self, job_id: str) -> DecisionJob | None:
+        return self._jobs.get(job_id)
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.queue_depth * self._avg_seconds / self.workers))
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout.total_seconds())
+            except TimeoutError:
+                logger.warning("Decision queue shut down with %s job(s) still queued", self._queue.qsize())
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._cancel(self._queue.get_nowait())
+            self._queue = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def reopen(self) -> None:
+        """Accept submissions again after ``aclose`` (e.g. when the app starts up again)."""
+
+        self._closed = False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "closed": self._closed,
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "running": self._running,
+            "retained_jobs": len(self._jobs),
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "avg_job_ms": round(self._avg_seconds * 1000, 3),
+        }
+
+    def _start(self) -> asyncio.Queue[DecisionJob]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._tasks = [asyncio.create_task(self._worker(self._queue)) for _ in range(self.workers)]
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue[DecisionJob]) -> None:
+        while True:
+            job = await queue.get()
+            self._running += 1
+            try:
+                await self._run(job)
+            finally:
+                self._running -= 1
+                queue.task_done()
+
+    async def _run(self, job: DecisionJob) -> None:
+        job.status, job.started_at, job._started = "RUNNING", _now(), time.monotonic()
+        try:
+            job.result = await self.pipeline.decide(job.request)
+            job.status = "DONE"
+            self.completed += 1
+        except asyncio.CancelledError:
+            self._cancel(job)
+            raise
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Decision job %s failed", job.job_id)
+            job.error = str(exc)
+            job.status = "FAILED"
+            self.failed += 1
+        finally:
+            job.finished_at = _now()
+            # Exponentially weighted, so Retry-After follows the current job cost.
+            self._avg_seconds += 0.2 * ((time.monotonic() - job._started) - self._avg_seconds)
+            self._retire(job)
+
+        if job.callback_url is not None:
+            await self._notify(job)
+
+    async def _notify(self, job: DecisionJob) -> None:
+        assert job.callback_url is not None
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.callback_timeout.total_seconds())
+            )
+        try:
+            async with self._session.post(job.callback_url, json=job.to_dict()) as response:
+                response.raise_for_status()
+            job.callback_status = "SENT"
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            logger.warning("Callback for decision job %s failed: %s", job.job_id, exc)
+            job.callback_status = "FAILED"
+
+    def _cancel(self, job: DecisionJob) -> None:
+        job.status, job.error = "CANCELLED", "cancelled by shutdown"
+        job.finished_at = job.finished_at or _now()
+        self.cancelled += 1
+        self._retire(job)
+
+    def _retire(self, job: DecisionJob) -> None:
+        request_id = job.request.get("request_id")
+        if request_id and self._active_by_request.get(str(request_id)) is job:
+            del self._active_by_request[str(request_id)]
+
+    def _trim(self) -> None:
+        # Drop the oldest finished jobs; queued and running ones stay until they finish.
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        retired = []
+        for job_id, job in self._jobs.items():
+            if job.finished:
+                retired.append(job_id)
+                if len(retired) == excess:
+                    break
+        for job_id in retired:
+            del self._jobs[job_id]
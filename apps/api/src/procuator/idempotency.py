@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+
+class IdempotencyConflict(ValueError):
+    """Raised when a key is reused for a request whose content differs from the original."""
+
+
+class IdempotencyStore:
+    """Remembers recent responses by idempotency key so retries replay instead of re-running.
+
+    ``run`` computes a response once per key: a repeat within ``retention`` gets a
+    copy of the stored response, and a repeat that arrives while the first call is
+    still running waits for that call instead of starting its own. If the first
+    call is cancelled (e.g. its client disconnected), a waiting repeat computes the
+    response itself. Failures are not stored, so a retry after an error runs
+    again. The store keeps at most
+    ``max_entries`` keys, dropping the oldest first.
+
+    Each key is stored with a fingerprint of its request; reusing a key for a
+    different request raises ``IdempotencyConflict`` rather than replaying an
+    unrelated response.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 10_000,
+        retention: timedelta = timedelta(hours=24),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.retention = retention
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[datetime, str, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, tuple[str, asyncio.Future[dict[str, Any]]]] = {}
+
+        self.replays = 0
+        self.joined = 0
+        self.conflicts = 0
+        self.misses = 0
+        self.takeovers = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def run(self, key: str, fingerprint: str, compute: Callable[[], Awaitable[dict[str, Any]]]) -> dict[str, Any]:
+        while True:
+            self._expire()
+
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._check(key, fingerprint, stored[1])
+                self.replays += 1
+                return copy.deepcopy(stored[2])
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return await self._compute(key, fingerprint, compute)
+
+            self._check(key, fingerprint, inflight[0])
+            self.joined += 1
+            try:
+                return copy.deepcopy(await asyncio.shield(inflight[1]))
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not inflight[1].cancelled() or (task is not None and task.cancelling()):
+                    raise
+                # The first caller went away but this one is still live: look again, and compute if need be.
+                self.takeovers += 1
+
+    async def _compute(
+        self, key: str, fingerprint: str, compute: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        self.misses += 1
+        fut: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = (fingerprint, fut)
+        try:
+            response = await compute()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as exc:
+            fut.set_exception(exc)
+            # Nobody may be waiting on it; don't let asyncio log "exception was never retrieved".
+            fut.exception()
+            raise
+        else:
+            fut.set_result(response)
+            self._store(key, fingerprint, response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "max_entries": self.max_entries,
+            "retention_seconds": self.retention.total_seconds(),
+            "replays": self.replays,
+            "joined": self.joined,
+            "conflicts": self.conflicts,
+            "misses": self.misses,
+            "takeovers": self.takeovers,
+        }
+
+    def _check(self, key: str, fingerprint: str, expected: str) -> None:
+        if fingerprint != expected:
+            self.conflicts += 1
+            raise IdempotencyConflict(f"request_id {key!r} was already used for a different request")
+
+    def _store(self, key: str, fingerprint: str, response: dict[str, Any]) -> None:
+        self._entries[key] = (self._clock(), fingerprint, copy.deepcopy(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _expire(self) -> None:
+        # Entries are kept in insertion order, so the expired ones are all at the front.
+        cutoff = self._clock() - self.retention
+        while self._entries:
+            key, (stored_at, _, _) = next(iter(self._entries.items()))
+            if stored_at > cutoff:
+                break
+            del self._entries[key]
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from procuator.idempotency import IdempotencyStore
+from procuator.skills.decision_auditor import DecisionAuditor
+from procuator.skills.policy_engine import PolicyEngine
+from procuator.skills.risk_history import content_digest
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+logger = logging.getLogger(__name__)
+
+# Policy denials that no risk result can overturn; the risk lookup is skipped for these.
+HARD_DENY_FLAGS = frozenset({"invalid_amount", "budget_exceeded"})
+
+STAGES = ("policy", "risk", "referral", "audit", "total")
+
+
+@dataclass
+class _StageTiming:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class Referral:
+    referral_id: str
+    created_at: str
+    status: str  # PENDING | APPROVED | DENIED
+    request: dict[str, Any]
+    proposed_decision: str
+    explanation: list[str]
+
+
+def request_fingerprint(request: dict[str, Any]) -> str:
+    """Identity of a decision request, for telling a retry from a reused ``request_id``."""
+
+    # refresh_cache only steers data freshness (and decide_many rewrites it), so it isn't part of the identity.
+    return content_digest({k: v for k, v in request.items() if k != "refresh_cache"})
+
+
+class DecisionPipeline:
+    """Policy + risk + referral + audit for procurement requests, shared by the API and the CLI.
+
+    The pipeline owns the risk skill's lifecycle (use ``async with`` or call
+    ``aclose``), so any number of decisions reuse one HTTP session and cache.
+    Each result carries ``timings_ms`` per stage; ``stats`` aggregates them.
+
+    With an ``idempotency`` store, requests that carry a ``request_id`` are decided
+    once: retries replay the stored response without a new referral or audit event.
+    """
+
+    def __init__(
+        self,
+        risk: SupplierRiskChecker | None = None,
+        policy: PolicyEngine | None = None,
+        auditor: DecisionAuditor | None = None,
+        *,
+        referrals: dict[str, Referral] | None = None,
+        idempotency: IdempotencyStore | None = None,
+    ) -> None:
+        self.risk = risk or SupplierRiskChecker()
+        self.policy = policy or PolicyEngine()
+        self.auditor = auditor or DecisionAuditor()
+        self.referrals: dict[str, Referral] = {} if referrals is None else referrals
+        self.idempotency = idempotency
+        self._timings = {stage: _StageTiming() for stage in STAGES}
+
+    async def __aenter__(self) -> DecisionPipeline:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.risk.aclose()
+
+    async def decide(self, request: dict[str, Any]) -> dict[str, Any]:
+        request_id = request.get("request_id")
+        if not request_id or self.idempotency is None:
+            return await self._decide(request)
+        return await self.idempotency.run(str(request_id), request_fingerprint(request), lambda: self._decide(request))
+
+    async def _decide(self, request: dict[str, Any]) -> dict[str, Any]:
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
+        request_dict = dict(request)
+        request_id = (
+            request_dict.get("request_id") or f"REQ-{datetime.now(tz=UTC).strftime('%Y%m%d')}-{uuid4().hex[:6]}"
+        )
+        request_dict["request_id"] = request_id
+
+        # Policy is pure CPU, so evaluate it first: a hard deny makes the (remote) risk lookup pointless.
+        stage = time.perf_counter()
+        policy = await self.policy.execute(request_dict)
+        timings["policy"] = self._elapsed_ms(stage)
+        policy_decision = str(policy.get("policy_decision", "REFER"))
+        policy_flags = list(policy.get("policy_flags") or [])
+        hard_deny = policy_decision == "DENY" and bool(HARD_DENY_FLAGS.intersection(policy_flags))
+
+        risk: dict[str, Any] | None = None
+        if not hard_deny or request_dict.get("include_risk"):
+            stage = time.perf_counter()
+            risk = await self.risk.execute(
+                {
+                    "supplier_id": request_dict["supplier_id"],
+                    "industry": request_dict.get("industry", "general"),
+                    "refresh_cache": request_dict.get("refresh_cache", False),
+                    "budget_ms": request_dict.get("budget_ms"),
+                }
+            )
+            timings["risk"] = self._elapsed_ms(stage)
+
+        explanation: list[str] = []
+
+        risk_level = str(risk.get("risk_level", "UNKNOWN")) if risk is not None else None
+        risk_score = float(risk.get("risk_score", 0.0)) if risk is not None else None
+        risk_flags_raw = list(risk.get("risk_flags") or []) if risk is not None else []
+        risk_flags = [
+            (str(f.get("code") or f.get("message") or f) if isinstance(f, dict) else str(f)) for f in risk_flags_raw
+        ]
+        risk_metadata = (risk or {}).get("metadata") or {}
+        risk_partial = risk_metadata.get("status") == "PARTIAL"
+
+        if policy_decision == "DENY":
+            final_decision = "DENY"
+        elif policy_decision == "REFER":
+            final_decision = "REFER"
+        elif risk_partial:
+            # Incomplete risk data can still deny via policy, but never auto-approves.
+            final_decision = "REFER"
+        elif risk_level == "HIGH":
+            final_decision = "REFER"
+        elif risk_level == "MEDIUM" and risk_score is not None and risk_score >= 5.5:
+            final_decision = "REFER"
+        else:
+            final_decision = "APPROVE"
+
+        if policy_flags:
+            explanation.append(f"Policy flags: {', '.join(policy_flags)}")
+        if risk_flags:
+            explanation.append(f"Risk flags: {', '.join(risk_flags)}")
+        explanation.extend(list(policy.get("reasons") or []))
+        if risk_partial:
+            missing = ", ".join(risk_metadata.get("missing_components") or [])
+            explanation.append(f"Risk assessment incomplete within the latency budget (missing: {missing}).")
+        if risk is None:
+            explanation.append(f"Decision derived from policy={policy_decision}; risk assessment skipped on hard deny.")
+        else:
+            explanation.append(f"Composite decision derived from risk={risk_level} and policy={policy_decision}.")
+
+        stage = time.perf_counter()
+        hitl: dict[str, Any] | None = None
+        if final_decision == "REFER":
+            referral_id = uuid4().hex
+            referral = Referral(
+                referral_id=referral_id,
+                created_at=datetime.now(tz=UTC).isoformat(),
+                status="PENDING",
+                request=request_dict,
+                proposed_decision=final_decision,
+                explanation=explanation,
+            )
+            self.referrals[referral_id] = referral
+            hitl = {
+                "required": True,
+                "referral_id": referral_id,
+                "status": referral.status,
+                "approve_url": f"/referrals/{referral_id}/approve",
+                "deny_url": f"/referrals/{referral_id}/deny",
+            }
+        else:
+            hitl = {"required": False}
+        timings["referral"] = self._elapsed_ms(stage)
+
+        stage = time.perf_counter()
+        await self.auditor.execute(
+            {
+                "event_type": "decision",
+                "request_id": request_id,
+                "supplier_id": request_dict["supplier_id"],
+                "decision": final_decision,
+                "explanation": explanation,
+                "risk_score": risk_score,
+                "risk_level": risk_level,
+                "policy_decision": policy_decision,
+                "policy_flags": policy_flags,
+                "risk_flags": risk_flags,
+                "metadata": {"industry": request_dict.get("industry", "general"), "risk_partial": risk_partial},
+            }
+        )
+        timings["audit"] = self._elapsed_ms(stage)
+        timings["total"] = self._elapsed_ms(started)
+        self._record_timings(timings)
+
+        return {
+            "request_id": request_id,
+            "supplier_id": request_dict["supplier_id"],
+            "decision": final_decision,
+            "explanation": explanation,
+            "risk": risk,
+            "policy": policy,
+            "human_in_the_loop": hitl,
+            "timings_ms": timings,
+        }
+
+    async def decide_many(
+        self, requests: Iterable[tuple[int, dict[str, Any]]], *, concurrency: int = 16
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Decide ``(index, request)`` pairs concurrently, yielding results in completion order.
+
+        Each result carries its ``index``; a request that fails yields an ``error`` result instead
+        of aborting the rest. Closing the iterator early cancels the outstanding decisions.
+        """
+
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        refreshed: set[tuple[str, str]] = set()
+
+        async def _run(index: int, request: dict[str, Any]) -> dict[str, Any]:
+            request = dict(request)
+            # Same-supplier requests share one risk lookup (the skill coalesces concurrent ones and
+            # caches the rest), so only the first refresh per supplier actually forces a re-fetch.
+            supplier = (str(request.get("supplier_id")), str(request.get("industry", "general")))
+            if request.get("refresh_cache"):
+                if supplier in refreshed:
+                    request["refresh_cache"] = False
+                refreshed.add(supplier)
+
+            async with semaphore:
+                try:
+                    return {"index": index, **await self.decide(request)}
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("Decision failed")
+                    return {"index": index, "request_id": request.get("request_id"), "error": str(exc)}
+
+        tasks = [asyncio.ensure_future(_run(index, request)) for index, request in requests]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            stage: {
+                "count": t.count,
+                "avg_ms": round(t.total_ms / t.count, 3) if t.count else None,
+                "max_ms": round(t.max_ms, 3),
+            }
+            for stage, t in self._timings.items()
+        }
+
+    def _record_timings(self, timings: dict[str, float]) -> None:
+        for stage, ms in timings.items():
+            t = self._timings[stage]
+            t.count += 1
+            t.total_ms += ms
+            t.max_ms = max(t.max_ms, ms)
+
+    @staticmethod
+    def _elapsed_ms(since: float) -> float:
+        return round((time.perf_counter() - since) * 1000, 3)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Any, Literal
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["never", "batch", "interval"]
+
+_STOP = object()
+
+
+class AuditLogWriter:
+    """Appends audit records to a JSONL file from a background thread.
+
+    ``write`` only enqueues, so callers on the event loop never touch the disk.
+    The writer thread keeps one file handle open and group-commits: it collects
+    up to ``batch_size`` records (waiting at most ``flush_interval`` after the
+    first) and writes and flushes them together. ``fsync`` controls durability:
+    ``"batch"`` syncs every batch, ``"interval"`` at most every ``fsync_interval``,
+    and ``"never"`` leaves it to the OS. Unless it is ``"never"``, anything not
+    yet synced is synced when the writer stops.
+
+    The queue holds at most ``max_queue`` records; beyond that records are
+    dropped and counted, keeping the audit log best-effort as before rather than
+    stalling decisions. ``close`` writes out everything queued and stops the
+    thread; a later ``write`` starts it again.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: timedelta = timedelta(milliseconds=200),
+        fsync: FsyncPolicy = "interval",
+        fsync_interval: timedelta = timedelta(seconds=1),
+    ) -> None:
+        if max_queue <= 0 or batch_size <= 0:
+            raise ValueError("max_queue and batch_size must be positive")
+        if fsync not in ("never", "batch", "interval"):
+            raise ValueError("fsync must be one of: never, batch, interval")
+
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._file: IO[str] | None = None
+        self._last_fsync = 0.0
+        self._unsynced = False
+
+        self.written = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def write(self, record: dict[str, Any]) -> bool:
+        """Queue one record; returns False if it was dropped because the queue is full."""
+
+        self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("Audit log queue full; %s record(s) dropped so far", self.dropped)
+            return False
+        return True
+
+    def close(self, timeout: timedelta = timedelta(seconds=10)) -> None:
+        """Drain the queue to disk and stop the writer thread (blocking; call via ``asyncio.to_thread``)."""
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout.total_seconds())
+        if thread.is_alive():
+            logger.warning("Audit log writer did not finish draining within %s", timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "queue_depth": self._queue.qsize(),
+            "max_queue": self._queue.maxsize,
+            "written": self.written,
+            "batches": self.batches,
+            "fsync": self.fsync,
+            "fsyncs": self.fsyncs,
+            "dropped": self.dropped,
+            "errors": self.errors,
+        }
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval.total_seconds()
+            while len(batch) < self.batch_size:
+                try:
+                    record = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if record is _STOP:
+                    stopping = True
+                    break
+                batch.append(record)
+            self._commit(batch)
+
+        if self._file is not None:
+            try:
+                if self._unsynced and self.fsync != "never":
+                    self._sync(time.monotonic())
+            except OSError as exc:
+                self.errors += 1
+                logger.warning("Failed to sync audit log: %s", exc)
+            finally:
+                self._file.close()
+                self._file = None
+
+    def _commit(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write("".join(json.dumps(record) + "\n" for record in batch))
+            self._file.flush()
+            self._unsynced = True
+            now = time.monotonic()
+            if self.fsync == "batch" or (
+                self.fsync == "interval" and now - self._last_fsync >= self.fsync_interval.total_seconds()
+            ):
+                self._sync(now)
+            self.written += len(batch)
+            self.batches += 1
+        except (OSError, TypeError, ValueError) as exc:
+            # Reopen on the next batch in case the file was moved or the disk recovered.
+            self.errors += 1
+            logger.warning("Failed to write audit log: %s", exc)
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _sync(self, now: float) -> None:
+        assert self._file is not None
+        os.fsync(self._file.fileno())
+        self._last_fsync = now
+        self._unsynced = False
+        self.fsyncs += 1
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def read_recent_audit_lines(path: str | Path, *, max_bytes: int = 4 * 1024 * 1024) -> list[str]:
+    """Return complete lines from the last ``max_bytes`` of the audit log (empty if missing)."""
+
+    path = Path(path)
+    try:
+        with path.open("rb") as f:
+            size = f.seek(0, 2)
+            start = max(0, size - max_bytes)
+            f.seek(start)
+            chunk = f.read()
+    except OSError:
+        return []
+
+    lines = chunk.decode("utf-8", errors="replace").splitlines()
+    # The first line is probably cut in half when we didn't start at the beginning.
+    return lines[1:] if start > 0 else lines
+
+
+def warmup_targets(
+    audit_lines: list[str],
+    catalog: Mapping[str, Mapping[str, Any]],
+    *,
+    limit: int = 500,
+) -> list[dict[str, str]]:
+    """Pick suppliers to pre-score: most frequent in the audit log first, then the catalog."""
+
+    counts: Counter[tuple[str, str]] = Counter()
+    for line in audit_lines:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        supplier_id = event.get("supplier_id")
+        if not supplier_id or supplier_id == "unknown":
+            continue
+        industry = (event.get("metadata") or {}).get("industry")
+        if not industry:
+            industry = (catalog.get(supplier_id) or {}).get("industry", "general")
+        counts[(str(supplier_id), str(industry))] += 1
+
+    targets = [pair for pair, _ in counts.most_common()]
+    seen = set(targets)
+    for supplier_id, info in catalog.items():
+        pair = (supplier_id, str(info.get("industry", "general")))
+        if pair not in seen:
+            targets.append(pair)
+            seen.add(pair)
+
+    return [{"supplier_id": s, "industry": i} for s, i in targets[:limit]]
+
+
+class CacheWarmer:
+    """Pre-scores suppliers through a risk skill with bounded concurrency.
+
+    ``ready`` turns true once ``ready_fraction`` of the targets have been
+    warmed (or the warm-up finished), so rollouts can gate traffic on it.
+    ``execute`` answers with fallback defaults or a PARTIAL result rather than
+    raising when upstreams fail; such results count as failed, not warmed.
+    """
+
+    def __init__(self, skill: Any, *, concurrency: int = 8, ready_fraction: float = 0.9) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        if not 0.0 <= ready_fraction <= 1.0:
+            raise ValueError("ready_fraction must be between 0 and 1")
+
+        self._skill = skill
+        self._concurrency = concurrency
+        self._ready_fraction = ready_fraction
+        self._ready = asyncio.Event()
+        self.total = 0
+        self.completed = 0
+        self.warmed = 0
+        self.failed = 0
+        self.finished = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait_ready(self) -> None:
+        await self._ready.wait()
+
+    async def run(self, targets: list[dict[str, str]]) -> None:
+        self.total = len(targets)
+        self._check_ready()
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _warm(target: dict[str, str]) -> None:
+            async with semaphore:
+                try:
+                    result = await self._skill.execute(target)
+                except Exception as exc:  # noqa: BLE001
+                    self.failed += 1
+                    logger.warning("Cache warm-up failed for %s: %s", target.get("supplier_id"), exc)
+                else:
+                    if _is_degraded(result):
+                        self.failed += 1
+                        logger.debug("Cache warm-up for %s used fallback data", target.get("supplier_id"))
+                    else:
+                        self.warmed += 1
+                finally:
+                    self.completed += 1
+                    self._check_ready()
+
+        try:
+            await asyncio.gather(*(_warm(t) for t in targets))
+        finally:
+            self.finished = True
+            self._ready.set()
+            logger.info("Cache warm-up finished: %s/%s warmed, %s failed", self.warmed, self.total, self.failed)
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "total": self.total,
+            "completed": self.completed,
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "warm_fraction": round(self.warmed / self.total, 4) if self.total else 1.0,
+            "ready_fraction": self._ready_fraction,
+        }
+
+    def _check_ready(self) -> None:
+        if not self.total or self.warmed / self.total >= self._ready_fraction:
+            self._ready.set()
+
+
+def _is_degraded(result: Any) -> bool:
+    """True for results scored from fallback defaults, which the skill doesn't keep cached."""
+
+    metadata = (result.get("metadata") if isinstance(result, Mapping) else None) or {}
+    return bool(metadata.get("fallback_mode") or metadata.get("defaults_used") or metadata.get("status") == "PARTIAL")
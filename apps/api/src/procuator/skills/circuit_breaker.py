@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for an upstream dependency.
+
+    - CLOSED: calls pass through; ``failure_threshold`` consecutive failures open the circuit.
+    - OPEN: calls are rejected without touching the upstream until ``reset_timeout`` elapses.
+    - HALF_OPEN: a single probe call is let through; success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: timedelta = timedelta(seconds=30),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: datetime | None = None
+        self._probe_in_flight = False
+        self._probe_started_at: datetime | None = None
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._opened_at is not None:
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may go to the upstream now."""
+
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN:
+            now = self._clock()
+            # A probe that never reported back (e.g. its caller was cancelled) must not wedge the circuit.
+            probe_lost = self._probe_started_at is not None and now - self._probe_started_at >= self.reset_timeout
+            if not self._probe_in_flight or probe_lost:
+                self._probe_in_flight = True
+                self._probe_started_at = now
+                return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.times_opened += 1
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+            self._probe_in_flight = False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_timeout_seconds": self.reset_timeout.total_seconds(),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
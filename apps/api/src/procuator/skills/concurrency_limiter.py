@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any
+
+
+class ConcurrencyLimitExceeded(RuntimeError):
+    """Raised when a call is shed because the wait queue is full or the wait took too long."""
+
+
+def _always_overload(_: BaseException) -> bool:
+    return True
+
+
+async def wait_for_slot(waiters: deque[asyncio.Future[None]], timeout: timedelta, release: Callable[[], None]) -> bool:
+    """Queue on ``waiters`` until a slot is handed over, for at most ``timeout``.
+
+    Whoever frees a slot grants it by popping a waiter, counting the slot as in
+    use and setting the waiter's result. Returns False if the wait timed out. A
+    waiter cancelled after being granted a slot gives it back through ``release``.
+    """
+
+    fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    waiters.append(fut)
+    try:
+        await asyncio.wait_for(asyncio.shield(fut), timeout=timeout.total_seconds())
+    except TimeoutError:
+        if fut.done():
+            # Granted a slot just as the wait expired; take it rather than leak it.
+            return True
+        waiters.remove(fut)
+        return False
+    except asyncio.CancelledError:
+        if fut.done():
+            release()
+        else:
+            waiters.remove(fut)
+        raise
+    return True
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit for calls to an upstream dependency.
+
+    Calls run inside ``async with limiter.slot():``. A call that finishes within
+    ``latency_target`` grows the limit by ``1/limit`` (about +1 per window of
+    calls); a slow call or an overload error multiplies it by ``backoff``. Only
+    calls that started after the last decrease can shrink it again, so one burst
+    of failures halves the limit once instead of collapsing it to ``min_limit``.
+
+    Excess calls wait in a FIFO queue of up to ``max_queue`` entries for at most
+    ``queue_timeout``; beyond that they are shed with ``ConcurrencyLimitExceeded``.
+    ``is_overload`` decides which exceptions count against the limit (e.g. a 404
+    says nothing about upstream capacity).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        latency_target: timedelta = timedelta(seconds=1),
+        backoff: float = 0.5,
+        max_queue: int = 200,
+        queue_timeout: timedelta = timedelta(seconds=2),
+        is_overload: Callable[[BaseException], bool] = _always_overload,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be between 0 and 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._is_overload = is_overload
+        self._timer = timer
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._last_decrease = float("-inf")
+
+        self.successes = 0
+        self.overloads = 0
+        self.shed = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self._acquire()
+        started = self._timer()
+        try:
+            yield
+        except BaseException as exc:
+            overloaded = not isinstance(exc, asyncio.CancelledError) and self._is_overload(exc)
+            self._release(started, overloaded=overloaded)
+            raise
+        self._release(started, overloaded=False)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue": self.max_queue,
+            "latency_target_ms": round(self.latency_target.total_seconds() * 1000),
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "shed": self.shed,
+        }
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.shed += 1
+            raise ConcurrencyLimitExceeded("upstream concurrency limit reached and wait queue is full")
+
+        if not await wait_for_slot(self._waiters, self.queue_timeout, self._give_back):
+            self.shed += 1
+            raise ConcurrencyLimitExceeded("timed out waiting for an upstream concurrency slot")
+
+    def _give_back(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+
+    def _release(self, started: float, *, overloaded: bool) -> None:
+        self._in_flight -= 1
+        latency = self._timer() - started
+
+        if overloaded or latency > self.latency_target.total_seconds():
+            self.overloads += 1
+            if started > self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                self._last_decrease = self._timer()
+        else:
+            self.successes += 1
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+        self._wake()
+
+    def _wake(self) -> None:
+        # Hand slots straight to waiters; in_flight is incremented on their behalf.
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._in_flight += 1
+                fut.set_result(None)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
 import os
+from array import array
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from procuator.skills.audit_writer import AuditLogWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,32 +34,298 @@ class AuditEvent:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class AuditEventRing:
+    """Fixed-capacity ring buffer of audit events.
+
+    ``append`` is O(1) and overwrites the oldest event once the ring is full.
+    Iteration yields oldest to newest over a snapshot taken when it starts.
+    The ``*_counts``/``risk_score_stats`` aggregates back the auditor's analytics.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._start = 0
+        self._size = 0
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[AuditEvent]:
+        items = (
+            self._items[: self._size]
+            if self._size < self.capacity
+            else self._items[self._start :] + self._items[: self._start]
+        )
+        return iter(items)  # type: ignore[arg-type]  # every slot up to _size is filled
+
+    @property
+    def full(self) -> bool:
+        return self._size == self.capacity
+
+    def append(self, event: AuditEvent) -> None:
+        if self._size < self.capacity:
+            self._store((self._start + self._size) % self.capacity, event)
+            self._size += 1
+        else:
+            self._release(self._start)
+            self._store(self._start, event)
+            self._start = (self._start + 1) % self.capacity
+
+    def oldest(self) -> AuditEvent | None:
+        return self._load(self._start) if self._size else None
+
+    def decision_counts(self) -> dict[str, int]:
+        return dict(Counter(e.decision for e in self))
+
+    def flag_counts(self) -> dict[str, int]:
+        counts: Counter[str] = Counter()
+        for e in self:
+            counts.update(e.policy_flags or ())
+            counts.update(e.risk_flags or ())
+        return dict(counts)
+
+    def risk_score_stats(self) -> tuple[float, int]:
+        scores = [float(e.risk_score) for e in self if isinstance(e.risk_score, (int, float))]
+        return sum(scores), len(scores)
+
+    def _allocate(self, capacity: int) -> None:
+        self._items: list[AuditEvent | None] = [None] * capacity
+
+    def _store(self, pos: int, event: AuditEvent) -> None:
+        self._items[pos] = event
+
+    def _load(self, pos: int) -> AuditEvent:
+        event = self._items[pos]
+        assert event is not None
+        return event
+
+    def _release(self, pos: int) -> None:
+        self._items[pos] = None
+
+
+class _RefCountedInterner:
+    """Maps repeated values to small integer codes; a code is freed once no slot uses it."""
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self._codes: dict[Any, int] = {}
+        self._refs: list[int] = []
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def acquire(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            if self._free:
+                code = self._free.pop()
+                self.values[code], self._refs[code] = value, 0
+            else:
+                code = len(self.values)
+                self.values.append(value)
+                self._refs.append(0)
+            self._codes[value] = code
+        self._refs[code] += 1
+        return code
+
+    def release(self, code: int) -> None:
+        self._refs[code] -= 1
+        if not self._refs[code]:
+            del self._codes[self.values[code]]
+            self.values[code] = None
+            self._free.append(code)
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_INTERNED_FIELDS = (
+    "event_type",
+    "supplier_id",
+    "decision",
+    "risk_level",
+    "policy_decision",
+    "policy_flags",
+    "risk_flags",
+    "explanation",
+    "metadata",
+)
+
+
+class ColumnarAuditEventRing(AuditEventRing):
+    """``AuditEventRing`` stored column by column in typed arrays.
+
+    Repetitive fields (decision, supplier, flags, explanation, metadata...) are
+    interned into 4-byte codes, ``risk_score`` is a float64 column (NaN for
+    None) and ``created_at`` is int64 microseconds, normalised to UTC ISO-8601
+    on read. Only ``request_id`` stays a Python object per event. Events are
+    rebuilt on read, and the aggregates count codes rather than events, so a
+    million-event ring costs tens of megabytes instead of a million objects.
+    """
+
+    def _allocate(self, capacity: int) -> None:
+        self._interners = {name: _RefCountedInterner() for name in _INTERNED_FIELDS}
+        self._codes = {name: array("I", [0]) * capacity for name in _INTERNED_FIELDS}
+        self._risk_scores = array("d", [math.nan]) * capacity
+        self._created_us = array("q", [0]) * capacity
+        self._request_ids: list[str | None] = [None] * capacity
+
+    def __iter__(self) -> Iterator[AuditEvent]:
+        if self._size < self.capacity:
+            positions = list(range(self._size))
+        else:
+            positions = [*range(self._start, self.capacity), *range(self._start)]
+        return (self._load(pos) for pos in positions)
+
+    def decision_counts(self) -> dict[str, int]:
+        values = self._interners["decision"].values
+        return {values[code]: n for code, n in Counter(self._column("decision")).items()}
+
+    def flag_counts(self) -> dict[str, int]:
+        counts: Counter[str] = Counter()
+        for name in ("policy_flags", "risk_flags"):
+            values = self._interners[name].values
+            for code, n in Counter(self._column(name)).items():
+                for flag in values[code]:
+                    counts[flag] += n
+        return dict(counts)
+
+    def risk_score_stats(self) -> tuple[float, int]:
+        scores = [x for x in self._valid(self._risk_scores) if not math.isnan(x)]
+        return math.fsum(scores), len(scores)
+
+    def _column(self, name: str) -> array[int]:
+        return self._valid(self._codes[name])
+
+    def _valid(self, column: array[Any]) -> array[Any]:
+        # Order doesn't matter for aggregates; slots past _size are unused until the ring fills.
+        return column if self._size == self.capacity else column[: self._size]
+
+    def _store(self, pos: int, event: AuditEvent) -> None:
+        values = {
+            "event_type": event.event_type,
+            "supplier_id": event.supplier_id,
+            "decision": event.decision,
+            "risk_level": event.risk_level,
+            "policy_decision": event.policy_decision,
+            "policy_flags": tuple(event.policy_flags or ()),
+            "risk_flags": tuple(event.risk_flags or ()),
+            "explanation": tuple(event.explanation or ()),
+            "metadata": json.dumps(event.metadata or {}, sort_keys=True, default=str),
+        }
+        for name, value in values.items():
+            self._codes[name][pos] = self._interners[name].acquire(value)
+        self._risk_scores[pos] = math.nan if event.risk_score is None else float(event.risk_score)
+        created = datetime.fromisoformat(event.created_at)
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=UTC)
+        self._created_us[pos] = (created - _EPOCH) // timedelta(microseconds=1)
+        self._request_ids[pos] = event.request_id
+
+    def _load(self, pos: int) -> AuditEvent:
+        value = {name: self._interners[name].values[self._codes[name][pos]] for name in _INTERNED_FIELDS}
+        risk_score = self._risk_scores[pos]
+        request_id = self._request_ids[pos]
+        assert request_id is not None
+        return AuditEvent(
+            event_type=value["event_type"],
+            request_id=request_id,
+            supplier_id=value["supplier_id"],
+            decision=value["decision"],
+            explanation=list(value["explanation"]),
+            risk_score=None if math.isnan(risk_score) else risk_score,
+            risk_level=value["risk_level"],
+            policy_decision=value["policy_decision"],
+            policy_flags=list(value["policy_flags"]),
+            risk_flags=list(value["risk_flags"]),
+            created_at=(_EPOCH + timedelta(microseconds=self._created_us[pos])).isoformat(),
+            metadata=json.loads(value["metadata"]),
+        )
+
+    def _release(self, pos: int) -> None:
+        for name in _INTERNED_FIELDS:
+            self._interners[name].release(self._codes[name][pos])
+        self._request_ids[pos] = None
+
+
+class AuditSubscription:
+    """Bounded buffer of audit stream messages for one subscriber.
+
+    A subscriber that falls behind loses the oldest messages (counted in
+    ``dropped``) rather than holding memory or slowing ``record`` down.
+    """
+
+    def __init__(self, auditor: DecisionAuditor, *, max_buffer: int) -> None:
+        self._auditor = auditor
+        self._buffer: deque[dict[str, Any]] = deque(maxlen=max_buffer)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def push(self, message: dict[str, Any]) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(message)
+        self._ready.set()
+
+    async def get(self) -> dict[str, Any]:
+        while not self._buffer:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._buffer.popleft()
+
+    def close(self) -> None:
+        self._auditor._subscribers.discard(self)
+
+
 class DecisionAuditor:
     """Simple audit trail recorder.
 
     Writes JSONL to disk (best-effort) and keeps an in-memory ring buffer for dashboards.
+    Subscribers get each recorded event with the change it makes to the ``counters``
+    of the buffer (the new event counted in, the evicted one counted out).
     """
 
     name = "decision_auditor"
     version = "0.1.0"
     description = "Records procurement decisions for audit and analytics"
 
-    def __init__(self, *, max_events: int = 1000) -> None:
-        self._events: list[AuditEvent] = []
-        self._max_events = max_events
+    def __init__(self, *, max_events: int = 1000, writer: AuditLogWriter | None = None, columnar: bool = False) -> None:
+        self._events = ColumnarAuditEventRing(max_events) if columnar else AuditEventRing(max_events)
+        # Without a writer each record is appended synchronously to AUDIT_LOG_PATH.
+        self.writer = writer
+        self._subscribers: set[AuditSubscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, *, max_buffer: int = 256) -> AuditSubscription:
+        subscription = AuditSubscription(self, max_buffer=max_buffer)
+        self._subscribers.add(subscription)
+        return subscription
 
     def record(self, event: AuditEvent) -> None:
+        # Only subscribers need the evicted event (for their delta); don't rebuild it otherwise.
+        evicted = self._events.oldest() if self._subscribers and self._events.full else None
         self._events.append(event)
-        if len(self._events) > self._max_events:
-            self._events = self._events[-self._max_events :]
 
-        path = os.getenv("AUDIT_LOG_PATH", "audit.jsonl")
-        try:
-            Path(path).parent.mkdir(parents=True, exist_ok=True)
-            with Path(path).open("a", encoding="utf-8") as f:
-                f.write(json.dumps(event.__dict__) + "\n")
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to write audit log: %s", exc)
+        if self._subscribers:
+            message = {"event": event.__dict__, "delta": self._delta(event, evicted)}
+            for subscription in self._subscribers:
+                subscription.push(message)
+
+        if self.writer is not None:
+            self.writer.write(event.__dict__)
+        else:
+            path = os.getenv("AUDIT_LOG_PATH", "audit.jsonl")
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                with Path(path).open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(event.__dict__) + "\n")
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to write audit log: %s", exc)
 
         logger.info(
             "AUDIT decision=%s request_id=%s supplier_id=%s risk=%s policy=%s",
@@ -67,21 +340,10 @@ class DecisionAuditor:
         return [e.__dict__ for e in self._events]
 
     def analytics(self) -> dict[str, Any]:
-        counts: dict[str, int] = {}
-        for e in self._events:
-            counts[e.decision] = counts.get(e.decision, 0) + 1
-
-        avg_risk = None
-        risk_scores = [e.risk_score for e in self._events if isinstance(e.risk_score, (int, float))]
-        if risk_scores:
-            avg_risk = sum(float(x) for x in risk_scores) / len(risk_scores)
-
-        top_flags: dict[str, int] = {}
-        for e in self._events:
-            for flag in (e.policy_flags or []) + (e.risk_flags or []):
-                top_flags[flag] = top_flags.get(flag, 0) + 1
-
-        top_flags_sorted = sorted(top_flags.items(), key=lambda kv: kv[1], reverse=True)[:10]
+        counts = self._events.decision_counts()
+        risk_sum, risk_count = self._events.risk_score_stats()
+        avg_risk = risk_sum / risk_count if risk_count else None
+        top_flags_sorted = sorted(self._events.flag_counts().items(), key=lambda kv: kv[1], reverse=True)[:10]
 
         return {
             "total": len(self._events),
@@ -90,6 +352,43 @@ class DecisionAuditor:
             "top_flags": [{"flag": k, "count": v} for k, v in top_flags_sorted],
         }
 
+    def counters(self) -> dict[str, Any]:
+        """Additive counters over the buffer; stream ``delta`` messages apply to these."""
+
+        risk_sum, risk_count = self._events.risk_score_stats()
+        return {
+            "total": len(self._events),
+            "counts_by_decision": self._events.decision_counts(),
+            "flag_counts": self._events.flag_counts(),
+            "risk_score_sum": risk_sum,
+            "risk_score_count": risk_count,
+        }
+
+    @classmethod
+    def _delta(cls, added: AuditEvent, evicted: AuditEvent | None) -> dict[str, Any]:
+        signed = [(added, 1)] if evicted is None else [(added, 1), (evicted, -1)]
+        return {"total": 1 if evicted is None else 0, **cls._tally(signed)}
+
+    @staticmethod
+    def _tally(signed: Iterable[tuple[AuditEvent, int]]) -> dict[str, Any]:
+        counts: dict[str, int] = {}
+        flag_counts: dict[str, int] = {}
+        risk_sum, risk_count = 0.0, 0
+        for e, sign in signed:
+            counts[e.decision] = counts.get(e.decision, 0) + sign
+            for flag in (e.policy_flags or []) + (e.risk_flags or []):
+                flag_counts[flag] = flag_counts.get(flag, 0) + sign
+            if isinstance(e.risk_score, (int, float)):
+                risk_sum += sign * float(e.risk_score)
+                risk_count += sign
+
+        return {
+            "counts_by_decision": {k: v for k, v in counts.items() if v},
+            "flag_counts": {k: v for k, v in flag_counts.items() if v},
+            "risk_score_sum": risk_sum,
+            "risk_score_count": risk_count,
+        }
+
     async def execute(self, inputs: dict[str, Any], context: dict[str, Any] | None = None) -> dict[str, Any]:
         _ = context
         event = AuditEvent(
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class RequestBatcher:
+    """Collects single-key lookups for a short window and resolves them with one bulk call.
+
+    ``fetch_many`` receives the distinct keys of a batch and returns a mapping of
+    key to result. Keys missing from that mapping fail with ``LookupError``; if
+    ``fetch_many`` raises, every caller in the batch gets the exception.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list[str]], Awaitable[dict[str, Any]]],
+        *,
+        window: float = 0.01,
+        max_batch: int = 50,
+    ) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+
+        self._fetch_many = fetch_many
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[str, list[asyncio.Future[Any]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+        self.batches = 0
+        self.keys_requested = 0
+
+    async def fetch(self, key: str) -> Any:
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[Any] = loop.create_future()
+        self._pending.setdefault(key, []).append(fut)
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        return await fut
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "keys_requested": self.keys_requested,
+            "avg_batch_size": round(self.keys_requested / self.batches, 2) if self.batches else None,
+            "pending": len(self._pending),
+        }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, list[asyncio.Future[Any]]]) -> None:
+        self.batches += 1
+        self.keys_requested += len(batch)
+        try:
+            results = await self._fetch_many(list(batch))
+        except Exception as exc:  # noqa: BLE001
+            for futures in batch.values():
+                for fut in futures:
+                    if not fut.done():
+                        fut.set_exception(exc)
+            return
+
+        for key, futures in batch.items():
+            for fut in futures:
+                if fut.done():
+                    continue
+                if key in results:
+                    fut.set_result(results[key])
+                else:
+                    fut.set_exception(LookupError(f"{key} missing from bulk response"))
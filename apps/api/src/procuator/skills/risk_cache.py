@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class FrozenDict(dict[str, Any]):
+    """Read-only dict for cached results shared between callers.
+
+    Subclassing dict keeps ``isinstance(x, dict)``, ``json.dumps`` and ``{**x}`` working;
+    copies made that way are plain, mutable dicts.
+    """
+
+    def _readonly(self, *_: Any, **__: Any) -> Any:
+        raise TypeError("cached risk results are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+
+    if isinstance(value, dict):
+        return FrozenDict({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def encode_json(data: Any) -> bytes:
+    # Same settings as Starlette's JSONResponse, so cached bytes can be sent as-is.
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    timestamp: datetime
+    data: dict[str, Any]
+    size: int = 0
+    encoded: bytes = b""
+
+    def json(self) -> bytes:
+        """The entry's JSON encoding, pre-computed for cached entries."""
+
+        return self.encoded or encode_json(self.data)
+
+
+class RiskCache:
+    """Bounded LRU cache with TTL expiry for risk results.
+
+    Entries are evicted least-recently-used first once either ``max_entries``
+    or ``max_bytes`` is exceeded. Cached data is frozen and stored with its
+    JSON encoding, which is what the API sends on the wire and what the byte
+    budget counts. Expired entries are dropped on access and by periodic sweeps that
+    run opportunistically on writes (at most once per ``sweep_interval``).
+    """
+
+    backend = "memory"
+
+    def __init__(
+        self,
+        *,
+        ttl: timedelta = timedelta(hours=1),
+        max_entries: int = 10_000,
+        max_bytes: int = 64 * 1024 * 1024,
+        sweep_interval: timedelta = timedelta(minutes=1),
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._last_sweep = clock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if self._is_expired(entry, self._clock()):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, data: dict[str, Any]) -> CacheEntry:
+        now = self._clock()
+        if now - self._last_sweep >= self._sweep_interval:
+            self.sweep()
+
+        encoded = encode_json(data)
+        entry = CacheEntry(timestamp=now, data=freeze(data), size=len(encoded), encoded=encoded)
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+
+        # Always keep the newest entry, even if it alone exceeds the byte budget.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+        return entry
+
+    def invalidate(self, key: str) -> bool:
+        return self._remove(key) is not None
+
+    def close(self) -> None:
+        """Release external resources (none for the in-memory cache)."""
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def sweep(self) -> int:
+        """Drop all expired entries and return how many were removed."""
+
+        now = self._clock()
+        self._last_sweep = now
+        expired = [key for key, entry in self._entries.items() if self._is_expired(entry, now)]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "entries": len(self),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl.total_seconds(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _is_expired(self, entry: CacheEntry, now: datetime) -> bool:
+        return now - entry.timestamp >= self.ttl
+
+    def _remove(self, key: str) -> CacheEntry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+
+class SQLiteRiskCache(RiskCache):
+    """Risk cache shared by all worker processes on a node, backed by SQLite in WAL mode.
+
+    TTL semantics match the in-memory cache. Eviction is oldest-written-first and
+    bounds are enforced during the periodic sweep, so reads never write. Storage
+    errors are logged and treated as misses rather than failing the risk check.
+    Hit/miss counters are per process; entry and byte counts reflect the shared file.
+
+    Lookups run on the caller's (event loop) thread, so they wait at most
+    ``busy_timeout`` for another worker's write lock and count as ``busy``
+    misses after that. The sweep's full-table scans run in a background thread
+    on their own connection, which may wait up to ``sweep_busy_timeout``.
+    """
+
+    backend = "sqlite"
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        busy_timeout: float = 0.005,
+        sweep_busy_timeout: float = 5.0,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self.sweep_busy_timeout = sweep_busy_timeout
+        self._conn: sqlite3.Connection | None = None
+        self._sweeper: threading.Thread | None = None
+        self.busy = 0
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS risk_cache "
+            "(key TEXT PRIMARY KEY, timestamp REAL NOT NULL, size INTEGER NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS risk_cache_timestamp ON risk_cache (timestamp)")
+
+    def __len__(self) -> int:
+        row = self._fetchone("SELECT COUNT(*) FROM risk_cache")
+        return int(row[0]) if row else 0
+
+    def __contains__(self, key: object) -> bool:
+        return self._fetchone("SELECT 1 FROM risk_cache WHERE key = ?", (key,)) is not None
+
+    @property
+    def bytes(self) -> int:
+        row = self._fetchone("SELECT COALESCE(SUM(size), 0) FROM risk_cache")
+        return int(row[0]) if row else 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        row = self._fetchone("SELECT timestamp, size, data FROM risk_cache WHERE key = ?", (key,))
+        if row is None:
+            self.misses += 1
+            return None
+
+        entry = CacheEntry(
+            timestamp=datetime.fromtimestamp(row[0]),
+            data=freeze(json.loads(row[2])),
+            size=row[1],
+            encoded=row[2].encode("utf-8"),
+        )
+        if self._is_expired(entry, self._clock()):
+            # Guard on timestamp so we don't delete a fresh value another worker just wrote.
+            self._execute("DELETE FROM risk_cache WHERE key = ? AND timestamp = ?", (key, row[0]))
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, data: dict[str, Any]) -> CacheEntry:
+        now = self._clock()
+        if now - self._last_sweep >= self._sweep_interval:
+            self._sweep_in_background(now)
+
+        encoded = encode_json(data)
+        entry = CacheEntry(timestamp=now, data=freeze(data), size=len(encoded), encoded=encoded)
+        self._execute(
+            "INSERT OR REPLACE INTO risk_cache (key, timestamp, size, data) VALUES (?, ?, ?, ?)",
+            (key, now.timestamp(), entry.size, encoded.decode("utf-8")),
+        )
+        return entry
+
+    def invalidate(self, key: str) -> bool:
+        return self._execute("DELETE FROM risk_cache WHERE key = ?", (key,)) > 0
+
+    def clear(self) -> None:
+        self._execute("DELETE FROM risk_cache")
+
+    def sweep(self) -> int:
+        """Drop expired entries, then evict the oldest until within bounds (blocking)."""
+
+        now = self._clock()
+        self._last_sweep = now
+        conn = self._connect(self.sweep_busy_timeout)
+        try:
+            expired = conn.execute("DELETE FROM risk_cache WHERE timestamp <= ?", ((now - self.ttl).timestamp(),))
+            self.expirations += max(expired.rowcount, 0)
+
+            count, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM risk_cache").fetchone()
+            over_count = count - self.max_entries
+            if over_count > 0:
+                evicted = conn.execute(
+                    "DELETE FROM risk_cache WHERE key IN (SELECT key FROM risk_cache ORDER BY timestamp LIMIT ?)",
+                    (over_count,),
+                )
+                self.evictions += max(evicted.rowcount, 0)
+                size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM risk_cache").fetchone()[0]
+
+            over_bytes = size - self.max_bytes
+            if over_bytes > 0:
+                # Oldest rows whose cumulative size is needed to cover the overage.
+                evicted = conn.execute(
+                    "DELETE FROM risk_cache WHERE key IN ("
+                    " SELECT key FROM ("
+                    "  SELECT key, size, SUM(size) OVER (ORDER BY timestamp, key ROWS UNBOUNDED PRECEDING) AS running"
+                    "  FROM risk_cache"
+                    " ) WHERE running - size < ?"
+                    ")",
+                    (over_bytes,),
+                )
+                self.evictions += max(evicted.rowcount, 0)
+            return max(expired.rowcount, 0)
+        except sqlite3.Error as exc:
+            logger.warning("Shared risk cache sweep failed: %s", exc)
+            return 0
+        finally:
+            conn.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {**super().stats(), "busy": self.busy}
+
+    def close(self) -> None:
+        """Close the connection; the next lookup reopens it."""
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = self._connect(self.busy_timeout)
+        return self._conn
+
+    def _sweep_in_background(self, now: datetime) -> None:
+        # The sweep scans the whole table and may wait on other workers' locks; keep it off the caller.
+        self._last_sweep = now
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._sweeper = threading.Thread(target=self.sweep, name="risk-cache-sweep", daemon=True)
+        self._sweeper.start()
+
+    def _fetchone(self, sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+        try:
+            return self._connection().execute(sql, params).fetchone()
+        except sqlite3.Error as exc:
+            self._failed("read", exc)
+            return None
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> int:
+        try:
+            return max(self._connection().execute(sql, params).rowcount, 0)
+        except sqlite3.Error as exc:
+            self._failed("write", exc)
+            return 0
+
+    def _failed(self, operation: str, exc: sqlite3.Error) -> None:
+        # Another worker holding the lock is routine under load; count it instead of logging each one.
+        if getattr(exc, "sqlite_errorcode", None) in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED):
+            self.busy += 1
+        else:
+            logger.warning("Shared risk cache %s failed: %s", operation, exc)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+
+def content_digest(data: Any) -> str:
+    """Stable hash of JSON-like data, independent of dict key order."""
+
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+@dataclass
+class _SupplierHistory:
+    digests: dict[str, str]
+    result: Mapping[str, Any]
+    points: deque[dict[str, Any]] = field(default_factory=deque)
+
+
+class RiskHistory:
+    """Per-supplier record of scored inputs and the risk scores they produced.
+
+    ``latest`` returns the component input digests and result of the last
+    assessment so callers can skip re-scoring unchanged inputs. ``record`` adds
+    a point only when the score, level or any input changed; otherwise it just
+    moves the last point's ``last_seen`` forward. Each supplier keeps up to
+    ``max_points`` points and the least recently scored suppliers are dropped
+    beyond ``max_suppliers``.
+    """
+
+    def __init__(self, *, max_suppliers: int = 10_000, max_points: int = 100) -> None:
+        if max_suppliers <= 0 or max_points <= 0:
+            raise ValueError("max_suppliers and max_points must be positive")
+
+        self.max_suppliers = max_suppliers
+        self.max_points = max_points
+        self._suppliers: OrderedDict[str, _SupplierHistory] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._suppliers)
+
+    def latest(self, key: str) -> tuple[dict[str, str], Mapping[str, Any]] | None:
+        history = self._suppliers.get(key)
+        if history is None:
+            return None
+        return history.digests, history.result
+
+    def record(self, key: str, digests: dict[str, str], result: Mapping[str, Any], *, at: datetime) -> bool:
+        """Store the latest assessment; returns True if it added a history point."""
+
+        history = self._suppliers.get(key)
+        if history is None:
+            history = self._suppliers[key] = _SupplierHistory(digests, result, deque(maxlen=self.max_points))
+            changed = sorted(digests)
+        else:
+            changed = sorted(name for name, digest in digests.items() if history.digests.get(name) != digest)
+            history.digests, history.result = digests, result
+        self._suppliers.move_to_end(key)
+        while len(self._suppliers) > self.max_suppliers:
+            self._suppliers.popitem(last=False)
+
+        last = history.points[-1] if history.points else None
+        if (
+            last is not None
+            and not changed
+            and last["risk_score"] == result["risk_score"]
+            and last["risk_level"] == result["risk_level"]
+        ):
+            last["last_seen"] = at.isoformat()
+            return False
+
+        history.points.append(
+            {
+                "timestamp": at.isoformat(),
+                "last_seen": at.isoformat(),
+                "risk_score": result["risk_score"],
+                "risk_level": result["risk_level"],
+                "component_scores": dict(result["component_scores"]),
+                "changed_inputs": changed,
+            }
+        )
+        return True
+
+    def points(self, key: str, *, limit: int | None = None) -> list[dict[str, Any]]:
+        history = self._suppliers.get(key)
+        if history is None:
+            return []
+        points = list(history.points)
+        return [dict(p) for p in (points[-limit:] if limit else points)]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "suppliers": len(self._suppliers),
+            "points": sum(len(h.points) for h in self._suppliers.values()),
+            "max_suppliers": self.max_suppliers,
+            "max_points": self.max_points,
+        }
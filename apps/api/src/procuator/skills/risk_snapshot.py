@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from procuator.skills.risk_cache import CacheEntry, encode_json, freeze
+
+logger = logging.getLogger(__name__)
+
+# File layout (little-endian):
+#   header | JSON string tables | records (sorted by key) | hash index (u32 record number + 1, 0 = empty)
+# Records are fixed width: a NUL-padded "supplier_id\x1findustry" key followed by the scores and
+# indexes into the interned tables, so a lookup is one hash probe plus one slice of the mapped file.
+MAGIC = b"PRCSNAP1"
+_HEADER = struct.Struct("<8sIIIId")
+_COMPONENTS = ("financial", "compliance", "operational", "market")
+MAX_FLAGS = 8
+MAX_RECOMMENDATIONS = 12
+_NONE = 0xFFFF
+_VALUES = struct.Struct(f"<6fBH{MAX_FLAGS}H{MAX_RECOMMENDATIONS}H")
+_SLOT = struct.Struct("<I")
+_KEY_SEPARATOR = "\x1f"
+
+
+def _key(supplier_id: str, industry: str) -> bytes:
+    return f"{supplier_id}{_KEY_SEPARATOR}{industry}".encode()
+
+
+def _slot_count(records: int) -> int:
+    # Power of two, at most half full, so linear probing stays short.
+    slots = 1
+    while slots < records * 2:
+        slots *= 2
+    return slots
+
+
+class _Interner:
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+        self._index: dict[str, int] = {}
+
+    def __call__(self, value: Any) -> int:
+        token = json.dumps(value, sort_keys=True, default=str)
+        index = self._index.get(token)
+        if index is None:
+            index = self._index[token] = len(self.values)
+            self.values.append(value)
+        return index
+
+
+def write_risk_snapshot(
+    path: str | Path,
+    results: Iterable[tuple[str, str, Mapping[str, Any]]],
+    *,
+    created_at: datetime | None = None,
+) -> Path:
+    """Write ``(supplier_id, industry, result)`` triples to a snapshot file, replacing it atomically.
+
+    Flags, recommendations, risk levels and metadata are interned into shared tables; a flag's
+    ``score`` is dropped and rebuilt on read from its component's score.
+    """
+
+    flags, recommendations, levels, metadata = _Interner(), _Interner(), _Interner(), _Interner()
+    rows: dict[bytes, tuple[Any, ...]] = {}
+    for supplier_id, industry, result in results:
+        result_flags = [{k: v for k, v in f.items() if k != "score"} for f in result.get("risk_flags") or ()]
+        result_recommendations = list(result.get("recommendations") or ())
+        if len(result_flags) > MAX_FLAGS or len(result_recommendations) > MAX_RECOMMENDATIONS:
+            raise ValueError(f"too many flags or recommendations to snapshot {supplier_id}")
+
+        scores = result["component_scores"]
+        flag_ids = [flags(f) for f in result_flags] + [_NONE] * (MAX_FLAGS - len(result_flags))
+        rec_ids = [recommendations(r) for r in result_recommendations]
+        rec_ids += [_NONE] * (MAX_RECOMMENDATIONS - len(rec_ids))
+        rows[_key(supplier_id, industry)] = (
+            float(result["risk_score"]),
+            *(float(scores[c]) for c in _COMPONENTS),
+            float(result.get("confidence", 0.0)),
+            levels(str(result.get("risk_level", "UNKNOWN"))),
+            metadata(dict(result.get("metadata") or {})),
+            *flag_ids,
+            *rec_ids,
+        )
+
+    keys = sorted(rows)
+    key_width = max((len(k) for k in keys), default=1)
+    record_size = key_width + _VALUES.size
+    tables = encode_json(
+        {
+            "flags": flags.values,
+            "recommendations": recommendations.values,
+            "levels": levels.values,
+            "metadata": metadata.values,
+        }
+    )
+
+    slots = _slot_count(len(keys))
+    index = bytearray(slots * _SLOT.size)
+    records = bytearray(len(keys) * record_size)
+    for n, key in enumerate(keys):
+        offset = n * record_size
+        records[offset : offset + len(key)] = key
+        _VALUES.pack_into(records, offset + key_width, *rows[key])
+        slot = zlib.crc32(key) & (slots - 1)
+        while _SLOT.unpack_from(index, slot * _SLOT.size)[0]:
+            slot = (slot + 1) & (slots - 1)
+        _SLOT.pack_into(index, slot * _SLOT.size, n + 1)
+
+    created = (created_at or datetime.now()).timestamp()
+    header = _HEADER.pack(MAGIC, key_width, len(keys), slots, len(tables), created)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(tables)
+            f.write(records)
+            f.write(index)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class RiskSnapshot:
+    """Read-only, memory-mapped view of a snapshot written by ``write_risk_snapshot``.
+
+    Lookups hash the key into the file's index, so they cost O(1) regardless of
+    snapshot size and only touch the pages they read. Snapshots older than
+    ``max_age`` are treated as misses so a failed nightly job degrades to live scoring;
+    a missing or unreadable file likewise leaves the snapshot empty (every lookup
+    misses) with a warning. ``refresh`` maps the current file, pairing with the
+    atomic replace on write, and keeps the mapped snapshot if the new file is unreadable.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_age: timedelta | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._map: mmap.mmap | None = None
+        self._count = 0
+        self.created_at = datetime.min
+        self._open()
+
+    def _open(self) -> bool:
+        try:
+            with self.path.open("rb") as f:
+                new_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:  # ValueError: empty file
+            logger.warning("Risk snapshot %s not loaded: %s", self.path, exc)
+            return False
+
+        try:
+            magic, key_width, count, slots, tables_len, created = _HEADER.unpack_from(new_map)
+            if magic != MAGIC:
+                raise ValueError("not a risk snapshot")
+            tables = json.loads(new_map[_HEADER.size : _HEADER.size + tables_len])
+            flags, recommendations = tables["flags"], tables["recommendations"]
+            levels, metadata = tables["levels"], tables["metadata"]
+            record_size = key_width + _VALUES.size
+            records_offset = _HEADER.size + tables_len
+            index_offset = records_offset + count * record_size
+            if slots <= 0 or slots & (slots - 1) or index_offset + slots * _SLOT.size > len(new_map):
+                raise ValueError("truncated or malformed index")
+        except (struct.error, ValueError, KeyError, TypeError) as exc:
+            new_map.close()
+            logger.warning("Risk snapshot %s not loaded: %s", self.path, exc)
+            return False
+
+        self._map = new_map
+        self._key_width, self._count, self._slots = key_width, count, slots
+        self.created_at = datetime.fromtimestamp(created)
+        self._flags: list[dict[str, Any]] = flags
+        self._recommendations: list[str] = recommendations
+        self._levels: list[str] = levels
+        self._metadata: list[dict[str, Any]] = metadata
+        self._record_size = record_size
+        self._records_offset = records_offset
+        self._index_offset = index_offset
+        return True
+
+    @property
+    def loaded(self) -> bool:
+        return self._map is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def refresh(self) -> None:
+        old_map = self._map
+        if self._open() and old_map is not None:
+            old_map.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._count = 0
+
+    def get(self, supplier_id: str, industry: str) -> CacheEntry | None:
+        if self._map is None:
+            self.misses += 1
+            return None
+        if self.max_age is not None and self._clock() - self.created_at > self.max_age:
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        key = _key(supplier_id, industry)
+        offset = self._find(key) if len(key) <= self._key_width else None
+        if offset is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        data = self._decode(supplier_id, self._map[offset + self._key_width : offset + self._record_size])
+        encoded = encode_json(data)
+        return CacheEntry(timestamp=self.created_at, data=freeze(data), size=len(encoded), encoded=encoded)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "loaded": self.loaded,
+            "records": self._count,
+            "created_at": self.created_at.isoformat() if self.loaded else None,
+            "max_age_seconds": self.max_age.total_seconds() if self.max_age is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def _find(self, key: bytes) -> int | None:
+        assert self._map is not None
+        padded = key.ljust(self._key_width, b"\0")
+        slot = zlib.crc32(key) & (self._slots - 1)
+        while True:
+            (record,) = _SLOT.unpack_from(self._map, self._index_offset + slot * _SLOT.size)
+            if not record:
+                return None
+            offset = self._records_offset + (record - 1) * self._record_size
+            if self._map[offset : offset + self._key_width] == padded:
+                return offset
+            slot = (slot + 1) & (self._slots - 1)
+
+    def _decode(self, supplier_id: str, raw: bytes) -> dict[str, Any]:
+        values = _VALUES.unpack(raw)
+        risk_score, *component_values, confidence = (round(v, 2) for v in values[:6])
+        level, metadata = values[6], values[7]
+        flag_ids = values[8 : 8 + MAX_FLAGS]
+        rec_ids = values[8 + MAX_FLAGS :]
+
+        scores = dict(zip(_COMPONENTS, component_values, strict=True))
+        flags = []
+        for flag_id in flag_ids:
+            if flag_id == _NONE:
+                break
+            flag = self._flags[flag_id]
+            flags.append({**flag, "score": scores.get(flag.get("component"), risk_score)})
+
+        return {
+            "risk_score": risk_score,
+            "risk_level": self._levels[level],
+            "component_scores": scores,
+            "risk_flags": flags,
+            "recommendations": [self._recommendations[r] for r in rec_ids if r != _NONE],
+            "confidence": confidence,
+            "last_updated": self.created_at.isoformat(),
+            "supplier_id": supplier_id,
+            "metadata": {
+                **self._metadata[metadata],
+                "source": "snapshot",
+                "snapshot_created_at": self.created_at.isoformat(),
+            },
+        }
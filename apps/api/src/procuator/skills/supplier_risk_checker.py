@@ -3,15 +3,42 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime, timedelta
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+from procuator.config import HttpPoolSettings
+from procuator.data.supplier_store import InMemorySupplierDataStore, SupplierDataStore
+from procuator.skills.circuit_breaker import CircuitBreaker
+from procuator.skills.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+from procuator.skills.request_batcher import RequestBatcher
+from procuator.skills.risk_cache import CacheEntry, RiskCache, SQLiteRiskCache
+from procuator.skills.risk_history import RiskHistory, content_digest
+from procuator.skills.risk_snapshot import RiskSnapshot
+
+if TYPE_CHECKING:
+    from procuator.skills.bulk_scoring import BulkScores
+
 logger = logging.getLogger(__name__)
 
 
+class FinancialApiError(RuntimeError):
+    def __init__(self, status: int) -> None:
+        super().__init__(f"Financial API error: {status}")
+        self.status = status
+
+
+def is_upstream_overload(exc: BaseException) -> bool:
+    """Whether a failed financial request suggests the provider is overloaded (shrink the limit)."""
+
+    if isinstance(exc, FinancialApiError):
+        return exc.status == 429 or exc.status >= 500
+    return True
+
+
 class Skill:
     """Minimal skill base class.
 
@@ -27,12 +54,6 @@ class Skill:
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
-class CacheEntry:
-    timestamp: datetime
-    data: dict[str, Any]
-
-
 class SupplierRiskChecker(Skill):
     """Computes a composite supplier risk score (0-10)."""
 
@@ -53,32 +74,254 @@ class SupplierRiskChecker(Skill):
         "high_risk": 0.0,
     }
 
-    def __init__(self, *, cache_ttl: timedelta = timedelta(hours=1)) -> None:
+    CREDIT_SCORES: dict[str, float] = {
+        "AAA": 2.0,
+        "AA": 1.5,
+        "A": 1.0,
+        "BBB": 0.5,
+        "BB": -0.5,
+        "B": -1.5,
+        "CCC": -3.0,
+        "D": -5.0,
+    }
+
+    COMPONENT_TTLS: dict[str, timedelta] = {
+        "financial": timedelta(hours=24),
+        "compliance": timedelta(hours=6),
+        "market": timedelta(hours=1),
+    }
+
+    def __init__(
+        self,
+        *,
+        cache_ttl: timedelta = timedelta(hours=1),
+        cache_hard_ttl: timedelta | None = None,
+        cache_max_entries: int = 10_000,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        cache_path: str | Path | None = None,
+        clock: Callable[[], datetime] = datetime.now,
+        financial_breaker: CircuitBreaker | None = None,
+        financial_limiter: AdaptiveConcurrencyLimiter | None = None,
+        negative_cache_ttl: timedelta = timedelta(seconds=60),
+        data_store: SupplierDataStore | None = None,
+        component_ttls: dict[str, timedelta] | None = None,
+        http_pool: HttpPoolSettings | None = None,
+        financial_bulk_window: timedelta | None = None,
+        financial_bulk_max: int = 50,
+        default_budget: timedelta | None = None,
+        snapshot: RiskSnapshot | None = None,
+    ) -> None:
+        # Results younger than cache_ttl are fresh. Between cache_ttl and cache_hard_ttl they are
+        # served stale while a background refresh runs; past cache_hard_ttl callers wait for a re-fetch.
         self._cache_ttl = cache_ttl
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache_hard_ttl = max(cache_hard_ttl or cache_ttl, cache_ttl)
+        self._clock = clock
+        cache_options: dict[str, Any] = {
+            "ttl": self._cache_hard_ttl,
+            "max_entries": cache_max_entries,
+            "max_bytes": cache_max_bytes,
+            "clock": clock,
+        }
+        # With cache_path set, all worker processes on the node share one cache file.
+        self._cache = SQLiteRiskCache(cache_path, **cache_options) if cache_path else RiskCache(**cache_options)
+        self._data_store = data_store or InMemorySupplierDataStore()
+        self._http_pool = http_pool or HttpPoolSettings()
         self._session: aiohttp.ClientSession | None = None
+        self._inflight: dict[str, asyncio.Future[CacheEntry]] = {}
+        self._coalesced = 0
+        self._stale_served = 0
+
+        # Callers may pass ``budget_ms``; otherwise default_budget (if any) bounds how long they wait.
+        # When it runs out the assessment keeps going in the background (and still fills the caches)
+        # while the caller gets a PARTIAL result built from the components already available.
+        self._default_budget = default_budget
+        self._partial_served = 0
+
+        # A precomputed snapshot (see ``procuator snapshot``) answers lookups without any fetches;
+        # live results only take over on a snapshot miss, an explicit refresh, or when newer.
+        self._snapshot = snapshot
+
+        # Input digests of the last assessment per supplier: unchanged inputs reuse the previous
+        # result instead of re-scoring, and only real changes are kept as history points.
+        self._history = RiskHistory(max_suppliers=cache_max_entries)
+        self._unchanged_inputs = 0
+
+        # Failed financial lookups are remembered briefly per supplier, and the breaker stops
+        # all outbound calls during an upstream outage, so fallback scoring returns immediately.
+        self._financial_breaker = financial_breaker or CircuitBreaker(clock=clock)
+        self._financial_failures = RiskCache(ttl=negative_cache_ttl, max_entries=cache_max_entries, clock=clock)
+        # Outbound financial requests share an adaptive concurrency limit so load spikes queue (or are
+        # shed to fallback scoring) instead of overrunning the provider's rate limit.
+        self._financial_limiter = financial_limiter or AdaptiveConcurrencyLimiter(is_overload=is_upstream_overload)
+
+        # Raw inputs are cached per source with their own TTLs (market data is keyed by industry only),
+        # so rebuilding an expired composite result rarely needs an upstream call.
+        ttls = {**self.COMPONENT_TTLS, **(component_ttls or {})}
+        self._component_caches = {
+            component: RiskCache(ttl=ttl, max_entries=cache_max_entries, max_bytes=cache_max_bytes, clock=clock)
+            for component, ttl in ttls.items()
+        }
+
+        # Optional bulk mode: financial misses arriving within the window share one multi-ID request.
+        self._financial_batcher: RequestBatcher | None = None
+        if financial_bulk_window is not None:
+            self._financial_batcher = RequestBatcher(
+                self._fetch_financial_bulk,
+                window=financial_bulk_window.total_seconds(),
+                max_batch=financial_bulk_max,
+            )
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+            pool = self._http_pool
+            connector = aiohttp.TCPConnector(
+                limit=pool.limit,
+                limit_per_host=pool.limit_per_host,
+                keepalive_timeout=pool.keepalive_timeout,
+                ttl_dns_cache=pool.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=pool.total_timeout),
+            )
         return self._session
 
     async def execute(self, inputs: dict[str, Any], context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Return the risk assessment; cached results are shared and read-only."""
+
+        return (await self._execute_entry(inputs)).data
+
+    async def execute_json(self, inputs: dict[str, Any]) -> bytes:
+        """Like ``execute`` but returns the JSON-encoded result; cache hits reuse pre-encoded bytes."""
+
+        return (await self._execute_entry(inputs)).json()
+
+    async def _execute_entry(self, inputs: dict[str, Any]) -> CacheEntry:
         supplier_id = str(inputs["supplier_id"])
         industry = str(inputs.get("industry", "general"))
-        refresh = bool(inputs.get("refresh_cache", False))
+        refresh = self._refresh_components(inputs.get("refresh_cache", False))
 
         cache_key = f"{supplier_id}_{industry}"
         if not refresh:
-            cached = self._cache.get(cache_key)
-            if cached and datetime.now() - cached.timestamp < self._cache_ttl:
-                return cached.data
+            cached = self._lookup(cache_key, supplier_id, industry, inputs)
+            if cached is not None:
+                return cached
 
+        started = self._clock()
+        inflight = self._start_assessment(cache_key, supplier_id, industry, inputs)
+
+        # Shield so one cancelled caller (or an expired budget) doesn't abort the shared assessment.
+        budget = self._budget(inputs)
+        if budget is None:
+            return await asyncio.shield(inflight)
+        try:
+            return await asyncio.wait_for(asyncio.shield(inflight), timeout=budget.total_seconds())
+        except TimeoutError:
+            self._partial_served += 1
+            data = self._partial_result(supplier_id, industry, refresh, started, budget)
+            return CacheEntry(timestamp=self._clock(), data=data)
+
+    def _budget(self, inputs: dict[str, Any]) -> timedelta | None:
+        budget_ms = inputs.get("budget_ms")
+        if budget_ms is None:
+            return self._default_budget
+        if budget_ms <= 0:
+            raise ValueError("budget_ms must be positive")
+        return timedelta(milliseconds=budget_ms)
+
+    async def execute_batch(self, items: list[dict[str, Any]], *, concurrency: int = 16) -> list[dict[str, Any]]:
+        """Score many suppliers at once, returning results in input order.
+
+        Duplicate supplier/industry pairs are scored once. Cache hits are answered
+        without waiting; misses are assessed with at most ``concurrency`` in flight.
+        """
+
+        return [entry.data for entry in await self._execute_batch_entries(items, concurrency=concurrency)]
+
+    async def execute_batch_json(self, items: list[dict[str, Any]], *, concurrency: int = 16) -> bytes:
+        """Like ``execute_batch`` but returns a JSON array built from pre-encoded results."""
+
+        entries = await self._execute_batch_entries(items, concurrency=concurrency)
+        return b"[" + b",".join(entry.json() for entry in entries) + b"]"
+
+    async def _execute_batch_entries(self, items: list[dict[str, Any]], *, concurrency: int) -> list[CacheEntry]:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+        keys: list[str] = []
+        unique: dict[str, tuple[str, str, dict[str, Any]]] = {}
+        for item in items:
+            supplier_id = str(item["supplier_id"])
+            industry = str(item.get("industry", "general"))
+            key = f"{supplier_id}_{industry}"
+            keys.append(key)
+            # A refresh request on any duplicate applies to the shared lookup.
+            if key not in unique or item.get("refresh_cache"):
+                unique[key] = (supplier_id, industry, item)
+
+        results: dict[str, CacheEntry] = {}
+        misses: list[tuple[str, str, str, dict[str, Any]]] = []
+        for key, (supplier_id, industry, item) in unique.items():
+            cached = None if item.get("refresh_cache") else self._lookup(key, supplier_id, industry, item)
+            if cached is not None:
+                results[key] = cached
+            else:
+                misses.append((key, supplier_id, industry, item))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _score(key: str, supplier_id: str, industry: str, item: dict[str, Any]) -> None:
+            async with semaphore:
+                results[key] = await asyncio.shield(self._start_assessment(key, supplier_id, industry, item))
+
+        await asyncio.gather(*(_score(*miss) for miss in misses))
+        return [results[key] for key in keys]
+
+    def _lookup(self, cache_key: str, supplier_id: str, industry: str, inputs: dict[str, Any]) -> CacheEntry | None:
+        cached = self._cache.get(cache_key)
+        if self._snapshot is not None and (cached is None or cached.timestamp < self._snapshot.created_at):
+            snapshot_entry = self._snapshot.get(supplier_id, industry)
+            if snapshot_entry is not None:
+                return snapshot_entry
+        if cached is None:
+            return None
+
+        age = self._clock() - cached.timestamp
+        if age < self._cache_ttl:
+            return cached
+
+        # Stale-while-revalidate: answer now, refresh in the background.
+        self._stale_served += 1
+        self._start_assessment(cache_key, supplier_id, industry, inputs)
+        return CacheEntry(timestamp=cached.timestamp, data=self._mark_stale(cached.data, age))
+
+    def _start_assessment(
+        self, cache_key: str, supplier_id: str, industry: str, inputs: dict[str, Any]
+    ) -> asyncio.Future[CacheEntry]:
+        # Single-flight: concurrent misses for the same key share one fetch-and-score. The refresh set
+        # is part of the key, so a refresh never joins an assessment that reuses cached components.
+        refresh = self._refresh_components(inputs.get("refresh_cache", False))
+        flight_key = f"{cache_key}|{','.join(sorted(refresh))}" if refresh else cache_key
+        inflight = self._inflight.get(flight_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._assess(cache_key, supplier_id, industry, inputs))
+            self._inflight[flight_key] = inflight
+            inflight.add_done_callback(lambda fut: self._release_inflight(flight_key, fut))
+        else:
+            self._coalesced += 1
+        return inflight
+
+    def _release_inflight(self, flight_key: str, fut: asyncio.Future[CacheEntry]) -> None:
+        if self._inflight.get(flight_key) is fut:
+            del self._inflight[flight_key]
+
+    async def _assess(self, cache_key: str, supplier_id: str, industry: str, inputs: dict[str, Any]) -> CacheEntry:
         try:
+            refresh = self._refresh_components(inputs.get("refresh_cache", False))
             financial_data, compliance_data, market_data = await asyncio.gather(
-                self._fetch_financial_data(supplier_id),
-                self._fetch_compliance_data(supplier_id),
-                self._fetch_market_data(industry),
+                self._cached_component("financial", supplier_id, self._fetch_financial_data, refresh),
+                self._cached_component("compliance", supplier_id, self._fetch_compliance_data, refresh),
+                self._cached_component("market", industry, self._fetch_market_data, refresh),
                 return_exceptions=True,
             )
 
@@ -86,103 +329,265 @@ class SupplierRiskChecker(Skill):
             compliance_data = self._handle_fetch_error(compliance_data, "compliance")
             market_data = self._handle_fetch_error(market_data, "market")
 
-            component_scores = {
-                "financial": self._calculate_financial_score(financial_data),
-                "compliance": self._calculate_compliance_score(compliance_data),
-                "operational": self._calculate_operational_score(supplier_id),
-                "market": self._calculate_market_score(market_data),
+            sources = {
+                "financial": financial_data,
+                "compliance": compliance_data,
+                "operational": self._get_operational_factors(supplier_id),
+                "market": market_data,
             }
+            digests = {name: content_digest(data) for name, data in sources.items()}
+            # The compliance score also depends on the inspection's age, so an unchanged record must
+            # still be re-scored once it ages into the next penalty bracket.
+            digests["compliance"] = content_digest(
+                {**compliance_data, "inspection_penalty": self._inspection_penalty(compliance_data)}
+            )
+            previous = self._history.latest(cache_key)
+            if previous is not None and previous[0] == digests:
+                # Same inputs as last time, so the same scores, flags and recommendations; only the time moves.
+                self._unchanged_inputs += 1
+                result = {**previous[1], "last_updated": datetime.now().isoformat()}
+            else:
+                component_scores = {
+                    "financial": self._calculate_financial_score(financial_data),
+                    "compliance": self._calculate_compliance_score(compliance_data),
+                    "operational": self._calculate_operational_score(supplier_id),
+                    "market": self._calculate_market_score(market_data),
+                }
+                defaults_used = tuple(name for name, data in sources.items() if data.get("default_used"))
+                result = self._build_result(supplier_id, component_scores, defaults_used=defaults_used)
+
+            if result["metadata"].get("defaults_used"):
+                # Like fallback components, never keep a score built from them for the cache TTL: the
+                # financial negative cache and breaker already bound retries, so rescore once sources recover.
+                entry = CacheEntry(timestamp=self._clock(), data=result)
+            else:
+                entry = self._cache.set(cache_key, result)
+            self._history.record(cache_key, digests, entry.data, at=entry.timestamp)
+            return entry
 
-            weighted_score = sum(component_scores[k] * self.WEIGHTS[k] for k in component_scores)
-            flags = self._generate_risk_flags(component_scores, weighted_score)
-            recommendations = self._generate_recommendations(component_scores, flags, weighted_score)
-
-            result: dict[str, Any] = {
-                "risk_score": round(weighted_score, 2),
-                "risk_level": self._get_risk_level(weighted_score),
-                "component_scores": {k: round(v, 2) for k, v in component_scores.items()},
-                "risk_flags": flags,
-                "recommendations": recommendations,
-                "confidence": self._calculate_confidence(component_scores),
-                "last_updated": datetime.now().isoformat(),
-                "supplier_id": supplier_id,
-                "metadata": {
-                    "weights_applied": self.WEIGHTS,
-                    "data_sources": ["financial_api", "compliance_db", "market_index"],
-                    "calculation_version": self.version,
-                },
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Risk assessment failed")
+            return CacheEntry(timestamp=self._clock(), data=self._generate_fallback_result(inputs, str(exc)))
+
+    def _build_result(
+        self,
+        supplier_id: str,
+        component_scores: dict[str, float],
+        missing: tuple[str, ...] = (),
+        *,
+        defaults_used: tuple[str, ...] = (),
+    ) -> dict[str, Any]:
+        weighted_score = sum(component_scores[k] * self.WEIGHTS[k] for k in component_scores)
+        flags = self._generate_risk_flags(component_scores, weighted_score)
+        recommendations = self._generate_recommendations(component_scores, flags, weighted_score)
+
+        confidence = self._calculate_confidence(component_scores)
+        if missing:
+            # Placeholder scores say nothing about consistency: rate only the real data points, then
+            # scale by the share of the weighting they carry.
+            available = {k: v for k, v in component_scores.items() if k not in missing}
+            coverage = 1.0 - sum(self.WEIGHTS[k] for k in missing)
+            confidence = round(self._calculate_confidence(available) * coverage, 2)
+
+        result: dict[str, Any] = {
+            "risk_score": round(weighted_score, 2),
+            "risk_level": self._get_risk_level(weighted_score),
+            "component_scores": {k: round(v, 2) for k, v in component_scores.items()},
+            "risk_flags": flags,
+            "recommendations": recommendations,
+            "confidence": confidence,
+            "last_updated": datetime.now().isoformat(),
+            "supplier_id": supplier_id,
+            "metadata": {
+                "weights_applied": self.WEIGHTS,
+                "data_sources": ["financial_api", "compliance_db", "market_index"],
+                "calculation_version": self.version,
+            },
+        }
+        if defaults_used:
+            # Sources scored from fallback defaults because their fetch failed.
+            result["metadata"]["defaults_used"] = list(defaults_used)
+        return result
+
+    def _partial_result(
+        self,
+        supplier_id: str,
+        industry: str,
+        refresh: frozenset[str],
+        started: datetime,
+        budget: timedelta,
+    ) -> dict[str, Any]:
+        """Score from the component caches; sources that aren't available yet get a neutral 5.0."""
+
+        scorers: dict[str, tuple[str, Callable[[dict[str, Any]], float]]] = {
+            "financial": (supplier_id, self._calculate_financial_score),
+            "compliance": (supplier_id, self._calculate_compliance_score),
+            "market": (industry, self._calculate_market_score),
+        }
+        component_scores = {
+            "financial": 5.0,
+            "compliance": 5.0,
+            "operational": self._calculate_operational_score(supplier_id),
+            "market": 5.0,
+        }
+        missing: list[str] = []
+        for component, (key, score) in scorers.items():
+            cached = self._component_caches[component].get(key)
+            # A source the caller asked to refresh only counts if it was re-fetched for this request.
+            if cached is None or (component in refresh and cached.timestamp < started):
+                missing.append(component)
+            else:
+                component_scores[component] = score(cached.data)
+
+        result = self._build_result(supplier_id, component_scores, tuple(missing))
+        result["metadata"].update(
+            {
+                "status": "PARTIAL",
+                "missing_components": missing,
+                "budget_ms": round(budget.total_seconds() * 1000),
             }
+        )
+        return result
+
+    def _refresh_components(self, refresh_cache: Any) -> frozenset[str]:
+        """Normalize ``refresh_cache``: True refreshes every source, a name or list refreshes just those."""
+
+        if refresh_cache is True:
+            return frozenset(self._component_caches)
+        if not refresh_cache:
+            return frozenset()
+        names = {refresh_cache} if isinstance(refresh_cache, str) else set(refresh_cache)
+        unknown = names - set(self._component_caches)
+        if unknown:
+            raise ValueError(f"Unknown risk components to refresh: {', '.join(sorted(unknown))}")
+        return frozenset(names)
+
+    async def _cached_component(
+        self,
+        component: str,
+        key: str,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+        refresh: frozenset[str],
+    ) -> dict[str, Any]:
+        cache = self._component_caches[component]
+        if component not in refresh:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached.data
 
-            self._cache[cache_key] = CacheEntry(timestamp=datetime.now(), data=result)
-            return result
+        data = await fetch(key)
+        # Fallback defaults stand in for a failed fetch; never keep them for the component TTL.
+        if not data.get("default_used"):
+            cache.set(key, data)
+        return data
+
+    async def _fetch_financial_data(self, supplier_id: str) -> dict[str, Any]:
+        if self._financial_failures.get(supplier_id) is not None or not self._financial_breaker.allow():
+            return self._financial_fallback()
 
+        try:
+            if self._financial_batcher is not None:
+                data = await self._financial_batcher.fetch(supplier_id)
+            else:
+                data = await self._fetch_financial_single(supplier_id)
+            financial = {
+                "revenue_12m": data.get("revenue", 1_000_000),
+                "profit_margin": data.get("profit_margin", 0.15),
+                "debt_to_equity": data.get("debt_ratio", 0.5),
+                "current_ratio": data.get("current_ratio", 2.0),
+                "credit_rating": data.get("credit_rating", "BBB"),
+                "last_audit_date": data.get("audit_date", "2023-12-01"),
+                "audit_opinion": data.get("audit_opinion", "clean"),
+            }
+        except ConcurrencyLimitExceeded as exc:
+            # Shed locally: says nothing about this supplier or the upstream's health.
+            logger.warning("Financial data fetch shed: %s", exc)
+            return self._financial_fallback()
         except Exception as exc:  # noqa: BLE001
-            logger.exception("Risk assessment failed")
-            return self._generate_fallback_result(inputs, str(exc))
+            # The breaker already saw this request's outcome; here we only fall back and remember the supplier.
+            logger.warning("Financial data fetch failed: %s", exc)
+            self._financial_failures.set(supplier_id, {"error": str(exc)})
+            return self._financial_fallback()
 
-    async def _fetch_financial_data(self, supplier_id: str) -> dict[str, Any]:
-        api_url = os.getenv("FINANCIAL_API_URL", "https://api.example.com/financial")
+        return financial
+
+    def _financial_request(self) -> tuple[str, dict[str, str]]:
+        api_url = os.getenv("FINANCIAL_API_URL", "https://api.example.com/financial").rstrip("/")
         api_key = os.getenv("API_KEY")
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        return api_url, headers
 
+    async def _fetch_financial_single(self, supplier_id: str) -> dict[str, Any]:
+        api_url, headers = self._financial_request()
         session = await self._get_session()
         try:
-            headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
-            async with session.get(f"{api_url}/{supplier_id}", headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return {
-                        "revenue_12m": data.get("revenue", 1_000_000),
-                        "profit_margin": data.get("profit_margin", 0.15),
-                        "debt_to_equity": data.get("debt_ratio", 0.5),
-                        "current_ratio": data.get("current_ratio", 2.0),
-                        "credit_rating": data.get("credit_rating", "BBB"),
-                        "last_audit_date": data.get("audit_date", "2023-12-01"),
-                        "audit_opinion": data.get("audit_opinion", "clean"),
-                    }
-
-                raise RuntimeError(f"Financial API error: {response.status}")
+            async with (
+                self._financial_limiter.slot(),
+                session.get(f"{api_url}/{supplier_id}", headers=headers) as response,
+            ):
+                if response.status != 200:
+                    raise FinancialApiError(response.status)
+                data = await response.json()
+        except ConcurrencyLimitExceeded:
+            raise  # shed before any request was made
+        except Exception as exc:
+            self._record_financial_outcome(exc)
+            raise
+        self._record_financial_outcome(None)
+        return data
 
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Financial data fetch failed: %s", exc)
-            return {
-                "revenue_12m": 0,
-                "profit_margin": 0,
-                "debt_to_equity": 1.0,
-                "current_ratio": 1.0,
-                "credit_rating": "D",
-                "last_audit_date": None,
-                "audit_opinion": "unknown",
-            }
+    async def _fetch_financial_bulk(self, supplier_ids: list[str]) -> dict[str, Any]:
+        """POST ``{api_url}/batch`` with ``{"supplier_ids": [...]}``; expects ``{"results": {id: data}}``."""
 
-    async def _fetch_compliance_data(self, supplier_id: str) -> dict[str, Any]:
-        compliance_db = {
-            "SUP-001": {
-                "violations": 0,
-                "certifications": ["ISO9001", "ISO14001"],
-                "last_inspection": "2024-01-15",
-            },
-            "SUP-002": {"violations": 2, "certifications": ["ISO9001"], "last_inspection": "2023-11-20"},
-            "SUP-003": {
-                "violations": 0,
-                "certifications": ["ISO9001", "ISO45001", "SOC2"],
-                "last_inspection": "2024-02-01",
-            },
-            "SUP-004": {"violations": 1, "certifications": [], "last_inspection": "2023-09-10"},
-            "SUP-005": {"violations": 0, "certifications": ["ISO9001"], "last_inspection": "2024-01-30"},
+        api_url, headers = self._financial_request()
+        session = await self._get_session()
+        try:
+            async with (
+                self._financial_limiter.slot(),
+                session.post(f"{api_url}/batch", json={"supplier_ids": supplier_ids}, headers=headers) as response,
+            ):
+                if response.status != 200:
+                    raise FinancialApiError(response.status)
+                body = await response.json()
+        except ConcurrencyLimitExceeded:
+            raise
+        except Exception as exc:
+            # One outcome per POST, however many suppliers (and waiting callers) it covered.
+            self._record_financial_outcome(exc)
+            raise
+        self._record_financial_outcome(None)
+        return dict(body.get("results") or {})
+
+    def _record_financial_outcome(self, exc: BaseException | None) -> None:
+        # Client errors (e.g. unknown supplier) mean the upstream itself is healthy.
+        if exc is None or (isinstance(exc, FinancialApiError) and exc.status < 500):
+            self._financial_breaker.record_success()
+        else:
+            self._financial_breaker.record_failure()
+
+    def _financial_fallback(self) -> dict[str, Any]:
+        return {
+            "revenue_12m": 0,
+            "profit_margin": 0,
+            "debt_to_equity": 1.0,
+            "current_ratio": 1.0,
+            "credit_rating": "D",
+            "last_audit_date": None,
+            "audit_opinion": "unknown",
+            "default_used": True,
         }
 
-        default = {"violations": 3, "certifications": [], "last_inspection": "2023-06-01"}
-        return compliance_db.get(supplier_id, default)
+    async def _fetch_compliance_data(self, supplier_id: str) -> dict[str, Any]:
+        data = self._data_store.compliance(supplier_id)
+        if data is None:
+            return {"violations": 3, "certifications": [], "last_inspection": "2023-06-01"}
+        return data
 
     async def _fetch_market_data(self, industry: str) -> dict[str, float]:
-        market_risk_scores: dict[str, dict[str, float]] = {
-            "technology": {"volatility": 0.7, "growth": 0.8, "competition": 0.6},
-            "manufacturing": {"volatility": 0.4, "growth": 0.5, "competition": 0.7},
-            "healthcare": {"volatility": 0.3, "growth": 0.9, "competition": 0.5},
-            "retail": {"volatility": 0.8, "growth": 0.4, "competition": 0.9},
-            "general": {"volatility": 0.5, "growth": 0.5, "competition": 0.5},
-        }
-        return market_risk_scores.get(industry, market_risk_scores["general"])
+        data = self._data_store.market(industry)
+        if data is None:
+            data = self._data_store.market("general") or {"volatility": 0.5, "growth": 0.5, "competition": 0.5}
+        return data
 
     def _calculate_financial_score(self, data: dict[str, Any]) -> float:
         score = 5.0
@@ -214,17 +619,7 @@ class SupplierRiskChecker(Skill):
         elif current_ratio < 1.0:
             score -= 2.0
 
-        credit_scores = {
-            "AAA": 2.0,
-            "AA": 1.5,
-            "A": 1.0,
-            "BBB": 0.5,
-            "BB": -0.5,
-            "B": -1.5,
-            "CCC": -3.0,
-            "D": -5.0,
-        }
-        score += credit_scores.get(str(data.get("credit_rating", "")), -2.0)
+        score += self.CREDIT_SCORES.get(str(data.get("credit_rating", "")), -2.0)
 
         audit_opinion = str(data.get("audit_opinion", "unknown"))
         if audit_opinion == "clean":
@@ -246,34 +641,33 @@ class SupplierRiskChecker(Skill):
         certification_bonus = len(certifications) * 0.5
         score += min(certification_bonus, 2.0)
 
-        last_inspection = data.get("last_inspection")
-        if last_inspection:
-            last_dt = datetime.strptime(str(last_inspection), "%Y-%m-%d")
-            months_ago = (datetime.now() - last_dt).days / 30
-            if months_ago > 12:
-                score -= 2.0
-            elif months_ago > 6:
-                score -= 0.5
+        score -= self._inspection_penalty(data)
 
         return max(0.0, min(10.0, score))
 
-    def _calculate_operational_score(self, supplier_id: str) -> float:
-        operational_factors: dict[str, dict[str, float]] = {
-            "SUP-001": {"delivery_reliability": 0.95, "quality_score": 0.92, "response_time": 0.88},
-            "SUP-002": {"delivery_reliability": 0.85, "quality_score": 0.78, "response_time": 0.72},
-            "SUP-003": {"delivery_reliability": 0.98, "quality_score": 0.96, "response_time": 0.94},
-            "SUP-004": {"delivery_reliability": 0.70, "quality_score": 0.65, "response_time": 0.60},
-            "SUP-005": {"delivery_reliability": 0.90, "quality_score": 0.85, "response_time": 0.82},
-        }
-
-        factors = operational_factors.get(
-            supplier_id,
-            {"delivery_reliability": 0.80, "quality_score": 0.75, "response_time": 0.70},
-        )
+    def _inspection_penalty(self, data: dict[str, Any]) -> float:
+        last_inspection = data.get("last_inspection")
+        if not last_inspection:
+            return 0.0
+        last_dt = datetime.strptime(str(last_inspection), "%Y-%m-%d")
+        months_ago = (self._clock() - last_dt).days / 30
+        if months_ago > 12:
+            return 2.0
+        if months_ago > 6:
+            return 0.5
+        return 0.0
 
+    def _calculate_operational_score(self, supplier_id: str) -> float:
+        factors = self._get_operational_factors(supplier_id)
         avg_performance = sum(factors.values()) / len(factors)
         return max(0.0, min(10.0, avg_performance * 10))
 
+    def _get_operational_factors(self, supplier_id: str) -> dict[str, float]:
+        factors = self._data_store.operational(supplier_id)
+        if factors is None:
+            return {"delivery_reliability": 0.80, "quality_score": 0.75, "response_time": 0.70}
+        return factors
+
     def _calculate_market_score(self, market_data: dict[str, float]) -> float:
         volatility_score = (1 - float(market_data["volatility"])) * 5
         growth_score = float(market_data["growth"]) * 3
@@ -368,6 +762,42 @@ class SupplierRiskChecker(Skill):
         consistency_factor = 1.0 - (score_range / 10)
         return round(base_confidence * consistency_factor, 2)
 
+    def invalidate_reference_data(self) -> None:
+        """Forget everything derived from the supplier data store, after it has been refreshed.
+
+        Clears the compliance and market input caches and the composite results; financial data
+        comes from its own API and stays cached.
+        """
+
+        for component in ("compliance", "market"):
+            self._component_caches[component].clear()
+        self._cache.clear()
+
+    def risk_history(self, supplier_id: str, industry: str = "general", *, limit: int | None = None) -> list[dict]:
+        """Risk score changes for a supplier, oldest first; repeated identical assessments are collapsed."""
+
+        return self._history.points(f"{supplier_id}_{industry}", limit=limit)
+
+    def score_many(self, columns: Mapping[str, Any], *, now: datetime | None = None) -> BulkScores:
+        """Score many suppliers at once from columnar inputs (requires NumPy).
+
+        See ``procuator.skills.bulk_scoring.score_many`` for the expected columns.
+        """
+
+        from procuator.skills.bulk_scoring import score_many
+
+        return score_many(
+            columns,
+            weights=self.WEIGHTS,
+            thresholds=self.THRESHOLDS,
+            credit_scores=self.CREDIT_SCORES,
+            now=now or self._clock(),
+        )
+
+    def _mark_stale(self, data: dict[str, Any], age: timedelta) -> dict[str, Any]:
+        metadata = {**data.get("metadata", {}), "stale": True, "age_seconds": round(age.total_seconds(), 1)}
+        return {**data, "metadata": metadata}
+
     def _handle_fetch_error(self, data: Any, data_type: str) -> dict[str, Any]:
         if isinstance(data, Exception):
             logger.warning("Failed to fetch %s data: %s", data_type, data)
@@ -403,9 +833,27 @@ class SupplierRiskChecker(Skill):
             "metadata": {"error": error, "fallback_mode": True, "calculation_version": self.version},
         }
 
+    def cache_stats(self) -> dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "soft_ttl_seconds": self._cache_ttl.total_seconds(),
+            "inflight": len(self._inflight),
+            "coalesced": self._coalesced,
+            "stale_served": self._stale_served,
+            "partial_served": self._partial_served,
+            "financial_breaker": self._financial_breaker.stats(),
+            "financial_negative_cache": self._financial_failures.stats(),
+            "financial_limiter": self._financial_limiter.stats(),
+            "components": {name: cache.stats() for name, cache in self._component_caches.items()},
+            "financial_bulk": self._financial_batcher.stats() if self._financial_batcher else None,
+            "snapshot": self._snapshot.stats() if self._snapshot is not None else None,
+            "history": {**self._history.stats(), "unchanged_inputs": self._unchanged_inputs},
+        }
+
     async def aclose(self) -> None:
         if self._session is not None and not self._session.closed:
             await self._session.close()
+        self._cache.close()
 
 
 def create_skill() -> SupplierRiskChecker:
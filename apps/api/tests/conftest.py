@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+FINANCIALS: dict[str, dict[str, Any]] = {
+    "SUP-001": {"revenue": 25_000_000, "profit_margin": 0.22, "debt_ratio": 0.2, "credit_rating": "AA"},
+    "SUP-002": {"revenue": 4_000_000, "profit_margin": 0.08, "debt_ratio": 1.2, "credit_rating": "BB"},
+    "SUP-003": {"revenue": 12_000_000, "profit_margin": 0.18, "debt_ratio": 0.4, "credit_rating": "A"},
+}
+
+
+@dataclass
+class FinancialApiStub:
+    """Local stand-in for the financial data provider."""
+
+    url: str
+    requests: list[str] = field(default_factory=list)
+    fail_with: int | None = None
+
+
+@pytest.fixture
+async def financial_api(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[FinancialApiStub]:
+    stub = FinancialApiStub(url="")
+
+    async def single(request: web.Request) -> web.Response:
+        supplier_id = request.match_info["supplier_id"]
+        stub.requests.append(f"GET {supplier_id}")
+        if stub.fail_with:
+            return web.json_response({"error": "unavailable"}, status=stub.fail_with)
+        if supplier_id not in FINANCIALS:
+            return web.json_response({"error": "not_found"}, status=404)
+        return web.json_response(FINANCIALS[supplier_id])
+
+    async def batch(request: web.Request) -> web.Response:
+        supplier_ids = (await request.json())["supplier_ids"]
+        stub.requests.append(f"POST {','.join(sorted(supplier_ids))}")
+        if stub.fail_with:
+            return web.json_response({"error": "unavailable"}, status=stub.fail_with)
+        return web.json_response({"results": {sid: FINANCIALS[sid] for sid in supplier_ids if sid in FINANCIALS}})
+
+    app = web.Application()
+    app.router.add_post("/financial/batch", batch)
+    app.router.add_get("/financial/{supplier_id}", single)
+
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    stub.url = str(server.make_url("/financial"))
+    monkeypatch.setenv("FINANCIAL_API_URL", stub.url)
+    try:
+        yield stub
+    finally:
+        await server.close()
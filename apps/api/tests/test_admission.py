@@ -0,0 +1,95 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from procuator.api.admission import AdmissionController, AdmissionMiddleware, AdmissionRejected, RouteClass
+
+WAIT = timedelta(seconds=1)
+
+
+def _controller(total_limit: int = 1, batch_wait: timedelta = WAIT) -> AdmissionController:
+    return AdmissionController(
+        {
+            "approvals": RouteClass(limit=4, max_wait=WAIT, priority=0),
+            "default": RouteClass(limit=4, max_wait=WAIT, priority=1),
+            "batch": RouteClass(limit=1, max_wait=batch_wait, priority=3),
+        },
+        total_limit=total_limit,
+        routes=[("/decision/batch", "batch"), ("/referrals", "approvals")],
+    )
+
+
+def test_classify_by_prefix_with_exempt_health() -> None:
+    admission = _controller()
+    assert admission.classify("/health") is None
+    assert admission.classify("/referrals/abc/approve") == "approvals"
+    assert admission.classify("/decision/batch") == "batch"
+    assert admission.classify("/referralsx") == "default"
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_go_to_higher_priority_waiters_first() -> None:
+    admission = _controller(total_limit=1)
+    order: list[str] = []
+
+    async def run(route_class: str) -> None:
+        await admission.acquire(route_class)
+        order.append(route_class)
+        await asyncio.sleep(0)
+        admission.release(route_class)
+
+    await admission.acquire("default")
+    waiting = [asyncio.create_task(run("batch")), asyncio.create_task(run("approvals"))]
+    await asyncio.sleep(0)
+    admission.release("default")
+    await asyncio.gather(*waiting)
+
+    assert order == ["approvals", "batch"]
+    assert admission.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_that_cannot_start_in_time_are_shed() -> None:
+    admission = _controller(total_limit=8, batch_wait=timedelta(milliseconds=10))
+    await admission.acquire("batch")
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        await admission.acquire("batch")
+    assert rejected.value.retry_after >= 1
+
+    # Other classes are unaffected by the batch class being full.
+    await admission.acquire("approvals")
+    stats = admission.stats()
+    assert stats["classes"]["batch"]["shed"] == stats["shed"] == 1
+    assert stats["classes"]["approvals"]["admitted"] == 1
+
+
+def test_middleware_returns_503_with_retry_after() -> None:
+    admission = _controller(total_limit=8, batch_wait=timedelta(milliseconds=10))
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=admission)
+
+    @app.post("/decision/batch")
+    async def batch() -> dict:
+        return {}
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    with TestClient(app) as client:
+        portal = client.portal
+        assert portal is not None
+        # Hold the only batch slot so the request below has to wait and then gets shed.
+        portal.call(admission.acquire, "batch")
+        shed = client.post("/decision/batch")
+        health = client.get("/health")
+        admission.release("batch")
+
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "1"
+    assert shed.json()["route_class"] == "batch"
+    assert health.status_code == 200
@@ -1,6 +1,18 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
 from fastapi.testclient import TestClient
 
 import procuator.api.app as api_app
+from procuator.data.supplier_store import DEMO_COMPLIANCE, InMemorySupplierDataStore
+from procuator.decision_jobs import JobQueueFull
+from procuator.skills.cache_warmer import CacheWarmer
 
 
 def test_health() -> None:
@@ -25,6 +37,65 @@ def test_risk_check() -> None:
     assert 0.0 <= float(body["risk_score"]) <= 10.0
 
 
+def test_app_starts_without_a_snapshot_file_and_loads_it_on_refresh(tmp_path: Path) -> None:
+    # The snapshot is opened at import, so start the app in a fresh interpreter.
+    script = """
+import json
+from fastapi.testclient import TestClient
+import procuator.api.app as api_app
+from procuator.data.supplier_store import DEMO_COMPLIANCE, InMemorySupplierDataStore
+from procuator.skills.risk_snapshot import write_risk_snapshot
+
+with TestClient(api_app.app) as client:
+    before = client.post("/risk-check", json={"supplier_id": "SUP-001", "industry": "technology"}).json()
+    result = {k: v for k, v in before.items() if k != "metadata"}
+    write_risk_snapshot(api_app._risk_snapshot.path, [("SUP-002", "general", {**result, "supplier_id": "SUP-002"})])
+    refreshed = client.post("/supplier-data/refresh").json()
+    after = client.post("/risk-check", json={"supplier_id": "SUP-002", "industry": "general"}).json()
+print(json.dumps({"before": before["metadata"], "snapshot": refreshed["snapshot"], "after": after["metadata"]}))
+"""
+    env = {
+        **os.environ,
+        "RISK_SNAPSHOT_PATH": str(tmp_path / "missing" / "risk.snap"),
+        "AUDIT_LOG_PATH": str(tmp_path / "audit.jsonl"),
+        "CACHE_WARMUP_ENABLED": "false",
+    }
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert "source" not in out["before"]
+    assert out["snapshot"]["loaded"] is True
+    assert out["after"]["source"] == "snapshot"
+
+
+def test_supplier_data_refresh_reaches_the_next_risk_check() -> None:
+    compliance = {"SUP-001": dict(DEMO_COMPLIANCE["SUP-001"])}
+    store = InMemorySupplierDataStore(compliance=compliance)
+
+    async def financial(_: str) -> dict:
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    original = api_app._supplier_store, api_app._skill._data_store
+    api_app._supplier_store = api_app._skill._data_store = store
+    api_app._skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    try:
+        with TestClient(api_app.app) as client:
+            request = {"supplier_id": "SUP-001", "industry": "technology"}
+            before = client.post("/risk-check", json=request).json()
+            compliance["SUP-001"] = {**compliance["SUP-001"], "violations": 3}
+            assert client.post("/risk-check", json=request).json() == before  # still cached
+
+            assert client.post("/supplier-data/refresh").json()["refreshed"] is True
+            after = client.post("/risk-check", json=request).json()
+    finally:
+        api_app._supplier_store, api_app._skill._data_store = original
+        del api_app._skill._fetch_financial_data
+        api_app._skill.invalidate_reference_data()
+
+    assert after["component_scores"]["compliance"] == before["component_scores"]["compliance"] - 4.5
+
+
 def test_risk_check_missing_supplier_id_returns_422() -> None:
     with TestClient(api_app.app) as client:
         resp = client.post("/risk-check", json={"industry": "technology"})
@@ -61,15 +132,15 @@ def test_lifespan_closes_skill_on_shutdown() -> None:
             nonlocal closed
             closed = True
 
-    original_skill = api_app._skill
-    api_app._skill = DummySkill()  # type: ignore[assignment]
+    original_skill = api_app._pipeline.risk
+    api_app._pipeline.risk = DummySkill()  # type: ignore[assignment]
     try:
         with TestClient(api_app.app) as client:
             resp = client.get("/health")
             assert resp.status_code == 200
         assert closed is True
     finally:
-        api_app._skill = original_skill
+        api_app._pipeline.risk = original_skill
 
 
 def test_demo_scenarios_endpoint_returns_three() -> None:
@@ -153,3 +224,327 @@ def test_hard_deny_is_policy_driven_budget_exceeded() -> None:
     assert body["policy"]["policy_decision"] == "DENY"
     assert "budget_exceeded" in (body["policy"]["policy_flags"] or [])
     assert body["human_in_the_loop"]["required"] is False
+
+
+def test_cache_stats_reports_hits_and_misses() -> None:
+    async def financial(_: str) -> dict:
+        # Results scored from fallback defaults aren't cached, so don't depend on the real API.
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    api_app._skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    try:
+        with TestClient(api_app.app) as client:
+            before = client.get("/cache/stats").json()
+            client.post("/risk-check", json={"supplier_id": "SUP-CACHE-STATS", "industry": "general"})
+            client.post("/risk-check", json={"supplier_id": "SUP-CACHE-STATS", "industry": "general"})
+            resp = client.get("/cache/stats")
+    finally:
+        del api_app._skill._fetch_financial_data
+
+    assert resp.status_code == 200
+    stats = resp.json()
+    assert stats["misses"] >= before["misses"] + 1
+    assert stats["hits"] >= before["hits"] + 1
+    assert stats["entries"] <= stats["max_entries"]
+
+
+def test_risk_check_batch_dedupes_and_preserves_order() -> None:
+    items = [
+        {"supplier_id": "SUP-001", "industry": "technology"},
+        {"supplier_id": "SUP-004", "industry": "retail"},
+        {"supplier_id": "SUP-001", "industry": "technology"},
+    ]
+    with TestClient(api_app.app) as client:
+        resp = client.post("/risk-check/batch", json={"items": items, "concurrency": 2})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 3
+    assert body["unique"] == 2
+    assert [r["supplier_id"] for r in body["results"]] == ["SUP-001", "SUP-004", "SUP-001"]
+    assert body["results"][0] == body["results"][2]
+
+
+def test_risk_check_batch_rejects_empty_items() -> None:
+    with TestClient(api_app.app) as client:
+        resp = client.post("/risk-check/batch", json={"items": []})
+    assert resp.status_code == 422
+
+
+def test_risk_check_refreshes_single_component() -> None:
+    with TestClient(api_app.app) as client:
+        ok = client.post("/risk-check", json={"supplier_id": "SUP-001", "refresh_cache": "financial"})
+        bad = client.post("/risk-check", json={"supplier_id": "SUP-001", "refresh_cache": "weather"})
+
+    assert ok.status_code == 200
+    assert ok.json()["supplier_id"] == "SUP-001"
+    assert bad.status_code == 422
+
+
+def test_ready_is_gated_on_warmup_progress() -> None:
+    class GatedSkill:
+        def __init__(self) -> None:
+            self.gate = asyncio.Event()
+
+        async def execute(self, target: dict) -> dict:
+            if target["supplier_id"] != "SUP-001":
+                await self.gate.wait()
+            return {}
+
+    def wait_for(condition: Callable[[], bool]) -> None:
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    skill = GatedSkill()
+    warmer = CacheWarmer(skill, ready_fraction=0.5)
+    targets = [{"supplier_id": f"SUP-00{n}", "industry": "general"} for n in range(1, 5)]
+    with TestClient(api_app.app) as client:
+        original = api_app._warmer
+        api_app._warmer = warmer
+        try:
+            assert client.portal is not None
+            client.portal.start_task_soon(warmer.run, targets)
+            wait_for(lambda: warmer.completed == 1)
+            warming = client.get("/ready")
+
+            client.portal.call(skill.gate.set)
+            wait_for(lambda: warmer.finished)
+            ready = client.get("/ready")
+        finally:
+            api_app._warmer = original
+
+    assert warming.status_code == 503
+    assert warming.json()["status"] == "warming"
+    assert warming.json()["warmup"]["warm_fraction"] == 0.25
+    assert ready.status_code == 200
+    assert ready.json()["warmup"]["completed"] == 4
+
+
+def test_decision_refers_when_risk_is_partial() -> None:
+    class PartialSkill:
+        async def execute(self, inputs: dict) -> dict:
+            assert inputs["budget_ms"] == 250
+            return {
+                "risk_level": "LOW",
+                "risk_score": 8.0,
+                "risk_flags": [],
+                "metadata": {"status": "PARTIAL", "missing_components": ["financial"]},
+            }
+
+    original_skill = api_app._pipeline.risk
+    api_app._pipeline.risk = PartialSkill()  # type: ignore[assignment]
+    try:
+        resp = TestClient(api_app.app).post(
+            "/decision",
+            json={
+                "supplier_id": "SUP-001",
+                "amount": 1000,
+                "budget_remaining": 50000,
+                "requester_approval_limit": 5000,
+                "budget_ms": 250,
+            },
+        )
+    finally:
+        api_app._pipeline.risk = original_skill
+
+    body = resp.json()
+    assert body["decision"] == "REFER"
+    assert any("missing: financial" in line for line in body["explanation"])
+
+
+def test_risk_history_endpoint() -> None:
+    with TestClient(api_app.app) as client:
+        client.post("/risk-check", json={"supplier_id": "SUP-003", "industry": "healthcare", "refresh_cache": True})
+        client.post("/risk-check", json={"supplier_id": "SUP-003", "industry": "healthcare", "refresh_cache": True})
+        resp = client.get("/suppliers/SUP-003/risk-history", params={"industry": "healthcare"})
+        unknown = client.get("/suppliers/SUP-404/risk-history")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["count"] == len(body["points"]) >= 1
+    assert body["points"][-1]["risk_score"] >= 0
+    assert unknown.json()["points"] == []
+
+
+def test_hard_deny_skips_risk_lookup_unless_requested() -> None:
+    calls: list[str] = []
+
+    class CountingSkill:
+        async def execute(self, inputs: dict) -> dict:
+            calls.append(inputs["supplier_id"])
+            return {"risk_level": "LOW", "risk_score": 8.0, "risk_flags": []}
+
+    request = {"supplier_id": "SUP-001", "amount": 25000, "budget_remaining": 10000, "requester_approval_limit": 50000}
+    original_skill = api_app._pipeline.risk
+    api_app._pipeline.risk = CountingSkill()  # type: ignore[assignment]
+    try:
+        client = TestClient(api_app.app)
+        skipped = client.post("/decision", json=request).json()
+        included = client.post("/decision", json={**request, "include_risk": True}).json()
+        invalid = client.post("/decision", json={**request, "amount": 0}).json()
+    finally:
+        api_app._pipeline.risk = original_skill
+
+    assert skipped["decision"] == "DENY"
+    assert skipped["risk"] is None
+    assert "risk assessment skipped" in skipped["explanation"][-1]
+    assert included["decision"] == "DENY"
+    assert included["risk"]["risk_level"] == "LOW"
+    assert invalid["decision"] == "DENY"
+    assert calls == ["SUP-001"]
+
+
+def test_decision_batch_streams_ndjson_results() -> None:
+    base = {"amount": 1000, "budget_remaining": 50000, "requester_approval_limit": 5000}
+    items = [
+        {**base, "supplier_id": "SUP-001", "industry": "technology", "request_id": "REQ-A"},
+        {**base, "supplier_id": "SUP-004", "industry": "retail", "request_id": "REQ-B"},
+        {**base, "supplier_id": "SUP-001", "industry": "technology", "request_id": "REQ-C", "amount": 999999},
+    ]
+    with TestClient(api_app.app) as client:
+        resp = client.post("/decision/batch", json={"items": items, "concurrency": 2})
+        ndjson = client.post(
+            "/decision/batch",
+            content=b"\n".join(
+                [
+                    json.dumps(items[0]).encode(),
+                    b"{not json",
+                    json.dumps({"amount": 5}).encode(),
+                    b'{"supplier_id": "\xff"}',
+                ]
+            )
+            + b"\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+        empty = client.post("/decision/batch", json={"items": []})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    by_index = {line["index"]: line for line in lines}
+    assert sorted(by_index) == [0, 1, 2]
+    assert [by_index[i]["request_id"] for i in range(3)] == ["REQ-A", "REQ-B", "REQ-C"]
+    assert by_index[2]["decision"] == "DENY"
+
+    ndjson_lines = sorted((json.loads(line) for line in ndjson.text.splitlines()), key=lambda line: line["index"])
+    assert ndjson_lines[0]["supplier_id"] == "SUP-001"
+    assert "error" in ndjson_lines[1]
+    assert "supplier_id" in ndjson_lines[2]["error"]
+    assert "Invalid JSON" in ndjson_lines[3]["error"]
+    assert empty.status_code == 422
+
+
+def test_decision_batch_forces_one_refresh_per_supplier() -> None:
+    refreshes: list[object] = []
+
+    class RecordingSkill:
+        async def execute(self, inputs: dict) -> dict:
+            refreshes.append(inputs["refresh_cache"])
+            return {"risk_level": "LOW", "risk_score": 8.0, "risk_flags": []}
+
+    item = {"supplier_id": "SUP-001", "amount": 100, "budget_remaining": 500, "refresh_cache": True}
+    original_skill = api_app._pipeline.risk
+    api_app._pipeline.risk = RecordingSkill()  # type: ignore[assignment]
+    try:
+        resp = TestClient(api_app.app).post("/decision/batch", json={"items": [item] * 4})
+    finally:
+        api_app._pipeline.risk = original_skill
+
+    assert len(resp.text.splitlines()) == 4
+    assert sorted(refreshes, key=bool) == [False, False, False, True]
+
+
+def test_decision_retry_with_same_request_id_is_idempotent() -> None:
+    request = {"request_id": "REQ-IDEMPOTENT-1", "supplier_id": "SUP-002", "amount": 900, "budget_remaining": 5000}
+    with TestClient(api_app.app) as client:
+        pending_before = client.get("/referrals").json()["total_pending"]
+        events_before = client.get("/analytics").json()["total"]
+        first = client.post("/decision", json=request).json()
+        retry = client.post("/decision", json=request).json()
+        pending_after = client.get("/referrals").json()["total_pending"]
+        events_after = client.get("/analytics").json()["total"]
+        conflict = client.post("/decision", json={**request, "amount": 901})
+        stats = client.get("/cache/stats").json()["idempotency"]
+
+    assert first["decision"] == "REFER"
+    assert retry == first
+    assert pending_after == pending_before + 1
+    assert events_after == events_before + 1
+    assert conflict.status_code == 409
+    assert stats["replays"] >= 1
+
+
+def test_async_decision_returns_job_to_poll() -> None:
+    request = {"supplier_id": "SUP-001", "industry": "technology", "amount": 0}
+    with TestClient(api_app.app) as client:
+        accepted = client.post("/decision", params={"mode": "async"}, json=request)
+        job_url = accepted.headers["location"]
+        for _ in range(50):
+            job = client.get(job_url).json()
+            if job["status"] == "DONE":
+                break
+            time.sleep(0.01)
+        missing = client.get("/decision/jobs/nope")
+        bad_callback = client.post(
+            "/decision", params={"mode": "async", "callback_url": "http://example.com/hook"}, json=request
+        )
+        stats = client.get("/decision/jobs").json()
+
+    assert accepted.status_code == 202
+    assert job_url == accepted.json()["status_url"]
+    assert job["status"] == "DONE"
+    assert job["result"]["decision"] == "DENY"
+    assert missing.status_code == 404
+    assert bad_callback.status_code == 422
+    assert stats["submitted"] >= 1
+
+
+def test_async_decision_queue_full_returns_429() -> None:
+    original = api_app._decision_jobs
+
+    class FullQueue:
+        def submit(self, *_: object, **__: object) -> None:
+            raise JobQueueFull(retry_after=7)
+
+        async def aclose(self) -> None:
+            pass
+
+    api_app._decision_jobs = FullQueue()  # type: ignore[assignment]
+    try:
+        resp = TestClient(api_app.app).post(
+            "/decision", params={"mode": "async"}, json={"supplier_id": "S", "amount": 1}
+        )
+    finally:
+        api_app._decision_jobs = original
+
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == "7"
+
+
+async def test_event_stream_sends_snapshot_then_audit_events() -> None:
+    subscribers = api_app._auditor.subscriber_count
+    stream = api_app._audit_event_stream(api_app._auditor, max_buffer=4, keepalive=0.01)
+    assert api_app._auditor.subscriber_count == subscribers  # nothing to leak until it is iterated
+    try:
+        snapshot = await anext(stream)
+        assert api_app._auditor.subscriber_count == subscribers + 1
+        assert snapshot.startswith(b"event: snapshot\ndata: {")
+        assert await anext(stream) == b": keepalive\n\n"
+
+        await api_app._auditor.execute({"request_id": "REQ-SSE", "supplier_id": "SUP-001", "decision": "APPROVE"})
+        event, data = (await anext(stream)).decode().strip().split("\n")
+        assert event == "event: audit"
+        message = json.loads(data.removeprefix("data: "))
+        assert message["event"]["request_id"] == "REQ-SSE"
+        assert {"total", "counts_by_decision", "flag_counts", "risk_score_sum"} <= set(message["delta"])
+        assert message["dropped"] == 0
+    finally:
+        await stream.aclose()
+    assert api_app._auditor.subscriber_count == subscribers
+
+
+def test_dashboard_subscribes_to_event_stream() -> None:
+    with TestClient(api_app.app) as client:
+        resp = client.get("/dashboard")
+    assert 'new EventSource("/events/stream")' in resp.text
@@ -0,0 +1,83 @@
+import json
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from procuator.skills.audit_writer import AuditLogWriter
+from procuator.skills.decision_auditor import DecisionAuditor
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_group_committed_and_drained_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "logs" / "audit.jsonl"
+    writer = AuditLogWriter(path, batch_size=50, flush_interval=timedelta(seconds=5), fsync="batch")
+    for n in range(120):
+        assert writer.write({"n": n})
+    writer.close()
+
+    assert [line["n"] for line in _lines(path)] == list(range(120))
+    stats = writer.stats()
+    assert stats["written"] == 120
+    assert 3 <= stats["batches"] < 120
+    assert stats["fsyncs"] == stats["batches"]
+    assert stats["queue_depth"] == 0
+
+    # Writing after close starts a new writer thread.
+    writer.write({"n": 120})
+    writer.close()
+    assert _lines(path)[-1] == {"n": 120}
+
+
+def test_close_syncs_records_written_since_the_last_interval_fsync(tmp_path: Path) -> None:
+    writer = AuditLogWriter(
+        tmp_path / "audit.jsonl",
+        flush_interval=timedelta(milliseconds=1),
+        fsync="interval",
+        fsync_interval=timedelta(hours=1),
+    )
+    writer.write({"n": 1})
+    deadline = time.monotonic() + 5
+    while writer.stats()["written"] < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    synced = writer.stats()["fsyncs"]
+
+    writer.write({"n": 2})
+    while writer.stats()["written"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.stats()["fsyncs"] == synced  # inside the interval: flushed but not synced
+
+    writer.close()
+    assert writer.stats()["fsyncs"] == synced + 1
+
+    unsynced = AuditLogWriter(tmp_path / "unsynced.jsonl", fsync="never")
+    unsynced.write({"n": 1})
+    unsynced.close()
+    assert unsynced.stats()["fsyncs"] == 0
+
+
+def test_full_queue_drops_records_instead_of_blocking(tmp_path: Path) -> None:
+    writer = AuditLogWriter(tmp_path / "audit.jsonl", max_queue=1, fsync="never")
+    writer._start = lambda: None  # type: ignore[method-assign]  # keep the queue from draining
+    assert writer.write({"n": 1})
+    assert not writer.write({"n": 2})
+    assert writer.stats()["dropped"] == 1
+
+    with pytest.raises(ValueError):
+        AuditLogWriter(tmp_path / "audit.jsonl", fsync="sometimes")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_auditor_hands_records_to_the_writer(tmp_path: Path) -> None:
+    writer = AuditLogWriter(tmp_path / "audit.jsonl", flush_interval=timedelta(milliseconds=10))
+    auditor = DecisionAuditor(writer=writer)
+    await auditor.execute({"request_id": "REQ-1", "supplier_id": "SUP-001", "decision": "APPROVE"})
+    writer.close()
+
+    [record] = _lines(tmp_path / "audit.jsonl")
+    assert record["request_id"] == "REQ-1"
+    assert record["decision"] == "APPROVE"
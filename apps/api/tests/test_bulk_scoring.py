@@ -0,0 +1,88 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+np = pytest.importorskip("numpy")
+bulk_scoring = pytest.importorskip("procuator.skills.bulk_scoring")
+
+
+def _random_inputs(rng: random.Random, now: datetime, count: int) -> tuple[list, list, list, list]:
+    ratings = [*SupplierRiskChecker.CREDIT_SCORES, "", "NR"]
+    opinions = ["clean", "qualified", "adverse", "unknown"]
+    industries = ["technology", "manufacturing", "healthcare", "retail", "general"]
+    financial, compliance, supplier_ids, industries_used = [], [], [], []
+    for i in range(count):
+        financial.append(
+            {
+                "revenue_12m": rng.choice([0, 500_000, 1_000_000, 5_000_000, 10_000_000, 25_000_000]),
+                "profit_margin": rng.choice([-0.1, 0, 0.1, 0.15, 0.2, 0.3, rng.uniform(-0.5, 0.5)]),
+                "debt_to_equity": rng.choice([0.1, 0.3, 0.5, 1.0, 1.5, rng.uniform(0, 3)]),
+                "current_ratio": rng.choice([0.5, 1.0, 2.0, 2.5, rng.uniform(0, 4)]),
+                "credit_rating": rng.choice(ratings),
+                "audit_opinion": rng.choice(opinions),
+            }
+        )
+        last_inspection = None
+        if rng.random() > 0.1:
+            last_inspection = (now - timedelta(days=rng.randint(0, 800))).strftime("%Y-%m-%d")
+        compliance.append(
+            {
+                "violations": rng.randint(0, 5),
+                "certifications": ["ISO9001"] * rng.randint(0, 6),
+                "last_inspection": last_inspection,
+            }
+        )
+        supplier_ids.append(f"SUP-{i % 8:03d}")
+        industries_used.append(rng.choice(industries))
+    return financial, compliance, supplier_ids, industries_used
+
+
+@pytest.mark.asyncio
+async def test_score_many_matches_scalar_path_bit_for_bit() -> None:
+    now = datetime.now()
+    skill = SupplierRiskChecker(clock=lambda: now)
+    financial, compliance, supplier_ids, industries = _random_inputs(random.Random(7), now, 500)
+    operational = [skill._get_operational_factors(sid) for sid in supplier_ids]
+    market = [await skill._fetch_market_data(industry) for industry in industries]
+
+    scores = skill.score_many(bulk_scoring.to_columns(financial, compliance, operational, market), now=now)
+
+    for i in range(len(financial)):
+        component_scores = {
+            "financial": skill._calculate_financial_score(financial[i]),
+            "compliance": skill._calculate_compliance_score(compliance[i]),
+            "operational": skill._calculate_operational_score(supplier_ids[i]),
+            "market": skill._calculate_market_score(market[i]),
+        }
+        total = sum(component_scores[k] * skill.WEIGHTS[k] for k in component_scores)
+
+        assert scores.financial[i] == component_scores["financial"]
+        assert scores.compliance[i] == component_scores["compliance"]
+        assert scores.operational[i] == component_scores["operational"]
+        assert scores.market[i] == component_scores["market"]
+        assert scores.total[i] == total
+        assert scores.level[i] == skill._get_risk_level(total)
+        assert scores.flag_codes(i) == [f["code"] for f in skill._generate_risk_flags(component_scores, total)]
+
+    await skill.aclose()
+
+
+def test_score_many_uses_current_weights_and_thresholds() -> None:
+    now = datetime(2026, 1, 31)
+    financial = [{"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}]
+    compliance = [{"violations": 0, "certifications": [], "last_inspection": "2026-01-01"}]
+    operational = [{"delivery_reliability": 0.9, "quality_score": 0.9, "response_time": 0.9}]
+    market = [{"volatility": 0.5, "growth": 0.5, "competition": 0.5}]
+    columns = bulk_scoring.to_columns(financial, compliance, operational, market)
+
+    class FinancialOnly(SupplierRiskChecker):
+        WEIGHTS = {"financial": 1.0, "compliance": 0.0, "operational": 0.0, "market": 0.0}
+        THRESHOLDS = {"low_risk": 9.5, "medium_risk": 9.0, "high_risk": 0.0}
+
+    scores = FinancialOnly().score_many(columns, now=now)
+    assert np.array_equal(scores.total, scores.financial)
+    assert list(scores.level) == ["HIGH"]
+    assert scores.flag_codes(0) == ["OVERALL_HIGH_RISK"]
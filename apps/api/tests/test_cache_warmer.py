@@ -0,0 +1,102 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from procuator.skills.cache_warmer import CacheWarmer, read_recent_audit_lines, warmup_targets
+
+
+def _event(supplier_id: str, industry: str | None = None) -> str:
+    metadata = {"industry": industry} if industry else {}
+    return json.dumps({"supplier_id": supplier_id, "decision": "APPROVE", "metadata": metadata})
+
+
+def test_warmup_targets_orders_by_frequency_then_catalog() -> None:
+    lines = [
+        _event("SUP-002", "manufacturing"),
+        _event("SUP-001", "technology"),
+        _event("SUP-002", "manufacturing"),
+        _event("SUP-009"),  # no industry recorded: taken from the catalog
+        "not json",
+    ]
+    catalog = {
+        "SUP-001": {"industry": "technology"},
+        "SUP-009": {"industry": "technology"},
+        "SUP-010": {"industry": "manufacturing"},
+    }
+
+    targets = warmup_targets(lines, catalog, limit=10)
+
+    assert targets == [
+        {"supplier_id": "SUP-002", "industry": "manufacturing"},
+        {"supplier_id": "SUP-001", "industry": "technology"},
+        {"supplier_id": "SUP-009", "industry": "technology"},
+        {"supplier_id": "SUP-010", "industry": "manufacturing"},
+    ]
+    assert len(warmup_targets(lines, catalog, limit=2)) == 2
+
+
+def test_read_recent_audit_lines_drops_partial_first_line(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    path.write_text("\n".join(_event(f"SUP-{i:03d}") for i in range(100)) + "\n", encoding="utf-8")
+
+    lines = read_recent_audit_lines(path, max_bytes=500)
+
+    assert lines
+    assert all(json.loads(line)["supplier_id"] for line in lines)
+    assert json.loads(lines[-1])["supplier_id"] == "SUP-099"
+    assert read_recent_audit_lines(tmp_path / "missing.jsonl") == []
+
+
+@pytest.mark.asyncio
+async def test_cache_warmer_reports_ready_at_fraction() -> None:
+    release = asyncio.Event()
+    scored: list[str] = []
+
+    class SlowSkill:
+        async def execute(self, inputs: dict) -> dict:
+            if inputs["supplier_id"] == "SUP-LAST":
+                await release.wait()
+            scored.append(inputs["supplier_id"])
+            return {}
+
+    targets = [{"supplier_id": f"SUP-{i}", "industry": "general"} for i in range(9)]
+    targets.append({"supplier_id": "SUP-LAST", "industry": "general"})
+    warmer = CacheWarmer(SlowSkill(), concurrency=4, ready_fraction=0.9)
+
+    task = asyncio.create_task(warmer.run(targets))
+    await asyncio.wait_for(warmer.wait_ready(), timeout=1)
+    assert warmer.ready
+    assert not warmer.finished
+    assert warmer.status()["completed"] == 9
+
+    release.set()
+    await task
+    assert warmer.status()["warm_fraction"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_cache_warmer_counts_fallback_results_as_failed() -> None:
+    class DegradedSkill:
+        async def execute(self, inputs: dict) -> dict:
+            n = int(inputs["supplier_id"].rsplit("-", 1)[1])
+            if n % 2:
+                return {"metadata": {"defaults_used": ["financial"]}}
+            if n == 4:
+                return {"metadata": {"status": "PARTIAL"}}
+            return {"metadata": {}}
+
+    targets = [{"supplier_id": f"SUP-{i}", "industry": "general"} for i in range(10)]
+    warmer = CacheWarmer(DegradedSkill(), ready_fraction=0.5)
+
+    task = asyncio.create_task(warmer.run(targets))
+    await asyncio.sleep(0)
+    assert not warmer.ready
+    await task
+
+    status = warmer.status()
+    assert status["completed"] == 10
+    assert status["warmed"] == 4
+    assert status["failed"] == 6
+    assert status["warm_fraction"] == 0.4
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+
+from procuator.skills.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 31, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_breaker_opens_after_threshold_and_rejects() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.times_opened == 1
+
+
+def test_breaker_half_open_allows_single_probe() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=timedelta(seconds=30), clock=clock)
+    breaker.record_failure()
+
+    clock.now += timedelta(seconds=31)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += timedelta(seconds=31)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_recovers_from_lost_probe() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=timedelta(seconds=30), clock=clock)
+    breaker.record_failure()
+    clock.now += timedelta(seconds=31)
+    assert breaker.allow()  # probe whose caller never reports back
+
+    clock.now += timedelta(seconds=31)
+    assert breaker.allow()
@@ -0,0 +1,93 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from procuator.skills.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_on_fast_calls_and_halves_once_per_burst() -> None:
+    timer = FakeTimer()
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, latency_target=timedelta(seconds=1), timer=timer)
+
+    for _ in range(8):
+        async with limiter.slot():
+            timer.now += 0.1
+    assert limiter.limit == 5
+
+    release = asyncio.Event()
+
+    async def failing() -> None:
+        async with limiter.slot():
+            await release.wait()
+            raise ConnectionError("upstream down")
+
+    tasks = [asyncio.create_task(failing()) for _ in range(4)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Four concurrent failures from the same window count as one decrease.
+    assert limiter.limit == 2
+    assert limiter.overloads == 4
+
+
+@pytest.mark.asyncio
+async def test_non_overload_errors_do_not_shrink_the_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, is_overload=lambda exc: not isinstance(exc, LookupError))
+
+    with pytest.raises(LookupError):
+        async with limiter.slot():
+            raise LookupError("unknown supplier")
+
+    assert limiter.limit == 4
+    assert limiter.successes == 1
+
+
+@pytest.mark.asyncio
+async def test_excess_calls_queue_then_shed() -> None:
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=1, max_limit=1, max_queue=1, queue_timeout=timedelta(milliseconds=50)
+    )
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def call(name: str) -> None:
+        async with limiter.slot():
+            order.append(name)
+            await release.wait()
+
+    first = asyncio.create_task(call("first"))
+    second = asyncio.create_task(call("second"))
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 1
+
+    with pytest.raises(ConcurrencyLimitExceeded, match="queue is full"):
+        await call("third")
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert order == ["first", "second"]
+
+    release.clear()
+    blocker = asyncio.create_task(call("blocker"))
+    await asyncio.sleep(0)
+    with pytest.raises(ConcurrencyLimitExceeded, match="timed out"):
+        await call("late")
+    release.set()
+    await blocker
+
+    stats = limiter.stats()
+    assert stats["shed"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["in_flight"] == 0
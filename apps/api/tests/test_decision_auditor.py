@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+from procuator.skills.decision_auditor import AuditEvent, AuditEventRing, ColumnarAuditEventRing, DecisionAuditor
+
+
+@pytest.fixture(autouse=True)
+def _audit_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AUDIT_LOG_PATH", str(tmp_path / "audit.jsonl"))
+
+
+def _event(decision: str, risk_score: float | None = None, flags: list[str] | None = None) -> AuditEvent:
+    return AuditEvent(
+        event_type="decision",
+        request_id=f"REQ-{decision}",
+        supplier_id="SUP-001",
+        decision=decision,
+        explanation=[],
+        risk_score=risk_score,
+        policy_flags=flags or [],
+    )
+
+
+@pytest.mark.asyncio
+async def test_subscribers_get_events_with_deltas_that_track_counters() -> None:
+    auditor = DecisionAuditor(max_events=2)
+    subscription = auditor.subscribe()
+    state = auditor.counters()
+
+    for event in (
+        _event("APPROVE", 8.0),
+        _event("REFER", 4.0, ["new_supplier"]),
+        _event("DENY", None, ["new_supplier"]),
+    ):
+        auditor.record(event)
+        delta = (await subscription.get())["delta"]
+        state["total"] += delta["total"]
+        state["risk_score_sum"] += delta["risk_score_sum"]
+        state["risk_score_count"] += delta["risk_score_count"]
+        for key in ("counts_by_decision", "flag_counts"):
+            for name, change in delta[key].items():
+                state[key][name] = state[key].get(name, 0) + change
+                if not state[key][name]:
+                    del state[key][name]
+
+    # The third event evicted the APPROVE from the two-event buffer.
+    assert state == auditor.counters()
+    assert state["counts_by_decision"] == {"REFER": 1, "DENY": 1}
+    assert state["flag_counts"] == {"new_supplier": 2}
+
+    subscription.close()
+    auditor.record(_event("APPROVE"))
+    assert auditor.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_messages() -> None:
+    auditor = DecisionAuditor()
+    subscription = auditor.subscribe(max_buffer=2)
+    for decision in ("APPROVE", "REFER", "DENY"):
+        auditor.record(_event(decision))
+
+    assert subscription.dropped == 1
+    assert [(await subscription.get())["event"]["decision"] for _ in range(2)] == ["REFER", "DENY"]
+
+
+@pytest.mark.parametrize("ring_type", [AuditEventRing, ColumnarAuditEventRing])
+def test_ring_keeps_newest_events_in_order(ring_type: type[AuditEventRing]) -> None:
+    ring = ring_type(3)
+    events = [
+        _event("APPROVE", 8.0),
+        _event("REFER", 4.5, ["new_supplier"]),
+        _event("DENY", None, ["budget_exceeded", "new_supplier"]),
+        _event("REFER", 5.0, ["new_supplier"]),
+        _event("APPROVE", 7.25),
+    ]
+    for n, event in enumerate(events):
+        event.request_id = f"REQ-{n}"
+        event.metadata = {"referral_id": f"ref-{n}", "risk_partial": False}
+        ring.append(event)
+
+    assert len(ring) == 3
+    assert ring.full
+    assert list(ring) == events[2:]
+    assert ring.oldest() == events[2]
+    assert ring.decision_counts() == {"DENY": 1, "REFER": 1, "APPROVE": 1}
+    assert ring.flag_counts() == {"budget_exceeded": 1, "new_supplier": 2}
+    assert ring.risk_score_stats() == (12.25, 2)
+
+
+def test_columnar_ring_frees_interned_values_of_evicted_events() -> None:
+    ring = ColumnarAuditEventRing(2)
+    for n in range(100):
+        event = _event("REFER")
+        event.metadata = {"referral_id": f"ref-{n}"}
+        ring.append(event)
+
+    assert len(ring._interners["metadata"]) == 2
+    assert len(ring._interners["decision"]) == 1
+    assert [e.metadata["referral_id"] for e in ring] == ["ref-98", "ref-99"]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_analytics_are_the_same_for_both_layouts(columnar: bool) -> None:
+    auditor = DecisionAuditor(max_events=2, columnar=columnar)
+    for event in (_event("APPROVE", 9.0), _event("REFER", 4.0, ["new_supplier"]), _event("DENY", 2.0)):
+        auditor.record(event)
+
+    assert auditor.analytics() == {
+        "total": 2,
+        "counts_by_decision": {"REFER": 1, "DENY": 1},
+        "avg_risk_score": 3.0,
+        "top_flags": [{"flag": "new_supplier", "count": 1}],
+    }
+    assert [e["decision"] for e in auditor.events()] == ["REFER", "DENY"]
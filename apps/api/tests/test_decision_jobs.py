@@ -0,0 +1,106 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from procuator.decision_jobs import DecisionJobQueue, JobQueueFull
+from procuator.idempotency import IdempotencyConflict
+
+
+class StubPipeline:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.decided: list[dict] = []
+
+    async def decide(self, request: dict) -> dict:
+        await self.release.wait()
+        if request.get("supplier_id") == "SUP-BOOM":
+            raise RuntimeError("risk backend exploded")
+        self.decided.append(request)
+        return {"request_id": request.get("request_id"), "decision": "APPROVE"}
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_on_workers_and_full_queue_is_rejected() -> None:
+    pipeline = StubPipeline()
+    jobs = DecisionJobQueue(pipeline, workers=1, max_queue=2)  # type: ignore[arg-type]
+
+    first = jobs.submit({"request_id": "REQ-1", "supplier_id": "SUP-001"})
+    await asyncio.sleep(0)  # the worker picks REQ-1 up and blocks in decide
+    assert jobs.submit({"request_id": "REQ-1", "supplier_id": "SUP-001", "refresh_cache": True}) is first
+    with pytest.raises(IdempotencyConflict):
+        jobs.submit({"request_id": "REQ-1", "supplier_id": "SUP-999"})
+    failing = jobs.submit({"supplier_id": "SUP-BOOM"})
+    jobs.submit({"supplier_id": "SUP-002"})
+    with pytest.raises(JobQueueFull) as full:
+        jobs.submit({"supplier_id": "SUP-003"})
+    assert full.value.retry_after >= 1
+    assert first.status == "RUNNING"
+
+    pipeline.release.set()
+    await jobs.aclose()
+
+    assert first.to_dict()["result"] == {"request_id": "REQ-1", "decision": "APPROVE"}
+    assert first.status == "DONE"
+    assert failing.status == "FAILED"
+    assert failing.error == "risk backend exploded"
+    assert jobs.get(first.job_id) is first
+    assert [r["supplier_id"] for r in pipeline.decided] == ["SUP-001", "SUP-002"]
+    assert jobs.stats()["rejected"] == 1
+    assert jobs.stats()["completed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_finished_job_is_posted_to_an_allowed_callback() -> None:
+    received: list[dict] = []
+
+    async def callback(request: web.Request) -> web.Response:
+        received.append(await request.json())
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/done", callback)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+
+    pipeline = StubPipeline()
+    pipeline.release.set()
+    jobs = DecisionJobQueue(pipeline, workers=2)  # type: ignore[arg-type]
+    try:
+        with pytest.raises(ValueError, match="callback host"):
+            jobs.submit({"supplier_id": "SUP-001"}, callback_url="http://example.com/done")
+
+        job = jobs.submit(
+            {"request_id": "REQ-CB", "supplier_id": "SUP-001"}, callback_url=str(server.make_url("/done"))
+        )
+        await jobs.aclose()
+    finally:
+        await server.close()
+
+    assert job.callback_status == "SENT"
+    assert received == [{**job.to_dict(), "callback_status": None}]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_unfinished_jobs_and_keeps_the_queue_closed() -> None:
+    pipeline = StubPipeline()  # never released
+    jobs = DecisionJobQueue(pipeline, workers=1, drain_timeout=timedelta(milliseconds=20))  # type: ignore[arg-type]
+    running = jobs.submit({"request_id": "REQ-1", "supplier_id": "SUP-001"})
+    queued = jobs.submit({"request_id": "REQ-2", "supplier_id": "SUP-002"})
+    await asyncio.sleep(0)
+
+    await jobs.aclose()
+
+    assert running.status == queued.status == "CANCELLED"
+    assert running.finished and queued.finished_at is not None
+    assert jobs.stats()["cancelled"] == 2
+    with pytest.raises(RuntimeError, match="shut down"):
+        jobs.submit({"request_id": "REQ-3", "supplier_id": "SUP-003"})
+
+    jobs.reopen()
+    pipeline.release.set()
+    again = jobs.submit({"request_id": "REQ-1", "supplier_id": "SUP-001"})
+    await jobs.aclose()
+    assert again.status == "DONE"
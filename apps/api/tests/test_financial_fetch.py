@@ -0,0 +1,85 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from conftest import FinancialApiStub
+
+from procuator.config import HttpPoolSettings
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+
+@pytest.mark.asyncio
+async def test_single_fetch_uses_tuned_pool(financial_api: FinancialApiStub) -> None:
+    skill = SupplierRiskChecker(http_pool=HttpPoolSettings(limit=10, limit_per_host=4, dns_cache_ttl=60))
+
+    data = await skill._fetch_financial_data("SUP-001")
+
+    assert data["revenue_12m"] == 25_000_000
+    assert data["credit_rating"] == "AA"
+    assert financial_api.requests == ["GET SUP-001"]
+    session = await skill._get_session()
+    assert session.connector.limit == 10
+    assert session.connector.limit_per_host == 4
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_batches_concurrent_misses(financial_api: FinancialApiStub) -> None:
+    skill = SupplierRiskChecker(financial_bulk_window=timedelta(milliseconds=20))
+
+    results = await asyncio.gather(
+        *(skill.execute({"supplier_id": sid, "industry": "general"}) for sid in ["SUP-001", "SUP-002", "SUP-003"])
+    )
+
+    assert financial_api.requests == ["POST SUP-001,SUP-002,SUP-003"]
+    assert [r["supplier_id"] for r in results] == ["SUP-001", "SUP-002", "SUP-003"]
+    assert results[0]["component_scores"]["financial"] > results[1]["component_scores"]["financial"]
+    assert skill.cache_stats()["financial_bulk"]["batches"] == 1
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_missing_supplier_is_negative_cached(financial_api: FinancialApiStub) -> None:
+    skill = SupplierRiskChecker(financial_bulk_window=timedelta(milliseconds=5))
+
+    data = await skill._fetch_financial_data("SUP-404")
+    again = await skill._fetch_financial_data("SUP-404")
+
+    assert data["credit_rating"] == "D"
+    assert again["credit_rating"] == "D"
+    assert financial_api.requests == ["POST SUP-404"]
+    assert skill.cache_stats()["financial_breaker"]["consecutive_failures"] == 0
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_count_towards_breaker(financial_api: FinancialApiStub) -> None:
+    financial_api.fail_with = 503
+    skill = SupplierRiskChecker()
+
+    for sid in ["SUP-001", "SUP-002"]:
+        data = await skill._fetch_financial_data(sid)
+        assert data["default_used"] is True
+
+    assert skill.cache_stats()["financial_breaker"]["consecutive_failures"] == 2
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_request_counts_once_towards_breaker(financial_api: FinancialApiStub) -> None:
+    financial_api.fail_with = 503
+    skill = SupplierRiskChecker(financial_bulk_window=timedelta(milliseconds=20))
+
+    results = await asyncio.gather(*(skill._fetch_financial_data(f"SUP-{n:03d}") for n in range(10)))
+
+    assert all(r["default_used"] for r in results)
+    assert len(financial_api.requests) == 1
+    stats = skill.cache_stats()
+    assert stats["financial_breaker"]["consecutive_failures"] == 1
+    assert stats["financial_negative_cache"]["entries"] == 10
+
+    await skill.aclose()
@@ -0,0 +1,104 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from procuator.idempotency import IdempotencyConflict, IdempotencyStore
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 31, 9, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_replays_stored_response_until_retention_expires() -> None:
+    clock = Clock()
+    store = IdempotencyStore(retention=timedelta(minutes=10), clock=clock)
+    calls = 0
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        return {"decision": "APPROVE", "call": calls}
+
+    first = await store.run("REQ-1", "fp", compute)
+    first["decision"] = "mutated by caller"
+    again = await store.run("REQ-1", "fp", compute)
+    assert again == {"decision": "APPROVE", "call": 1}
+
+    with pytest.raises(IdempotencyConflict):
+        await store.run("REQ-1", "other", compute)
+
+    clock.now += timedelta(minutes=11)
+    assert (await store.run("REQ-1", "other", compute))["call"] == 2
+    assert store.stats()["replays"] == 1
+    assert store.stats()["conflicts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_computation_and_failures_are_not_stored() -> None:
+    store = IdempotencyStore(max_entries=1)
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"call": calls}
+
+    tasks = [asyncio.create_task(store.run("REQ-1", "fp", compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    assert [r["call"] for r in await asyncio.gather(*tasks)] == [1, 1, 1]
+    assert calls == 1
+    assert store.stats()["joined"] == 2
+
+    async def boom() -> dict:
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await store.run("REQ-2", "fp", boom)
+    assert (await store.run("REQ-2", "fp", compute))["call"] == 2
+    # max_entries=1: REQ-1 was evicted by REQ-2.
+    assert (await store.run("REQ-1", "fp", compute))["call"] == 3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_takes_over_when_the_first_caller_is_cancelled() -> None:
+    store = IdempotencyStore()
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute() -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"call": calls}
+
+    owner = asyncio.create_task(store.run("REQ-1", "fp", compute))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(store.run("REQ-1", "fp", compute))
+    await asyncio.sleep(0)
+
+    owner.cancel()  # e.g. the first client disconnected
+    await asyncio.sleep(0)
+    release.set()
+    assert await joiner == {"call": 2}
+    assert owner.cancelled()
+    assert store.stats()["takeovers"] == 1
+
+    # A cancelled joiner still just cancels itself.
+    release.clear()
+    owner = asyncio.create_task(store.run("REQ-2", "fp", compute))
+    await asyncio.sleep(0)
+    joiner = asyncio.create_task(store.run("REQ-2", "fp", compute))
+    await asyncio.sleep(0)
+    joiner.cancel()
+    release.set()
+    assert await owner == {"call": 3}
+    assert joiner.cancelled()
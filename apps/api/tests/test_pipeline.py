@@ -0,0 +1,77 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from procuator.pipeline import STAGES, DecisionPipeline
+
+REQUEST = {"amount": 1000, "budget_remaining": 50_000, "requester_approval_limit": 5000}
+
+
+class StubRisk:
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.calls: list[dict] = []
+        self.delays = delays or {}
+        self.closed = False
+
+    async def execute(self, inputs: dict) -> dict:
+        self.calls.append(inputs)
+        await asyncio.sleep(self.delays.get(inputs["supplier_id"], 0))
+        if inputs["supplier_id"] == "SUP-BOOM":
+            raise RuntimeError("risk backend exploded")
+        return {"risk_level": "LOW", "risk_score": 8.0, "risk_flags": []}
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def _audit_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AUDIT_LOG_PATH", str(tmp_path / "audit.jsonl"))
+
+
+@pytest.mark.asyncio
+async def test_decide_records_stage_timings_and_closes_risk() -> None:
+    risk = StubRisk()
+    async with DecisionPipeline(risk) as pipeline:  # type: ignore[arg-type]
+        approved = await pipeline.decide(
+            {**REQUEST, "supplier_id": "SUP-001", "supplier_history": {"total_transactions": 9}}
+        )
+        denied = await pipeline.decide({**REQUEST, "supplier_id": "SUP-002", "amount": 0})
+
+    assert approved["decision"] == "APPROVE"
+    assert set(approved["timings_ms"]) == set(STAGES)
+    assert denied["decision"] == "DENY"
+    assert "risk" not in denied["timings_ms"]
+    assert [c["supplier_id"] for c in risk.calls] == ["SUP-001"]
+    assert risk.closed is True
+
+    stats = pipeline.stats()
+    assert stats["total"]["count"] == 2
+    assert stats["risk"]["count"] == 1
+    assert stats["total"]["max_ms"] >= stats["total"]["avg_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_decide_many_yields_in_completion_order_and_isolates_failures() -> None:
+    risk = StubRisk(delays={"SUP-SLOW": 0.05})
+    pipeline = DecisionPipeline(risk)  # type: ignore[arg-type]
+    requests = [
+        (0, {**REQUEST, "supplier_id": "SUP-SLOW"}),
+        (1, {**REQUEST, "supplier_id": "SUP-BOOM", "request_id": "REQ-BOOM"}),
+        (2, {**REQUEST, "supplier_id": "SUP-001", "refresh_cache": True}),
+        (3, {**REQUEST, "supplier_id": "SUP-001", "refresh_cache": True}),
+    ]
+
+    results = [result async for result in pipeline.decide_many(requests, concurrency=4)]
+
+    assert results[-1]["index"] == 0
+    by_index = {r["index"]: r for r in results}
+    assert by_index[1] == {"index": 1, "request_id": "REQ-BOOM", "error": "risk backend exploded"}
+    assert by_index[2]["decision"] == by_index[3]["decision"] == "REFER"
+    refreshes = [c["refresh_cache"] for c in risk.calls if c["supplier_id"] == "SUP-001"]
+    assert sorted(refreshes) == [False, True]
+
+    with pytest.raises(ValueError):
+        async for _ in pipeline.decide_many(requests, concurrency=0):
+            pass
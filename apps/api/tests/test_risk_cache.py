@@ -0,0 +1,144 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from procuator.skills.risk_cache import RiskCache, SQLiteRiskCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 31, 12, 0, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs: float) -> None:
+        self.now += timedelta(**kwargs)
+
+
+def test_risk_cache_evicts_least_recently_used() -> None:
+    cache = RiskCache(max_entries=2, clock=FakeClock())
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+    assert cache.get("a") is not None
+
+    cache.set("c", {"v": 3})
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.evictions == 1
+
+
+def test_risk_cache_respects_byte_budget() -> None:
+    cache = RiskCache(max_bytes=100, clock=FakeClock())
+    for i in range(10):
+        cache.set(f"k{i}", {"payload": "x" * 30})
+
+    assert cache.bytes <= 100
+    assert len(cache) < 10
+    assert "k9" in cache
+
+
+def test_risk_cache_expires_entries_on_get_and_sweep() -> None:
+    clock = FakeClock()
+    cache = RiskCache(ttl=timedelta(minutes=5), sweep_interval=timedelta(minutes=1), clock=clock)
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+
+    clock.advance(minutes=10)
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+
+    cache.set("c", {"v": 3})  # triggers a sweep that drops "b"
+    assert "b" not in cache
+    assert cache.expirations == 2
+    assert cache.bytes == cache.get("c").size
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_sqlite_risk_cache_is_shared_between_instances(tmp_path: Path) -> None:
+    clock = FakeClock()
+    worker_a = SQLiteRiskCache(tmp_path / "risk.db", ttl=timedelta(minutes=5), clock=clock)
+    worker_b = SQLiteRiskCache(tmp_path / "risk.db", ttl=timedelta(minutes=5), clock=clock)
+
+    worker_a.set("SUP-001_technology", {"risk_score": 7.5})
+    entry = worker_b.get("SUP-001_technology")
+    assert entry is not None
+    assert entry.data == {"risk_score": 7.5}
+    assert entry.timestamp == clock.now
+
+    clock.advance(minutes=6)
+    assert worker_b.get("SUP-001_technology") is None
+    assert "SUP-001_technology" not in worker_a
+    assert worker_b.stats()["backend"] == "sqlite"
+
+    worker_a.close()
+    worker_b.close()
+
+
+def test_sqlite_risk_cache_sweep_enforces_bounds(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = SQLiteRiskCache(tmp_path / "risk.db", max_entries=5, max_bytes=200, clock=clock)
+    for i in range(8):
+        clock.advance(seconds=1)
+        cache.set(f"k{i}", {"payload": "x" * 30})
+
+    cache.sweep()
+    assert len(cache) <= 5
+    assert cache.bytes <= 200
+    assert "k7" in cache
+    assert "k0" not in cache
+    assert cache.evictions >= 3
+
+    cache.close()
+
+
+def test_sqlite_risk_cache_treats_a_locked_database_as_a_miss(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = SQLiteRiskCache(tmp_path / "risk.db", clock=clock)
+    cache.set("a", {"risk_score": 7.5})
+
+    other_worker = sqlite3.connect(tmp_path / "risk.db", isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")  # hold the write lock
+    started = time.monotonic()
+    cache.set("b", {"risk_score": 6.0})
+    assert time.monotonic() - started < 0.1
+    assert cache.stats()["busy"] == 1
+    assert cache.get("a") is not None  # WAL readers aren't blocked by the writer
+    other_worker.rollback()
+    other_worker.close()
+
+    # Sweeps run on their own thread and connection.
+    clock.advance(minutes=2)
+    cache.set("c", {"risk_score": 5.0})
+    assert cache._sweeper is not None
+    cache._sweeper.join(5)
+    assert cache._last_sweep == clock.now
+
+    cache.close()
+    assert cache.get("c") is not None  # reconnects after close
+    cache.close()
+
+
+def test_cached_results_are_frozen_and_pre_encoded() -> None:
+    cache = RiskCache(clock=FakeClock())
+    entry = cache.set("a", {"risk_score": 7.5, "risk_flags": [{"code": "OP_LOW"}], "metadata": {"v": "1.2.0"}})
+
+    assert entry.json() == b'{"risk_score":7.5,"risk_flags":[{"code":"OP_LOW"}],"metadata":{"v":"1.2.0"}}'
+    assert entry.size == len(entry.encoded)
+    with pytest.raises(TypeError):
+        entry.data["risk_score"] = 0.0
+    with pytest.raises(TypeError):
+        entry.data["metadata"]["v"] = "x"
+    with pytest.raises(AttributeError):
+        entry.data["risk_flags"].append({"code": "FIN_LOW"})
+
+    copy = {**entry.data, "risk_score": 1.0}
+    assert copy["risk_score"] == 1.0
+    assert entry.data["risk_score"] == 7.5
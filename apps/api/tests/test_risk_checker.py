@@ -1,5 +1,13 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+import aiohttp
 import pytest
 
+from procuator.skills.circuit_breaker import CircuitBreaker
+from procuator.skills.concurrency_limiter import AdaptiveConcurrencyLimiter
 from procuator.skills.supplier_risk_checker import SupplierRiskChecker
 
 
@@ -25,3 +33,301 @@ async def test_risk_checker_returns_expected_shape() -> None:
     assert result["risk_level"] in {"LOW", "MEDIUM", "HIGH", "UNKNOWN"}
 
     await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch() -> None:
+    skill = SupplierRiskChecker()
+    calls = 0
+
+    async def slow_financial(_: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = slow_financial  # type: ignore[method-assign]
+
+    results = await asyncio.gather(
+        *(skill.execute({"supplier_id": "SUP-001", "industry": "technology"}) for _ in range(10))
+    )
+
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    stats = skill.cache_stats()
+    assert stats["coalesced"] == 9
+    assert stats["inflight"] == 0
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_refresh_does_not_join_a_plain_assessment_in_flight() -> None:
+    skill = SupplierRiskChecker()
+    calls = 0
+
+    async def slow_financial(_: str) -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = slow_financial  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology"}
+
+    await asyncio.gather(
+        skill.execute(inputs),
+        skill.execute({**inputs, "refresh_cache": True}),
+        skill.execute({**inputs, "refresh_cache": ["financial"]}),
+        skill.execute({**inputs, "refresh_cache": "financial"}),  # same refresh set: shares that flight
+    )
+
+    assert calls == 3
+    assert skill.cache_stats()["coalesced"] == 1
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stale_result_served_while_refreshing_in_background() -> None:
+    now = datetime(2026, 1, 31, 12, 0, 0)
+    skill = SupplierRiskChecker(
+        cache_ttl=timedelta(hours=1),
+        cache_hard_ttl=timedelta(hours=2),
+        component_ttls={"financial": timedelta(minutes=30)},
+        clock=lambda: now,
+    )
+    calls = 0
+
+    async def financial(_: str) -> dict:
+        nonlocal calls
+        calls += 1
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology"}
+
+    first = await skill.execute(inputs)
+    assert "stale" not in first["metadata"]
+
+    now += timedelta(minutes=90)
+    stale = await skill.execute(inputs)
+    assert stale["metadata"]["stale"] is True
+    assert stale["metadata"]["age_seconds"] == 5400.0
+    assert stale["risk_score"] == first["risk_score"]
+
+    await asyncio.gather(*skill._inflight.values())  # let the background refresh finish
+    assert calls == 2
+    refreshed = await skill.execute(inputs)
+    assert "stale" not in refreshed["metadata"]
+
+    now += timedelta(hours=3)
+    await skill.execute(inputs)  # past the hard TTL: synchronous re-fetch
+    assert calls == 3
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_scores_each_unique_supplier_once() -> None:
+    skill = SupplierRiskChecker()
+    fetched: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def financial(supplier_id: str) -> dict:
+        nonlocal in_flight, peak
+        fetched.append(supplier_id)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    await skill.execute({"supplier_id": "SUP-000", "industry": "general"})  # warm one entry
+
+    items = [{"supplier_id": f"SUP-{i % 6:03d}", "industry": "general"} for i in range(30)]
+    results = await skill.execute_batch(items, concurrency=2)
+
+    assert [r["supplier_id"] for r in results] == [item["supplier_id"] for item in items]
+    assert sorted(fetched) == [f"SUP-{i:03d}" for i in range(6)]
+    assert peak <= 2
+
+    await skill.aclose()
+
+
+class _FailingSession:
+    closed = False
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get(self, *_: object, **__: object) -> None:
+        self.calls += 1
+        raise aiohttp.ClientConnectionError("financial API down")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_financial_outage_trips_breaker_and_negative_caches() -> None:
+    skill = SupplierRiskChecker(financial_breaker=CircuitBreaker(failure_threshold=2))
+    session = _FailingSession()
+
+    async def get_session() -> _FailingSession:
+        return session
+
+    skill._get_session = get_session  # type: ignore[method-assign]
+
+    for i in range(10):
+        result = await skill.execute({"supplier_id": f"SUP-{i:03d}", "industry": "general"})
+        assert result["component_scores"]["financial"] == 0.0
+
+    assert session.calls == 2
+    stats = skill.cache_stats()
+    assert stats["financial_breaker"]["state"] == CircuitBreaker.OPEN
+    assert stats["financial_breaker"]["rejected"] == 8
+
+    skill._financial_breaker.record_success()  # upstream back, but SUP-000 failed recently
+    await skill.execute({"supplier_id": "SUP-000", "industry": "general", "refresh_cache": True})
+    assert session.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_results_scored_from_defaults_are_not_cached_past_the_negative_ttl() -> None:
+    now = datetime(2026, 1, 31, 12, 0, 0)
+    skill = SupplierRiskChecker(negative_cache_ttl=timedelta(seconds=60), clock=lambda: now)
+    upstream_down = True
+
+    async def financial(_: str) -> dict:
+        if upstream_down:
+            raise aiohttp.ClientConnectionError("financial API down")
+        return {"revenue": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_single = financial  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology"}
+
+    outage = await skill.execute(inputs)
+    assert outage["metadata"]["defaults_used"] == ["financial"]
+    assert skill.cache_stats()["entries"] == 0
+
+    upstream_down = False
+    now += timedelta(seconds=30)  # still negative-cached
+    assert (await skill.execute(inputs))["metadata"]["defaults_used"] == ["financial"]
+
+    now += timedelta(seconds=31)
+    recovered = await skill.execute(inputs)
+    assert "defaults_used" not in recovered["metadata"]
+    assert recovered["component_scores"]["financial"] > outage["component_scores"]["financial"]
+    assert skill.cache_stats()["entries"] == 1
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_component_caches_limit_refetch_to_requested_source() -> None:
+    skill = SupplierRiskChecker()
+    calls: dict[str, int] = {"financial": 0, "compliance": 0, "market": 0}
+
+    def counting(name: str, fetch: Callable[[str], Awaitable[dict]]) -> Callable[[str], Awaitable[dict]]:
+        async def wrapper(key: str) -> dict:
+            calls[name] += 1
+            return await fetch(key)
+
+        return wrapper
+
+    async def financial(_: str) -> dict:
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = counting("financial", financial)  # type: ignore[method-assign]
+    skill._fetch_compliance_data = counting("compliance", skill._fetch_compliance_data)  # type: ignore[method-assign]
+    skill._fetch_market_data = counting("market", skill._fetch_market_data)  # type: ignore[method-assign]
+
+    await skill.execute({"supplier_id": "SUP-001", "industry": "technology"})
+    await skill.execute({"supplier_id": "SUP-002", "industry": "technology"})
+    assert calls == {"financial": 2, "compliance": 2, "market": 1}  # market shared by industry
+
+    await skill.execute({"supplier_id": "SUP-001", "industry": "technology", "refresh_cache": "financial"})
+    assert calls == {"financial": 3, "compliance": 2, "market": 1}
+
+    await skill.execute({"supplier_id": "SUP-001", "industry": "technology", "refresh_cache": True})
+    assert calls == {"financial": 4, "compliance": 3, "market": 2}
+
+    with pytest.raises(ValueError, match="Unknown risk components"):
+        await skill.execute({"supplier_id": "SUP-001", "refresh_cache": ["weather"]})
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_execute_json_reuses_pre_encoded_bytes_on_hits() -> None:
+    skill = SupplierRiskChecker()
+
+    async def financial(_: str) -> dict:
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology"}
+
+    first = await skill.execute_json(inputs)
+    second = await skill.execute_json(inputs)
+
+    assert second is first
+    assert json.loads(first) == json.loads(json.dumps(await skill.execute(inputs)))
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_budget_returns_partial_result_and_finishes_in_background() -> None:
+    skill = SupplierRiskChecker()
+    release = asyncio.Event()
+
+    async def slow_financial(key: str) -> dict:
+        await release.wait()
+        return await financial(key)
+
+    async def financial(_: str) -> dict:
+        return {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    reference = SupplierRiskChecker()
+    reference._fetch_financial_data = financial  # type: ignore[method-assign]
+    full_confidence = (await reference.execute({"supplier_id": "SUP-001", "industry": "technology"}))["confidence"]
+    skill._fetch_financial_data = slow_financial  # type: ignore[method-assign]
+
+    partial = await skill.execute({"supplier_id": "SUP-001", "industry": "technology", "budget_ms": 20})
+
+    assert partial["metadata"]["status"] == "PARTIAL"
+    assert partial["metadata"]["missing_components"] == ["financial"]
+    assert partial["component_scores"]["financial"] == 5.0
+    assert partial["confidence"] < full_confidence
+    assert skill.cache_stats()["partial_served"] == 1
+
+    release.set()
+    await asyncio.gather(*skill._inflight.values())
+    complete = await skill.execute({"supplier_id": "SUP-001", "industry": "technology", "budget_ms": 20})
+    assert "status" not in complete["metadata"]
+
+    with pytest.raises(ValueError, match="budget_ms"):
+        await skill.execute({"supplier_id": "SUP-002", "budget_ms": 0})
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_shed_financial_calls_fall_back_without_penalising_supplier() -> None:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1, max_queue=0)
+    skill = SupplierRiskChecker(financial_limiter=limiter)
+
+    async with limiter.slot():  # saturate the limit
+        result = await skill.execute({"supplier_id": "SUP-001", "industry": "technology"})
+
+    assert result["component_scores"]["financial"] == 0.0
+    stats = skill.cache_stats()
+    assert stats["financial_limiter"]["shed"] == 1
+    assert stats["financial_breaker"]["consecutive_failures"] == 0
+    assert stats["financial_negative_cache"]["entries"] == 0
+
+    await skill.aclose()
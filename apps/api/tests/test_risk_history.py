@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from procuator.skills.risk_history import RiskHistory, content_digest
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+T0 = datetime(2026, 1, 31, 12, 0, 0)
+
+
+def _result(score: float, level: str = "MEDIUM") -> dict:
+    return {"risk_score": score, "risk_level": level, "component_scores": {"financial": score}}
+
+
+def test_content_digest_ignores_key_order() -> None:
+    assert content_digest({"a": 1, "b": [1, 2]}) == content_digest({"b": [1, 2], "a": 1})
+    assert content_digest({"a": 1}) != content_digest({"a": 2})
+
+
+def test_history_records_only_changes() -> None:
+    history = RiskHistory(max_suppliers=2, max_points=2)
+    digests = {"financial": "f1", "market": "m1"}
+
+    assert history.record("SUP-001_general", digests, _result(6.0), at=T0)
+    assert not history.record("SUP-001_general", digests, _result(6.0), at=T0 + timedelta(hours=1))
+    assert history.record("SUP-001_general", {**digests, "market": "m2"}, _result(6.0), at=T0 + timedelta(hours=2))
+
+    points = history.points("SUP-001_general")
+    assert [p["changed_inputs"] for p in points] == [["financial", "market"], ["market"]]
+    assert points[0]["last_seen"] == (T0 + timedelta(hours=1)).isoformat()
+
+    history.record("SUP-001_general", digests, _result(4.0, "HIGH"), at=T0 + timedelta(hours=3))
+    assert [p["risk_score"] for p in history.points("SUP-001_general")] == [6.0, 4.0]  # max_points
+
+    history.record("SUP-002_general", digests, _result(5.0), at=T0)
+    history.record("SUP-003_general", digests, _result(5.0), at=T0)
+    assert history.latest("SUP-001_general") is None  # least recently scored supplier dropped
+    assert history.points("SUP-001_general") == []
+
+
+@pytest.mark.asyncio
+async def test_unchanged_inputs_reuse_previous_result() -> None:
+    skill = SupplierRiskChecker()
+    financial = {"revenue_12m": 5_000_000, "credit_rating": "A", "audit_opinion": "clean"}
+
+    async def fetch_financial(_: str) -> dict:
+        return dict(financial)
+
+    skill._fetch_financial_data = fetch_financial  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology", "refresh_cache": True}
+
+    first = await skill.execute(inputs)
+    second = await skill.execute(inputs)
+    assert second["risk_flags"] is first["risk_flags"]  # reused, not recomputed
+    assert skill.cache_stats()["history"]["unchanged_inputs"] == 1
+
+    financial["credit_rating"] = "CCC"
+    third = await skill.execute(inputs)
+    assert third["component_scores"]["financial"] < first["component_scores"]["financial"]
+
+    points = skill.risk_history("SUP-001", "technology")
+    assert len(points) == 2
+    assert points[1]["changed_inputs"] == ["financial"]
+
+    await skill.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_inputs_are_rescored_once_the_inspection_ages() -> None:
+    now = T0
+    skill = SupplierRiskChecker(clock=lambda: now)
+
+    async def fetch_compliance(_: str) -> dict:
+        return {"violations": 0, "certifications": [], "last_inspection": "2025-12-01"}
+
+    skill._fetch_compliance_data = fetch_compliance  # type: ignore[method-assign]
+    inputs = {"supplier_id": "SUP-001", "industry": "technology", "refresh_cache": True}
+
+    first = await skill.execute(inputs)
+    assert first["component_scores"]["compliance"] == 7.0
+
+    now += timedelta(days=30)
+    assert (await skill.execute(inputs))["component_scores"]["compliance"] == 7.0
+    assert skill.cache_stats()["history"]["unchanged_inputs"] == 1
+
+    now += timedelta(days=365)  # the same inspection is now more than 12 months old
+    aged = await skill.execute(inputs)
+    assert aged["component_scores"]["compliance"] == 5.0
+    assert skill.cache_stats()["history"]["unchanged_inputs"] == 1
+    assert skill.risk_history("SUP-001", "technology")[-1]["changed_inputs"] == ["compliance"]
+
+    await skill.aclose()
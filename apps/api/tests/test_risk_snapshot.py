@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from procuator.skills.risk_snapshot import RiskSnapshot, write_risk_snapshot
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+CREATED = datetime(2026, 1, 31, 2, 0, 0)
+
+
+async def _score(skill: SupplierRiskChecker, targets: list[tuple[str, str]]) -> list[tuple[str, str, dict]]:
+    async def financial(_: str) -> dict:
+        return {"revenue_12m": 500_000, "credit_rating": "B", "audit_opinion": "qualified", "profit_margin": -0.1}
+
+    skill._fetch_financial_data = financial  # type: ignore[method-assign]
+    return [(s, i, await skill.execute({"supplier_id": s, "industry": i})) for s, i in targets]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trips_results(tmp_path: Path) -> None:
+    targets = [("SUP-004", "retail"), ("SUP-001", "technology"), ("SUP-001", "general"), ("SUP-999", "general")]
+    results = await _score(SupplierRiskChecker(), targets)
+    path = write_risk_snapshot(tmp_path / "risk.snap", results, created_at=CREATED)
+
+    snapshot = RiskSnapshot(path)
+    assert len(snapshot) == 4
+    for supplier_id, industry, expected in results:
+        entry = snapshot.get(supplier_id, industry)
+        assert entry is not None
+        data = entry.data
+        assert data["risk_score"] == expected["risk_score"]
+        assert data["risk_level"] == expected["risk_level"]
+        assert data["component_scores"] == expected["component_scores"]
+        assert data["confidence"] == expected["confidence"]
+        assert [f["code"] for f in data["risk_flags"]] == [f["code"] for f in expected["risk_flags"]]
+        assert [f["message"] for f in data["risk_flags"]] == [f["message"] for f in expected["risk_flags"]]
+        assert data["recommendations"] == expected["recommendations"]
+        assert data["metadata"]["source"] == "snapshot"
+        assert data["metadata"]["calculation_version"] == expected["metadata"]["calculation_version"]
+        assert entry.timestamp == CREATED
+
+    assert snapshot.get("SUP-004", "technology") is None
+    assert snapshot.get("SUP-" + "9" * 200, "general") is None
+    assert snapshot.stats()["hits"] == 4
+    assert snapshot.stats()["misses"] == 2
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_expires_and_refreshes(tmp_path: Path) -> None:
+    path = tmp_path / "risk.snap"
+    write_risk_snapshot(path, await _score(SupplierRiskChecker(), [("SUP-001", "technology")]), created_at=CREATED)
+
+    now = CREATED + timedelta(hours=40)
+    snapshot = RiskSnapshot(path, max_age=timedelta(hours=36), clock=lambda: now)
+    assert snapshot.get("SUP-001", "technology") is None
+    assert snapshot.expired == 1
+
+    write_risk_snapshot(path, await _score(SupplierRiskChecker(), [("SUP-002", "general")]), created_at=now)
+    snapshot.refresh()
+    assert snapshot.get("SUP-002", "general") is not None
+    assert snapshot.get("SUP-001", "technology") is None
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_missing_or_invalid_snapshot_is_empty_until_refreshed(tmp_path: Path) -> None:
+    path = tmp_path / "risk.snap"
+    snapshot = RiskSnapshot(path)
+    assert not snapshot.loaded
+    assert snapshot.get("SUP-001", "technology") is None
+    assert snapshot.stats()["created_at"] is None
+
+    path.write_bytes(b"x" * 64)
+    snapshot.refresh()
+    assert not snapshot.loaded
+
+    write_risk_snapshot(path, await _score(SupplierRiskChecker(), [("SUP-001", "technology")]), created_at=CREATED)
+    snapshot.refresh()
+    assert snapshot.get("SUP-001", "technology") is not None
+
+    # A truncated replacement leaves the mapped snapshot in place.
+    truncated = tmp_path / "truncated.snap"
+    truncated.write_bytes(path.read_bytes()[:-8])
+    truncated.replace(path)
+    snapshot.refresh()
+    assert snapshot.get("SUP-001", "technology") is not None
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_skill_serves_snapshot_and_refresh_goes_live(tmp_path: Path) -> None:
+    path = write_risk_snapshot(
+        tmp_path / "risk.snap",
+        await _score(SupplierRiskChecker(), [("SUP-001", "technology")]),
+        created_at=datetime.now(),
+    )
+    skill = SupplierRiskChecker(snapshot=RiskSnapshot(path))
+    fetches: list[str] = []
+
+    async def financial(supplier_id: str) -> dict:
+        fetches.append(supplier_id)
+        return {"revenue_12m": 25_000_000, "credit_rating": "AA", "audit_opinion": "clean"}
+
+    skill._fetch_financial_data = financial  # type: ignore[method-assign]
+
+    served = await skill.execute({"supplier_id": "SUP-001", "industry": "technology"})
+    assert served["metadata"]["source"] == "snapshot"
+    assert fetches == []
+
+    live = await skill.execute({"supplier_id": "SUP-001", "industry": "technology", "refresh_cache": True})
+    assert "source" not in live["metadata"]
+    assert fetches == ["SUP-001"]
+
+    # The live result is newer than the snapshot, so it wins from now on.
+    again = await skill.execute({"supplier_id": "SUP-001", "industry": "technology"})
+    assert again["risk_score"] == live["risk_score"]
+
+    miss = await skill.execute({"supplier_id": "SUP-002", "industry": "general"})
+    assert "source" not in miss["metadata"]
+    assert skill.cache_stats()["snapshot"]["records"] == 1
+
+    await skill.aclose()
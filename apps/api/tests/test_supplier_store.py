@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from procuator.data.supplier_store import (
+    DEMO_COMPLIANCE,
+    DEMO_MARKET,
+    DEMO_OPERATIONAL,
+    InMemorySupplierDataStore,
+    SQLiteSupplierDataStore,
+    write_sqlite_store,
+)
+from procuator.skills.supplier_risk_checker import SupplierRiskChecker
+
+
+def _write_demo(path: Path) -> Path:
+    return write_sqlite_store(path, compliance=DEMO_COMPLIANCE, operational=DEMO_OPERATIONAL, market=DEMO_MARKET)
+
+
+def test_sqlite_store_matches_in_memory_store(tmp_path: Path) -> None:
+    memory = InMemorySupplierDataStore()
+    store = SQLiteSupplierDataStore(_write_demo(tmp_path / "suppliers.db"))
+
+    for supplier_id in [*DEMO_COMPLIANCE, "SUP-404"]:
+        assert store.compliance(supplier_id) == memory.compliance(supplier_id)
+        assert store.operational(supplier_id) == memory.operational(supplier_id)
+    for industry in [*DEMO_MARKET, "unknown"]:
+        assert store.market(industry) == memory.market(industry)
+
+    store.close()
+
+
+def test_sqlite_store_refresh_picks_up_replaced_file(tmp_path: Path) -> None:
+    path = _write_demo(tmp_path / "suppliers.db")
+    store = SQLiteSupplierDataStore(path)
+    assert store.compliance("SUP-900") is None
+
+    write_sqlite_store(
+        path,
+        compliance={"SUP-900": {"violations": 0, "certifications": ["SOC2"], "last_inspection": "2026-01-01"}},
+        operational={},
+        market=DEMO_MARKET,
+    )
+    assert store.compliance("SUP-900") is None  # still reading the previous snapshot
+
+    store.refresh()
+    assert store.compliance("SUP-900") == {"violations": 0, "certifications": ["SOC2"], "last_inspection": "2026-01-01"}
+    assert store.compliance("SUP-001") is None
+    assert list(tmp_path.iterdir()) == [path]
+
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_risk_checker_scores_the_same_from_either_store(tmp_path: Path) -> None:
+    memory_skill = SupplierRiskChecker()
+    sqlite_store = SQLiteSupplierDataStore(_write_demo(tmp_path / "suppliers.db"))
+    sqlite_skill = SupplierRiskChecker(data_store=sqlite_store)
+
+    for supplier_id, industry in [("SUP-001", "technology"), ("SUP-004", "retail"), ("SUP-404", "space")]:
+        a = await memory_skill.execute({"supplier_id": supplier_id, "industry": industry})
+        b = await sqlite_skill.execute({"supplier_id": supplier_id, "industry": industry})
+        assert a["component_scores"] == b["component_scores"]
+
+    await memory_skill.aclose()
+    await sqlite_skill.aclose()
+    sqlite_store.close()